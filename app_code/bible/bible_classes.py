@@ -2,13 +2,15 @@ from __future__ import unicode_literals
 import codecs
 import json
 import os
+import re
 from datetime import datetime
 from json import JSONEncoder
 from general_tools.file_utils import load_json_object
-from general_tools.url_utils import get_url
 import bible_paragraphs
 import content
+import versification
 from app_code.util import app_utils
+from app_code.util.url_cache import get_cached_url
 
 
 class BibleMetaData(object):
@@ -21,8 +23,7 @@ class BibleMetaData(object):
         if file_name:
             if os.path.isfile(file_name):
                 self.__dict__ = load_json_object(file_name)
-                if 'versification' not in self.__dict__:
-                    self.versification = 'ufw'
+                self.set_default_versification()
             else:
                 raise IOError('The file {0} was not found.'.format(file_name))
         else:
@@ -37,49 +38,49 @@ class BibleMetaData(object):
             self.source_text = ''
             self.source_text_version = ''
             self.version = ''
-            self.versification = 'ufw'
+            self.versification = versification.Versification.resolve_scheme(self.lang, self.slug)
 
-
-class Bible(object):
-
-    # do not access this directly, use Bible.get_usfm_data
-    usfm_data = None
+    def set_default_versification(self):
+        if 'versification' not in self.__dict__:
+            self.versification = versification.Versification.resolve_scheme(self.__dict__.get('lang'),
+                                                                             self.__dict__.get('slug'))
 
     @staticmethod
-    def get_versification(versification):
+    def from_dict(meta):
         """
-        Get the versification file and parse it into book, chapter and verse information
-        :return: list<Book>
+        :param dict meta: The deserialized meta.json, like from RepoArchive.load_json
+        :return: BibleMetaData
         """
+        metadata_obj = BibleMetaData()
+        metadata_obj.__dict__ = meta
+        metadata_obj.set_default_versification()
+        return metadata_obj
 
-        # TODO: change these to point to the API when it is available
-        api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
-        vrs_file = api_root + '/versification/{0}/{0}.vrs'
-        book_file = api_root + '/versification/{0}/books.json'
 
-        # get the list of books
-        books = json.loads(get_url(book_file.format(versification)))
+class Bible(object):
 
-        # get the versification file
-        raw = get_url(vrs_file.format(versification))
-        lines = [l for l in raw.replace('\r', '').split('\n') if l and l[0:1] != '#']
+    # TODO: change these to point to the API when it is available
+    api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
+    chunk_url = api_root + '/versification/{0}/chunks/{1}.json'
+    usfm_data_file = api_root + '/versification/ufw/books-en.json'
 
-        scheme = []
-        for key, value in iter(books.items()):
+    # do not access this directly, use Bible.get_usfm_data
+    usfm_data = None
 
-            book = content.Book(key, value[0], int(value[1]))
+    # do not access this directly, use Bible.get_chunks
+    chunks = {}  # type: dict<tuple, list>
 
-            # find the key in the lines
-            for line in lines:
-                if line[0:3] == key:
-                    chapters = line[4:].split()
-                    for chapter in chapters:
-                        parts = chapter.split(':')
-                        book.chapters.append(content.Chapter(int(parts[0]), int(parts[1])))
-                    scheme.append(book)
-                    break
+    # a verse marker followed by a space, the way the paragraph verses are marked in the text
+    paragraph_verse_re = re.compile(r'\\v ([^ \\]+) ')
 
-        return scheme
+    @staticmethod
+    def get_versification(scheme):
+        """
+        Get the versification file and parse it into book, chapter and verse information
+        :param str|unicode scheme: Like ufw
+        :return: list<Book>
+        """
+        return versification.Versification.get(scheme).create_books()
 
     @staticmethod
     def get_header_text():
@@ -88,31 +89,36 @@ class Bible(object):
             return in_file.read()
 
     @staticmethod
-    def chunk_book(versification, book):
+    def get_chunks(versification, book_id):
         """
-        :param versification:
-        :type book: Book
+        Returns the chunks of a book, loading the chunk file only the first time
+        :param str|unicode versification:
+        :param str|unicode book_id:
+        :return: list<tuple> (chapter, first verse) of each chunk
         """
+        key = (versification, book_id)
+        if key not in Bible.chunks:
+            chunk_str = get_cached_url(Bible.chunk_url.format(versification, book_id.lower()))
+            if not chunk_str:
+                raise Exception('Could not load chunks for ' + book_id)
 
-        # TODO: change these to point to the API when it is available
-        api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
-        chunk_url = api_root + '/versification/{0}/chunks/{1}.json'
+            Bible.chunks[key] = [(chapter['chapter'], first_verse) for chapter in json.loads(chunk_str)
+                                 for first_verse in chapter['first_verses']]
 
-        chunk_str = get_url(chunk_url.format(versification, book.book_id.lower()))
-        if not chunk_str:
-            raise Exception('Could not load chunks for ' + book.book_id)
+        return Bible.chunks[key]
 
-        # chunk it
-        for chapter in json.loads(chunk_str):
-            for first_verse in chapter['first_verses']:
-                book.chunks.append(content.Chunk(chapter['chapter'], first_verse))
+    @staticmethod
+    def chunk_book(versification, book):
+        """
+        :param versification:
+        :type book: Book
+        """
+        for chapter, first_verse in Bible.get_chunks(versification, book.book_id):
+            book.add_chunk(content.Chunk(chapter, first_verse))
 
     @staticmethod
     def insert_paragraph_markers(book):
 
-        paragraph_list = bible_paragraphs.bible_paragraphs
-
-        chapter_data = next(p for p in paragraph_list if p['usfm_id'] == book.book_id)['chapters']
         for chapter in book.chapters:
 
             # check if there are already paragraph markers
@@ -120,19 +126,19 @@ class Bible(object):
                 continue
 
             # get the verses that begin paragraphs
-            paragraph_verses = next(c['paragraph_before'] for c in chapter_data if int(c['number']) == chapter.number)
+            paragraph_verses = bible_paragraphs.get_paragraph_verses(book.book_id, chapter.number)
+            if not paragraph_verses:
+                continue
 
-            for verse in paragraph_verses:
-                chapter.usfm = chapter.usfm.replace('\\v {0} '.format(verse), '\n\\p\n\\v {0} '.format(verse))
+            # one pass through the chapter, a \p goes before every marker for one of the paragraph verses
+            chapter.usfm = Bible.paragraph_verse_re.sub(
+                lambda m: '\n\\p\n' + m.group(0) if m.group(1) in paragraph_verses else m.group(0), chapter.usfm)
 
     @staticmethod
     def get_usfm_data():
 
         if not Bible.usfm_data:
-            # TODO: change these to point to the API when it is available
-            api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
-            usfm_data_file = api_root + '/versification/ufw/books-en.json'
-            Bible.usfm_data = load_json_object(usfm_data_file)
+            Bible.usfm_data = json.loads(get_cached_url(Bible.usfm_data_file))
 
         return Bible.usfm_data
 
@@ -1,5163 +1,148 @@
-bible_paragraphs = [
-    {
-        "usfm_num": "01",
-        "usfm_id": "GEN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "6", "9", "14", "20", "24"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "4", "18"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "9", "22"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "9", "16"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6", "9", "12", "15", "18", "21", "25", "28", "32"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "5", "9", "13"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "6", "13"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "6", "13", "20"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "8", "12", "17", "18", "20", "28"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "2", "6", "13", "15", "21", "32"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "10", "12", "14", "16", "18", "20", "22", "24", "26", "27", "31"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "10"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "14"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "8", "13", "17"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "7", "15"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "9", "15", "22"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "9", "16", "22"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "12", "23", "27", "29", "30"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "8", "22"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "9", "20"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "17"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "10", "28", "50", "61", "62"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "12", "19", "24", "27"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "12", "18", "23", "26", "34"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "5", "18", "30", "41", "46"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "6", "10", "18"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "13", "21", "31"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "9", "14", "25", "37"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "17", "22", "33", "36", "43"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "3", "13", "22"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "18"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "18"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "9", "16", "28"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "9", "15", "20", "31", "40"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1", "12", "24"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": ["1", "19"]
-            },
-            {
-                "number": "40",
-                "paragraph_before": ["1", "9", "16"]
-            },
-            {
-                "number": "41",
-                "paragraph_before": ["1", "9", "14", "25", "37", "46"]
-            },
-            {
-                "number": "42",
-                "paragraph_before": ["1", "18", "26", "35"]
-            },
-            {
-                "number": "43",
-                "paragraph_before": ["1", "16", "26"]
-            },
-            {
-                "number": "44",
-                "paragraph_before": ["1", "14", "18"]
-            },
-            {
-                "number": "45",
-                "paragraph_before": ["1", "16", "21"]
-            },
-            {
-                "number": "46",
-                "paragraph_before": ["1", "8", "28"]
-            },
-            {
-                "number": "47",
-                "paragraph_before": ["1", "13", "20", "27"]
-            },
-            {
-                "number": "48",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "49",
-                "paragraph_before": ["1", "28"]
-            },
-            {
-                "number": "50",
-                "paragraph_before": ["1", "4", "15", "22"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "02",
-        "usfm_id": "EXO",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "8", "15"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "11", "16", "23"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "10", "27"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "10", "15", "22"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "2", "10", "14", "28"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "8", "14", "20"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "8", "16", "20", "25"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "8", "22", "27"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "21"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "4", "9"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "15", "21", "29", "37", "43"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "3", "11", "17"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "10", "21", "26"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "19", "22"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "4", "13", "31"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "7", "16"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "4", "7", "8", "12", "13", "14", "15", "16", "17", "18", "22"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "2", "7", "12", "15", "16", "17", "18", "20", "22", "26", "28", "33", "35"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "5", "6", "7", "10", "14", "16", "18", "19", "20", "25", "28"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "4", "6", "10", "14", "18", "20"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "9", "12"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "10", "23", "31"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "7", "15", "26", "31", "36"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "9", "20"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "6", "15", "31", "36", "40"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "10", "15", "19", "26", "31", "35", "38"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "11", "17", "22", "34"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "12", "18"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "7", "15", "19", "21", "25", "30"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "7", "12", "17"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "10", "18", "21", "25", "29"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "4", "10", "20", "30"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "2", "8", "14", "20", "31", "35"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": ["1", "10", "17", "25"]
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1", "8", "21", "24"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": ["1", "2", "6", "8", "22", "27", "30", "32"]
-            },
-            {
-                "number": "40",
-                "paragraph_before": ["1", "17", "34"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "03",
-        "usfm_id": "LEV",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "10", "14"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "4", "11", "14"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "6", "12"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "13", "22", "27", "32"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "7", "11", "14", "17"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "8", "14", "19", "24"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "11", "15", "19", "22", "28", "35", "37"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "6", "10", "14", "18", "22", "30", "31"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "8", "12", "15", "18", "22"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "8", "12", "16"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "9", "13", "20", "24", "29", "39", "41", "46"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "9", "18", "24", "29", "38", "40", "45", "47", "53", "56", "59"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "10", "21", "33", "43", "48", "54"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "13", "16", "19", "25", "31", "32"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "6", "11", "15", "20", "23", "29"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "8", "10", "14"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "6", "19", "24"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "5", "9", "11", "12", "13", "14", "15", "16", "17", "18", "19", "20", "21",
-                                     "23", "26", "27", "28", "29", "31", "32", "33", "35"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "6", "8", "9", "10", "11", "12", "13", "14", "15", "16", "17", "18", "19",
-                                     "20", "21", "22", "23", "24", "26", "27"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "5", "8", "9", "10", "13", "16"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "4", "7", "9", "10", "12", "14", "15", "17", "21", "24", "26", "28", "31",
-                                     "32"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "4", "9", "15", "22", "23", "26", "33", "37", "39"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "5", "10", "13"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "8", "13", "14", "18", "23", "29", "35", "39", "47"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "3", "14", "21", "23", "27", "34", "40", "46"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "9", "14", "16", "26", "28", "30", "34"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "04",
-        "usfm_id": "NUM",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "20", "22", "24", "26", "28", "30", "32", "34", "36", "38", "40", "42", "44",
-                                     "47"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "10", "17", "18", "25", "32"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "5", "11", "14", "21", "27", "33", "38", "40", "44"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "17", "21", "29", "34", "38", "42", "46"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "5", "11", "16", "23", "29"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "5", "6", "9", "13", "21", "22", "24", "25", "26", "27"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "12", "18", "24", "30", "36", "42", "48", "54", "60", "66", "72", "78", "84",
-                                     "89"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "5", "14", "20", "23"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "9", "15"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "11", "21", "25", "29", "33", "35"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "4", "16", "24", "26", "31"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "4", "9", "16"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "17", "21", "25", "30"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "4", "11", "13", "20", "26", "36-", "39"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "11", "17", "22", "27", "32", "37"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "4", "12", "15", "20", "25", "31", "36", "39-", "41"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "8", "12"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "8", "21", "25"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "11", "14", "20"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "2", "10", "14", "22"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "4", "10", "16", "17", "21", "31", "33"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["2", "7", "15", "21", "31", "36", "41"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["13"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["10"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "6", "10", "14", "16"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "5", "12", "15", "19", "23", "26", "28", "35", "38", "42", "44", "48", "51",
-                                     "52", "57", "63"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "6", "12", "15"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "9", "11", "16", "26"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "7", "12", "23", "32", "35", "39"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "6", "9", "13"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "13", "21", "25", "32", "42", "48"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "6", "16", "20", "28", "33"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "5", "38", "40", "41", "50"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "6", "7", "10", "13", "16"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "9", "16", "22", "29"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "5", "10", "13"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "05",
-        "usfm_id": "DEU",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "9", "19", "26", "34", "41"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "16", "26"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "12", "18", "23"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "9", "15", "25", "32", "41", "44"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6", "7", "8", "11", "12", "16", "17", "18", "19", "20", "21", "22", "28"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "4", "10", "16", "20"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "6", "12", "17"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "6", "22", "25"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "8", "13", "18", "26"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "15", "20", "29", "32"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "6", "12"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "3", "9", "11", "21", "22", "28"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "7", "12", "19"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "9", "13", "18", "21"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "2", "8", "14", "18"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "6", "9", "15", "20"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "4", "11", "14", "15"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "10", "19"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "10", "15", "18", "22"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "5", "6", "8", "9", "12", "13", "22", "23", "25", "28", "30"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "2", "3", "7", "9", "15", "17", "19", "21", "24"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "5", "6", "7", "8", "10", "14", "16", "17", "19"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "4", "5", "11", "13", "17"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "12", "16"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "9", "11", "15", "16", "17", "18", "19", "20", "21", "22", "23", "24", "25",
-                                     "26"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "7", "15", "20", "25", "36", "47", "58"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "2", "10", "14", "16", "22"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "11", "15"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "9", "14", "24", "30"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["44", "48"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "7", "8", "12", "13", "18", "20", "22", "23", "24"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "9"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "06",
-        "usfm_id": "JOS",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "10", "12"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8", "15", "22"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "14"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "8", "15", "19"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "2", "10", "13"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "8", "12", "15", "22"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "2", "6", "10", "16", "22"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "3", "10", "18", "24", "30"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "3", "16", "22"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "6", "12", "14", "15", "16", "22", "28", "29", "31", "33", "34", "36", "38",
-                                     "40"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "6", "10", "16", "21"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "7"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "8", "15", "24", "29", "32"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "6", "13"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "13", "20", "21", "33", "37", "42", "45", "47", "48", "52", "55", "58", "60",
-                                     "61", "63"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "7", "14"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "8", "11", "21"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "10", "17", "24", "32", "40", "49", "51"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "7"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "4", "5", "6", "7", "8", "13", "20", "27", "34", "41", "43"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "7", "10", "13", "21", "30"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "14"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "14", "16", "19", "29", "32"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "07",
-        "usfm_id": "JDG",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "8", "11", "16", "22", "27", "29", "30", "31", "33", "34"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "6", "11", "16"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "12", "15", "24", "26", "31"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4", "11", "12", "17", "23"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "7", "11", "19", "25", "28", "33", "36"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "2", "4", "9", "15", "19", "24"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "4", "10", "13", "18", "22", "29", "33"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "7", "22", "26", "30", "34", "41", "46", "50"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "3", "6", "10", "17"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "4", "12", "29", "34"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "7", "8", "13"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "2", "8", "15", "21"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "5", "10", "15", "19"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "9", "14", "17"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "4", "10", "13", "15", "18", "23", "28"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "7"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "7", "11", "14", "21", "27"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "10", "16", "22", "27"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "8", "12", "17", "19", "24", "29", "36"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "8", "13", "16", "25"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "08",
-        "usfm_id": "RUT",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "15", "19"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8", "14", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "6", "14"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "13", "18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "09",
-        "usfm_id": "1SA",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "9", "12", "19", "21"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "11", "12", "18", "22", "27"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "10", "15", "19"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["5", "12", "19"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "10", "17", "19"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "12", "15"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "4", "10", "19"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "5", "11", "15", "22", "25"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "9", "14", "17", "25"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "6", "12", "14"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "6", "19"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "5", "8", "19"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "6", "16", "24", "31", "36", "43", "47", "49", "52"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "4", "10", "17", "24", "32", "34"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "6", "14"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "12", "17", "28", "31", "41", "50", "55"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "6", "8", "10", "17", "22", "30"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "8", "18"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "12", "17", "24", "30", "35"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "7", "10", "12"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "3", "6", "11", "20"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "7", "15", "19", "24"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "8", "16"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "2", "9", "14", "18", "23", "32", "36", "39", "43"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "6", "13", "17", "21"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "5", "8"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "3", "8", "15", "20"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "7", "11", "16", "21", "26"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "7"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "10",
-        "usfm_id": "2SA",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "11", "17"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8", "12", "18", "24", "30"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "2", "6", "12", "17", "22", "27", "31"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4", "5"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6", "11", "13", "17", "22"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "6", "12", "16", "20"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "18"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "2", "3", "9", "13", "15"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "6", "9", "15"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "2", "6", "14", "22", "26"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "7", "24", "26"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "7", "15", "20", "23", "30", "34", "37"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "4", "8", "12", "18", "21", "25", "28"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "7", "13", "19", "24", "30"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5", "9", "15", "20"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "5", "15", "21", "24", "27"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "6", "9", "16", "19", "24", "28", "31"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "11", "16", "21", "24", "31", "40"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "3", "4", "14", "23"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "7", "10", "12", "15", "18"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "8", "9", "11", "13", "18", "20", "24"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "10", "15", "18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "11",
-        "usfm_id": "1KI",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5", "11", "15", "22", "28", "32", "38", "41", "49"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "10", "13", "19", "26", "28", "36", "39"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "4", "10", "16", "23"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "20", "29"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "7", "13"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "11", "14", "23", "29", "37"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "9", "13", "23", "27", "38", "40", "48", "51"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "12", "22", "27", "31", "33", "35", "37", "41", "44", "46", "54", "62"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "15", "23", "24", "25", "26"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "11", "13", "14", "23", "26"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "9", "14", "23", "26", "41"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "6", "12", "16", "21", "25"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "11", "20", "26", "33"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "6", "17", "19", "21", "25", "29"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "7", "9", "16", "23", "25", "31", "33"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5", "8", "15", "21", "29"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "8", "17"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "7", "16", "20", "25", "30", "41"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "9", "15", "19"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "7", "13", "16", "22", "26", "31", "35"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "5", "11", "17", "27"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "5", "13", "24", "29", "37", "41", "45", "51"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "12",
-        "usfm_id": "2KI",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5", "9", "17"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "15", "19", "23"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "4", "13", "21"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "8", "17", "32", "38", "42"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "8", "15", "20"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "8", "14", "20", "24", "32"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["3", "9", "16"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "7", "16", "20", "25"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "11", "14", "17", "21", "27", "29", "30"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "12", "15", "18", "25", "29", "32"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "4", "9", "13", "17", "21"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["4", "9", "17", "19"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "10", "14", "20", "22"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "8", "11", "15", "17", "23", "28"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "8", "13", "23", "27", "29", "32"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5", "7", "10", "17"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "7", "19", "24", "27", "34"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "9", "13", "19", "26", "36"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "14", "20", "29", "35"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "8", "12", "16"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "10", "16", "19"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "3", "8", "14"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "4", "15", "21", "24", "26", "28", "31", "36"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "8", "10", "18"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["8", "13", "18", "22", "27"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "13",
-        "usfm_id": "1CH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5", "8", "17", "24", "28", "32", "34", "35", "38", "43"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "3", "5", "9", "18", "21", "25", "42", "50"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "10"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "24"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "11", "18", "23", "25"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "16", "31", "33", "48", "54", "57", "61", "66", "71", "77"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "6", "13", "14", "20", "28", "30"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "29"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "10", "14", "17", "28", "33", "35"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "7", "13"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "4", "10", "15", "20", "22", "26"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "8", "16", "19", "23", "38"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "3", "8", "13"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "16", "25", "29"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "4", "7", "37"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "16"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "3", "5", "9", "12", "14"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "6", "10", "16"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "4"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "9", "18", "28"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "2", "6", "17"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "7", "24"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "7", "20"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "12", "20", "29"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "16", "25", "32"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "9", "11", "20"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "6", "10", "20", "26"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "14",
-        "usfm_id": "2CH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "7", "14"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "11", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "8", "10", "15"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "19"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "2", "11"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "4", "12", "18", "22", "24", "26", "28", "32", "34", "36", "40"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "4", "8", "11", "19"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "3", "7", "11", "12", "14", "16", "17"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "9", "13", "22", "29"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "6", "12", "16"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "5", "13", "18"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "9", "13", "15"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "8", "16"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "7", "11"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "7", "10"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "4", "12", "23", "28"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "4", "8"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "5", "14", "20", "24", "31", "35"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "8", "11", "16", "18"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "7", "10"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "8", "12", "16"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "4", "8", "15", "20", "23", "25"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "5", "14", "17", "20", "25"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "6", "16"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "5", "16", "22"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "12", "20", "25", "29", "31"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "10", "13", "23"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "2", "11", "20"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "9", "20", "24", "27", "32"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "10", "14", "18", "21"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "8", "14", "22", "29"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "7", "10", "16", "20"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "5", "9", "11", "17", "22"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "15",
-        "usfm_id": "EZR",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "36", "40", "43", "55", "59", "64", "68", "70"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "11", "17", "23"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "6", "16", "19"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "11", "27"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "15", "21", "24", "31", "35"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "5", "9", "16", "18", "23", "24", "25"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "16",
-        "usfm_id": "NEH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "9", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "6", "13", "14", "15", "28"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "15", "21"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6", "14", "19"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "8", "15"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "5", "39", "43", "46", "57", "61", "66", "70", "73"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "9", "13"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "5", "9", "16", "26", "32"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "28", "32"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "3", "7", "10", "15", "19", "22", "25"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "8", "12", "22", "27", "31", "38", "44"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "4", "10", "15", "19", "23", "28", "29", "30"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "17",
-        "usfm_id": "EST",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "9", "13"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "5", "8", "12", "16", "19"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "12"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4", "9", "13"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "5", "9"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "10"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "3", "9", "15"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "11", "17", "20", "26", "29"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "18",
-        "usfm_id": "JOB",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "6", "13", "20"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "7", "11"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": []
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": []
-            },
-            {
-                "number": "14",
-                "paragraph_before": []
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": []
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": []
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": []
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": []
-            },
-            {
-                "number": "31",
-                "paragraph_before": []
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": []
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": []
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": []
-            },
-            {
-                "number": "40",
-                "paragraph_before": ["1", "3", "6"]
-            },
-            {
-                "number": "41",
-                "paragraph_before": []
-            },
-            {
-                "number": "42",
-                "paragraph_before": ["1", "7", "10"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "19",
-        "usfm_id": "PSA",
-        "chapters": [
-            {
-                "number": "001",
-                "paragraph_before": []
-            },
-            {
-                "number": "002",
-                "paragraph_before": []
-            },
-            {
-                "number": "003",
-                "paragraph_before": []
-            },
-            {
-                "number": "004",
-                "paragraph_before": []
-            },
-            {
-                "number": "005",
-                "paragraph_before": []
-            },
-            {
-                "number": "006",
-                "paragraph_before": []
-            },
-            {
-                "number": "007",
-                "paragraph_before": []
-            },
-            {
-                "number": "008",
-                "paragraph_before": []
-            },
-            {
-                "number": "009",
-                "paragraph_before": []
-            },
-            {
-                "number": "010",
-                "paragraph_before": []
-            },
-            {
-                "number": "011",
-                "paragraph_before": []
-            },
-            {
-                "number": "012",
-                "paragraph_before": []
-            },
-            {
-                "number": "013",
-                "paragraph_before": []
-            },
-            {
-                "number": "014",
-                "paragraph_before": []
-            },
-            {
-                "number": "015",
-                "paragraph_before": []
-            },
-            {
-                "number": "016",
-                "paragraph_before": []
-            },
-            {
-                "number": "017",
-                "paragraph_before": []
-            },
-            {
-                "number": "018",
-                "paragraph_before": []
-            },
-            {
-                "number": "019",
-                "paragraph_before": []
-            },
-            {
-                "number": "020",
-                "paragraph_before": []
-            },
-            {
-                "number": "021",
-                "paragraph_before": []
-            },
-            {
-                "number": "022",
-                "paragraph_before": []
-            },
-            {
-                "number": "023",
-                "paragraph_before": []
-            },
-            {
-                "number": "024",
-                "paragraph_before": []
-            },
-            {
-                "number": "025",
-                "paragraph_before": []
-            },
-            {
-                "number": "026",
-                "paragraph_before": []
-            },
-            {
-                "number": "027",
-                "paragraph_before": []
-            },
-            {
-                "number": "028",
-                "paragraph_before": []
-            },
-            {
-                "number": "029",
-                "paragraph_before": []
-            },
-            {
-                "number": "030",
-                "paragraph_before": []
-            },
-            {
-                "number": "031",
-                "paragraph_before": []
-            },
-            {
-                "number": "032",
-                "paragraph_before": []
-            },
-            {
-                "number": "033",
-                "paragraph_before": []
-            },
-            {
-                "number": "034",
-                "paragraph_before": []
-            },
-            {
-                "number": "035",
-                "paragraph_before": []
-            },
-            {
-                "number": "036",
-                "paragraph_before": []
-            },
-            {
-                "number": "037",
-                "paragraph_before": []
-            },
-            {
-                "number": "038",
-                "paragraph_before": []
-            },
-            {
-                "number": "039",
-                "paragraph_before": []
-            },
-            {
-                "number": "040",
-                "paragraph_before": []
-            },
-            {
-                "number": "041",
-                "paragraph_before": []
-            },
-            {
-                "number": "042",
-                "paragraph_before": []
-            },
-            {
-                "number": "043",
-                "paragraph_before": []
-            },
-            {
-                "number": "044",
-                "paragraph_before": []
-            },
-            {
-                "number": "045",
-                "paragraph_before": []
-            },
-            {
-                "number": "046",
-                "paragraph_before": []
-            },
-            {
-                "number": "047",
-                "paragraph_before": []
-            },
-            {
-                "number": "048",
-                "paragraph_before": []
-            },
-            {
-                "number": "049",
-                "paragraph_before": []
-            },
-            {
-                "number": "050",
-                "paragraph_before": []
-            },
-            {
-                "number": "051",
-                "paragraph_before": []
-            },
-            {
-                "number": "052",
-                "paragraph_before": []
-            },
-            {
-                "number": "053",
-                "paragraph_before": []
-            },
-            {
-                "number": "054",
-                "paragraph_before": []
-            },
-            {
-                "number": "055",
-                "paragraph_before": []
-            },
-            {
-                "number": "056",
-                "paragraph_before": []
-            },
-            {
-                "number": "057",
-                "paragraph_before": []
-            },
-            {
-                "number": "058",
-                "paragraph_before": []
-            },
-            {
-                "number": "059",
-                "paragraph_before": []
-            },
-            {
-                "number": "060",
-                "paragraph_before": []
-            },
-            {
-                "number": "061",
-                "paragraph_before": []
-            },
-            {
-                "number": "062",
-                "paragraph_before": []
-            },
-            {
-                "number": "063",
-                "paragraph_before": []
-            },
-            {
-                "number": "064",
-                "paragraph_before": []
-            },
-            {
-                "number": "065",
-                "paragraph_before": []
-            },
-            {
-                "number": "066",
-                "paragraph_before": []
-            },
-            {
-                "number": "067",
-                "paragraph_before": []
-            },
-            {
-                "number": "068",
-                "paragraph_before": []
-            },
-            {
-                "number": "069",
-                "paragraph_before": []
-            },
-            {
-                "number": "070",
-                "paragraph_before": []
-            },
-            {
-                "number": "071",
-                "paragraph_before": []
-            },
-            {
-                "number": "072",
-                "paragraph_before": []
-            },
-            {
-                "number": "073",
-                "paragraph_before": []
-            },
-            {
-                "number": "074",
-                "paragraph_before": []
-            },
-            {
-                "number": "075",
-                "paragraph_before": []
-            },
-            {
-                "number": "076",
-                "paragraph_before": []
-            },
-            {
-                "number": "077",
-                "paragraph_before": []
-            },
-            {
-                "number": "078",
-                "paragraph_before": []
-            },
-            {
-                "number": "079",
-                "paragraph_before": []
-            },
-            {
-                "number": "080",
-                "paragraph_before": []
-            },
-            {
-                "number": "081",
-                "paragraph_before": []
-            },
-            {
-                "number": "082",
-                "paragraph_before": []
-            },
-            {
-                "number": "083",
-                "paragraph_before": []
-            },
-            {
-                "number": "084",
-                "paragraph_before": []
-            },
-            {
-                "number": "085",
-                "paragraph_before": []
-            },
-            {
-                "number": "086",
-                "paragraph_before": []
-            },
-            {
-                "number": "087",
-                "paragraph_before": []
-            },
-            {
-                "number": "088",
-                "paragraph_before": []
-            },
-            {
-                "number": "089",
-                "paragraph_before": []
-            },
-            {
-                "number": "090",
-                "paragraph_before": []
-            },
-            {
-                "number": "091",
-                "paragraph_before": []
-            },
-            {
-                "number": "092",
-                "paragraph_before": []
-            },
-            {
-                "number": "093",
-                "paragraph_before": []
-            },
-            {
-                "number": "094",
-                "paragraph_before": []
-            },
-            {
-                "number": "095",
-                "paragraph_before": []
-            },
-            {
-                "number": "096",
-                "paragraph_before": []
-            },
-            {
-                "number": "097",
-                "paragraph_before": []
-            },
-            {
-                "number": "098",
-                "paragraph_before": []
-            },
-            {
-                "number": "099",
-                "paragraph_before": []
-            },
-            {
-                "number": "100",
-                "paragraph_before": []
-            },
-            {
-                "number": "101",
-                "paragraph_before": []
-            },
-            {
-                "number": "102",
-                "paragraph_before": []
-            },
-            {
-                "number": "103",
-                "paragraph_before": []
-            },
-            {
-                "number": "104",
-                "paragraph_before": []
-            },
-            {
-                "number": "105",
-                "paragraph_before": []
-            },
-            {
-                "number": "106",
-                "paragraph_before": []
-            },
-            {
-                "number": "107",
-                "paragraph_before": []
-            },
-            {
-                "number": "108",
-                "paragraph_before": []
-            },
-            {
-                "number": "109",
-                "paragraph_before": []
-            },
-            {
-                "number": "110",
-                "paragraph_before": []
-            },
-            {
-                "number": "111",
-                "paragraph_before": []
-            },
-            {
-                "number": "112",
-                "paragraph_before": []
-            },
-            {
-                "number": "113",
-                "paragraph_before": []
-            },
-            {
-                "number": "114",
-                "paragraph_before": []
-            },
-            {
-                "number": "115",
-                "paragraph_before": []
-            },
-            {
-                "number": "116",
-                "paragraph_before": []
-            },
-            {
-                "number": "117",
-                "paragraph_before": []
-            },
-            {
-                "number": "118",
-                "paragraph_before": []
-            },
-            {
-                "number": "119",
-                "paragraph_before": []
-            },
-            {
-                "number": "120",
-                "paragraph_before": []
-            },
-            {
-                "number": "121",
-                "paragraph_before": []
-            },
-            {
-                "number": "122",
-                "paragraph_before": []
-            },
-            {
-                "number": "123",
-                "paragraph_before": []
-            },
-            {
-                "number": "124",
-                "paragraph_before": []
-            },
-            {
-                "number": "125",
-                "paragraph_before": []
-            },
-            {
-                "number": "126",
-                "paragraph_before": []
-            },
-            {
-                "number": "127",
-                "paragraph_before": []
-            },
-            {
-                "number": "128",
-                "paragraph_before": []
-            },
-            {
-                "number": "129",
-                "paragraph_before": []
-            },
-            {
-                "number": "130",
-                "paragraph_before": []
-            },
-            {
-                "number": "131",
-                "paragraph_before": []
-            },
-            {
-                "number": "132",
-                "paragraph_before": []
-            },
-            {
-                "number": "133",
-                "paragraph_before": []
-            },
-            {
-                "number": "134",
-                "paragraph_before": []
-            },
-            {
-                "number": "135",
-                "paragraph_before": []
-            },
-            {
-                "number": "136",
-                "paragraph_before": []
-            },
-            {
-                "number": "137",
-                "paragraph_before": []
-            },
-            {
-                "number": "138",
-                "paragraph_before": []
-            },
-            {
-                "number": "139",
-                "paragraph_before": []
-            },
-            {
-                "number": "140",
-                "paragraph_before": []
-            },
-            {
-                "number": "141",
-                "paragraph_before": []
-            },
-            {
-                "number": "142",
-                "paragraph_before": []
-            },
-            {
-                "number": "143",
-                "paragraph_before": []
-            },
-            {
-                "number": "144",
-                "paragraph_before": []
-            },
-            {
-                "number": "145",
-                "paragraph_before": []
-            },
-            {
-                "number": "146",
-                "paragraph_before": []
-            },
-            {
-                "number": "147",
-                "paragraph_before": []
-            },
-            {
-                "number": "148",
-                "paragraph_before": []
-            },
-            {
-                "number": "149",
-                "paragraph_before": []
-            },
-            {
-                "number": "150",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "20",
-        "usfm_id": "PRO",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": []
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            },
-            {
-                "number": "08",
-                "paragraph_before": []
-            },
-            {
-                "number": "09",
-                "paragraph_before": []
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": []
-            },
-            {
-                "number": "12",
-                "paragraph_before": []
-            },
-            {
-                "number": "13",
-                "paragraph_before": []
-            },
-            {
-                "number": "14",
-                "paragraph_before": []
-            },
-            {
-                "number": "15",
-                "paragraph_before": []
-            },
-            {
-                "number": "16",
-                "paragraph_before": []
-            },
-            {
-                "number": "17",
-                "paragraph_before": []
-            },
-            {
-                "number": "18",
-                "paragraph_before": []
-            },
-            {
-                "number": "19",
-                "paragraph_before": []
-            },
-            {
-                "number": "20",
-                "paragraph_before": []
-            },
-            {
-                "number": "21",
-                "paragraph_before": []
-            },
-            {
-                "number": "22",
-                "paragraph_before": []
-            },
-            {
-                "number": "23",
-                "paragraph_before": []
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["23"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": []
-            },
-            {
-                "number": "27",
-                "paragraph_before": []
-            },
-            {
-                "number": "28",
-                "paragraph_before": []
-            },
-            {
-                "number": "29",
-                "paragraph_before": []
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "21",
-        "usfm_id": "ECC",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            },
-            {
-                "number": "08",
-                "paragraph_before": []
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": []
-            },
-            {
-                "number": "11",
-                "paragraph_before": []
-            },
-            {
-                "number": "12",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "22",
-        "usfm_id": "SNG",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": []
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            },
-            {
-                "number": "08",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "23",
-        "usfm_id": "ISA",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "2"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "3", "10", "20"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "5", "19"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": []
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["12", "15", "20", "24"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "3", "28"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["13"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": []
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "19", "23"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": []
-            },
-            {
-                "number": "25",
-                "paragraph_before": []
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": []
-            },
-            {
-                "number": "28",
-                "paragraph_before": []
-            },
-            {
-                "number": "29",
-                "paragraph_before": []
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["6"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["6"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": []
-            },
-            {
-                "number": "33",
-                "paragraph_before": []
-            },
-            {
-                "number": "34",
-                "paragraph_before": []
-            },
-            {
-                "number": "35",
-                "paragraph_before": []
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "4", "11", "13", "21"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": ["1", "5", "8", "14", "21"]
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "40",
-                "paragraph_before": []
-            },
-            {
-                "number": "41",
-                "paragraph_before": []
-            },
-            {
-                "number": "42",
-                "paragraph_before": []
-            },
-            {
-                "number": "43",
-                "paragraph_before": []
-            },
-            {
-                "number": "44",
-                "paragraph_before": []
-            },
-            {
-                "number": "45",
-                "paragraph_before": []
-            },
-            {
-                "number": "46",
-                "paragraph_before": []
-            },
-            {
-                "number": "47",
-                "paragraph_before": []
-            },
-            {
-                "number": "48",
-                "paragraph_before": []
-            },
-            {
-                "number": "49",
-                "paragraph_before": []
-            },
-            {
-                "number": "50",
-                "paragraph_before": []
-            },
-            {
-                "number": "51",
-                "paragraph_before": []
-            },
-            {
-                "number": "52",
-                "paragraph_before": []
-            },
-            {
-                "number": "53",
-                "paragraph_before": []
-            },
-            {
-                "number": "54",
-                "paragraph_before": []
-            },
-            {
-                "number": "55",
-                "paragraph_before": []
-            },
-            {
-                "number": "56",
-                "paragraph_before": []
-            },
-            {
-                "number": "57",
-                "paragraph_before": []
-            },
-            {
-                "number": "58",
-                "paragraph_before": []
-            },
-            {
-                "number": "59",
-                "paragraph_before": []
-            },
-            {
-                "number": "60",
-                "paragraph_before": []
-            },
-            {
-                "number": "61",
-                "paragraph_before": []
-            },
-            {
-                "number": "62",
-                "paragraph_before": []
-            },
-            {
-                "number": "63",
-                "paragraph_before": []
-            },
-            {
-                "number": "64",
-                "paragraph_before": []
-            },
-            {
-                "number": "65",
-                "paragraph_before": ["17"]
-            },
-            {
-                "number": "66",
-                "paragraph_before": ["18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "24",
-        "usfm_id": "JER",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "11", "13"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["6", "11", "18"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["4", "11", "19", "23"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "8", "12", "16", "21", "27"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "4"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["13", "25"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": []
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "6", "9", "14", "18"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["14"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "8", "12"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5", "10", "14", "16"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["19", "24"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "5", "9", "18"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "6", "10", "14"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "3", "8", "11"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "11", "24"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "7", "25", "33"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "4", "8"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "12", "15", "27", "30"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "7", "10", "16", "20"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "12", "16"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "5", "12"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "10", "15", "21", "24"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "4"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "7", "23", "27", "31", "38"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "6", "16", "26", "36", "42"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "10", "12", "14", "19", "23"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "6", "8", "12", "17"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "12", "18"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "4", "9", "11", "20", "27"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": ["1", "3", "6", "11", "16"]
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1", "7", "14", "17", "24"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": ["1", "4", "11", "15"]
-            },
-            {
-                "number": "40",
-                "paragraph_before": ["1", "7", "13"]
-            },
-            {
-                "number": "41",
-                "paragraph_before": ["1", "4", "11", "15"]
-            },
-            {
-                "number": "42",
-                "paragraph_before": ["1", "7", "18"]
-            },
-            {
-                "number": "43",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "44",
-                "paragraph_before": ["1", "11", "15", "20", "24"]
-            },
-            {
-                "number": "45",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "46",
-                "paragraph_before": ["1", "13", "25", "27"]
-            },
-            {
-                "number": "47",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "48",
-                "paragraph_before": ["1", "26", "34"]
-            },
-            {
-                "number": "49",
-                "paragraph_before": ["12", "28", "34"]
-            },
-            {
-                "number": "50",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "51",
-                "paragraph_before": []
-            },
-            {
-                "number": "52",
-                "paragraph_before": ["1", "12", "17", "24", "28", "31"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "25",
-        "usfm_id": "LAM",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": []
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "26",
-        "usfm_id": "EZK",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "15", "22", "26"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "4", "12", "16", "22"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4", "9"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "5", "13"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "8", "11"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "5", "7", "14", "16"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "3", "9"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "9", "15", "18", "20"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "5", "13", "22"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "7", "17", "21", "26"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "8", "17", "20"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "6", "12", "21"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "6", "15", "23", "30", "35", "44", "53", "60"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "11", "22"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "5", "10", "14", "19", "21", "25"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "10", "18", "27", "33", "40", "45"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "8", "18", "28"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "6", "13", "17", "23"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "5", "11", "36", "43"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "6", "15", "19", "25"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "8", "12", "15"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "7", "15", "19"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "11", "20", "25"]
-            },
-            {
-                "number": "29",
-                "paragraph_before": ["1", "8", "13", "17"]
-            },
-            {
-                "number": "30",
-                "paragraph_before": ["1", "5", "6", "10", "13", "20"]
-            },
-            {
-                "number": "31",
-                "paragraph_before": ["1", "10", "14", "15"]
-            },
-            {
-                "number": "32",
-                "paragraph_before": ["1", "11", "17", "29", "31"]
-            },
-            {
-                "number": "33",
-                "paragraph_before": ["1", "6", "7", "10", "17", "21", "23", "30"]
-            },
-            {
-                "number": "34",
-                "paragraph_before": ["1", "7", "11", "17", "20", "25"]
-            },
-            {
-                "number": "35",
-                "paragraph_before": ["1", "10", "14"]
-            },
-            {
-                "number": "36",
-                "paragraph_before": ["1", "8", "16", "22", "32", "37"]
-            },
-            {
-                "number": "37",
-                "paragraph_before": ["1", "7", "11", "15", "21", "24"]
-            },
-            {
-                "number": "38",
-                "paragraph_before": ["1", "7", "10", "14", "17"]
-            },
-            {
-                "number": "39",
-                "paragraph_before": ["1", "11", "17", "21", "25"]
-            },
-            {
-                "number": "40",
-                "paragraph_before": ["1", "5", "17", "20", "24", "28", "32", "35", "38", "44", "48"]
-            },
-            {
-                "number": "41",
-                "paragraph_before": ["1", "5", "12", "15", "21"]
-            },
-            {
-                "number": "42",
-                "paragraph_before": ["1", "10", "13", "15"]
-            },
-            {
-                "number": "43",
-                "paragraph_before": ["1", "6", "10", "13", "18"]
-            },
-            {
-                "number": "44",
-                "paragraph_before": ["1", "4", "15", "28"]
-            },
-            {
-                "number": "45",
-                "paragraph_before": ["1", "9", "13", "18", "21"]
-            },
-            {
-                "number": "46",
-                "paragraph_before": ["1", "6", "9", "13", "16", "19"]
-            },
-            {
-                "number": "47",
-                "paragraph_before": ["1", "3", "6", "13", "15", "21"]
-            },
-            {
-                "number": "48",
-                "paragraph_before": ["1", "8", "13", "15", "21", "23", "30"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "27",
-        "usfm_id": "DAN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "8", "14", "17"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "14", "17", "24", "25", "31", "36", "46"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "8", "13", "19", "24", "28"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4", "19", "28-", "34", "36"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "5", "10", "13", "17", "25", "29"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "4", "10", "16", "19", "24"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "9", "13", "15", "23", "28"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "5", "9", "15"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "3", "20", "24"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "10", "18"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "5", "7", "10", "20", "28", "36", "40"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "5"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "28",
-        "usfm_id": "HOS",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": []
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            },
-            {
-                "number": "08",
-                "paragraph_before": []
-            },
-            {
-                "number": "09",
-                "paragraph_before": []
-            },
-            {
-                "number": "10",
-                "paragraph_before": []
-            },
-            {
-                "number": "11",
-                "paragraph_before": []
-            },
-            {
-                "number": "12",
-                "paragraph_before": []
-            },
-            {
-                "number": "13",
-                "paragraph_before": []
-            },
-            {
-                "number": "14",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "29",
-        "usfm_id": "JOL",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "30",
-        "usfm_id": "AMO",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": []
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "4", "7", "10", "14"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "31",
-        "usfm_id": "OBA",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5", "10", "15", "17"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "32",
-        "usfm_id": "JON",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "6", "7", "8", "11", "13", "14", "17"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "6"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "33",
-        "usfm_id": "MIC",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["12"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": []
-            },
-            {
-                "number": "06",
-                "paragraph_before": []
-            },
-            {
-                "number": "07",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "34",
-        "usfm_id": "NAM",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "35",
-        "usfm_id": "HAB",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": []
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "36",
-        "usfm_id": "ZEP",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["10"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            }
-        ]
-    },
-    {
-        "usfm_num": "37",
-        "usfm_id": "HAG",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "10", "20"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "38",
-        "usfm_id": "ZEC",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "7", "12", "18"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "14", "18"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "8", "11"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["8"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["15"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "10"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "9", "12", "16"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "39",
-        "usfm_id": "MAL",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "2", "6"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "10", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "2", "7", "13", "16"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "4"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "41",
-        "usfm_id": "MAT",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "12", "18"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "13", "16", "19"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "11", "12", "17", "23"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "11", "13", "17", "21", "27", "33", "38", "43"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "5", "16", "19"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "7", "13", "15", "24", "28"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "5", "14", "18", "23", "28"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "10", "14", "18", "27", "32", "35"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "5", "16", "24", "34", "40"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "7", "20", "25"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "9", "15", "22", "38", "46"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "10", "24", "31", "34", "36", "44", "47", "51", "54"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "13", "22", "34"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "21", "29", "32"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "5", "13", "21"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "9", "14", "19", "22", "24"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "7", "15", "21"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "3", "13", "16", "23"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "17", "20", "29"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "12", "18", "23", "33"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "15", "23", "34", "41"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "13", "16", "23", "25", "27", "29", "37"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "3", "15", "29", "32", "45"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "14", "31"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "6", "14", "17", "20", "26", "30", "36", "47", "57", "69"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "3", "11", "27", "32", "45", "57", "62"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "11", "16"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "42",
-        "usfm_id": "MRK",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "2", "7", "9", "12", "14", "16", "21", "29", "32", "35", "40"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "13", "15", "18", "23"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "13", "20", "31"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "10", "21", "26", "30", "33", "35"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "21", "25", "35"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "7", "14", "30", "45", "53"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "24", "31"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "11", "14", "22", "27", "31"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "9", "14", "30", "33"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "13", "17", "23", "32", "35", "46"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "11", "15", "20", "27"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "13", "18", "28", "35", "38", "41"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "3", "9", "14", "24", "28", "33"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "3", "10", "12", "17", "22", "26", "32", "51", "53", "66"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "6", "16", "22", "33", "42"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "8", "12", "14", "19"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "43",
-        "usfm_id": "LUK",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["8", "18", "24", "26", "57"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": []
-            },
-            {
-                "number": "03",
-                "paragraph_before": []
-            },
-            {
-                "number": "04",
-                "paragraph_before": []
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "12", "17", "27", "29", "33"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "6", "12", "20", "27", "39", "46"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "2", "11", "18", "24", "36"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "4", "9", "16", "19", "22", "26", "40", "43", "49"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "7", "10", "18", "28", "37", "46", "49", "51", "57"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "17", "21", "25", "38"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "5", "14", "27", "29", "33", "37", "42", "45", "53"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "13", "22", "35", "41", "49", "54"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "6", "10", "18", "20", "22", "31"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "7", "12", "15", "25"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "3", "8", "11"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "14", "18", "19"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "5", "11", "20", "22"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "9", "15", "18", "31", "35"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "11", "28", "29", "41", "45", "47"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "9", "19", "27", "41", "45"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "5", "10", "20", "29", "37"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "3", "7", "14", "24", "31", "35", "39", "47", "54", "63", "66"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "8", "13", "26", "27", "32", "33", "39", "50"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "36", "44", "50"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "44",
-        "usfm_id": "JHN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "19", "35", "43"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "13", "23"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "16", "22", "31"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "27", "39", "43", "46"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "19", "30"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "16", "22", "41", "52", "60", "66"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "10", "14", "25", "37", "45", "53"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "12", "21", "31"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "13", "35"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "7", "19", "22", "40"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "17", "45", "47", "54"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "9", "12", "20", "44"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "12", "21", "31", "36"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "25"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "25"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "12", "15", "19", "25", "28", "33"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "17", "23", "28", "31", "38"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "11", "19", "24", "26", "30"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "15", "24"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "45",
-        "usfm_id": "ACT",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "12", "15"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "5", "14", "37", "43"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "5", "13", "23", "32", "36"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "7", "12", "17", "33"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "7", "8"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "51", "54"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "4", "9", "14", "25", "26"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "10", "23", "26", "31", "36"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "9", "17", "44"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "19", "27"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "20", "24", "25"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "4", "13", "42", "44"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "8", "19"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "12", "22", "30", "36"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "6", "11", "19", "35"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1", "10", "16", "32"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "12", "18", "22", "24"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "8", "21", "23"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "7", "13", "17", "36"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "7", "15", "17", "27", "37"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["1", "2", "3", "22", "30"]
-            },
-            {
-                "number": "23",
-                "paragraph_before": ["1", "11", "12", "26", "31"]
-            },
-            {
-                "number": "24",
-                "paragraph_before": ["1", "10", "22", "24"]
-            },
-            {
-                "number": "25",
-                "paragraph_before": ["1", "6", "13", "23"]
-            },
-            {
-                "number": "26",
-                "paragraph_before": ["1", "2", "24", "30"]
-            },
-            {
-                "number": "27",
-                "paragraph_before": ["1", "9", "27"]
-            },
-            {
-                "number": "28",
-                "paragraph_before": ["1", "7", "11", "16", "17", "23", "30"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "46",
-        "usfm_id": "ROM",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "8", "16", "18", "24", "26", "28"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "9", "19", "21", "27", "31"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "12", "15"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "12", "15"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "7", "13"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "12", "18", "26", "31"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "6", "14", "19", "30"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "16"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "11", "25", "33", "36"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "3", "9"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "8", "11"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "7", "11", "14", "22", "30"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "3", "17", "21", "25"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "47",
-        "usfm_id": "1CO",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "10", "18", "26"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "10", "16", "18"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "6", "14"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "6", "25"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "14", "23"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["2", "17"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "4", "12"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "20", "26", "37", "39"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "12", "20", "29", "35", "50"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "10", "13", "15", "19", "21"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "48",
-        "usfm_id": "2CO",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "12", "15", "23"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "5", "12", "14"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "16"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "11", "20"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["2", "5"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "16"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "16", "32"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "11", "14", "19"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "11", "13", "14"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "49",
-        "usfm_id": "GAL",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "6", "11", "18"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "15", "23"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "8", "12", "21"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "2", "13", "16", "25"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "6", "11", "17", "18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "50",
-        "usfm_id": "EPH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "15"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "14", "20"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "17", "25"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "3", "15", "22"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "5", "9", "10", "21", "23"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "51",
-        "usfm_id": "PHP",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "12"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "12", "19"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "17"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "2", "4", "8", "10", "21", "23"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "52",
-        "usfm_id": "COL",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "9", "24"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "6", "8", "16", "20"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "5", "12", "18"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "2", "7", "10", "18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "53",
-        "usfm_id": "1TH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "2"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "13", "17"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "11"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "9", "13"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "12", "23", "25", "26", "28"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "54",
-        "usfm_id": "2TH",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "13", "16"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "6", "16"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "55",
-        "usfm_id": "1TI",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "12", "18"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "14"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "6"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "17"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "3", "11", "17", "20"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "56",
-        "usfm_id": "2TI",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "15"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "14"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "9", "19", "22"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "57",
-        "usfm_id": "TIT",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5", "10"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "15"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "12", "15"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "58",
-        "usfm_id": "PHM",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "8", "21", "23", "25"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "59",
-        "usfm_id": "HEB",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "6", "8", "13", "14"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "5", "13", "14"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "12", "16"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "6", "8", "14"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "6", "7", "11"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "9", "13"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "4", "11", "18", "22"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "11", "23"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1", "8", "18", "19", "26", "32", "39"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "4", "7", "14", "18"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["1", "7", "18", "20", "22", "24", "25"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "60",
-        "usfm_id": "JAS",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": []
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "14"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "11", "13"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "7", "12", "13", "19"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "61",
-        "usfm_id": "1PE",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "13"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "7", "8", "11", "13", "18"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "8", "13"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7", "12"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "12"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "62",
-        "usfm_id": "2PE",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "12"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "8", "14"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "63",
-        "usfm_id": "1JN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "5"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "7", "12", "18", "28"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "13"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1", "7"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "13", "18"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "64",
-        "usfm_id": "2JN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "12"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "65",
-        "usfm_id": "3JN",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "2", "5", "9", "13"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "66",
-        "usfm_id": "JUD",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "3", "5", "17", "24"]
-            }
-        ]
-    },
-    {
-        "usfm_num": "67",
-        "usfm_id": "REV",
-        "chapters": [
-            {
-                "number": "01",
-                "paragraph_before": ["1", "4", "8", "9"]
-            },
-            {
-                "number": "02",
-                "paragraph_before": ["1", "8", "12", "18"]
-            },
-            {
-                "number": "03",
-                "paragraph_before": ["1", "7", "8", "14"]
-            },
-            {
-                "number": "04",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "05",
-                "paragraph_before": ["1", "13", "14"]
-            },
-            {
-                "number": "06",
-                "paragraph_before": ["1", "3", "5", "7", "9", "12"]
-            },
-            {
-                "number": "07",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "08",
-                "paragraph_before": ["1", "3", "6", "7", "8", "10", "12", "13"]
-            },
-            {
-                "number": "09",
-                "paragraph_before": ["1", "12", "13"]
-            },
-            {
-                "number": "10",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "11",
-                "paragraph_before": ["1", "14", "15", "19"]
-            },
-            {
-                "number": "12",
-                "paragraph_before": ["1", "7", "13"]
-            },
-            {
-                "number": "13",
-                "paragraph_before": ["11"]
-            },
-            {
-                "number": "14",
-                "paragraph_before": ["1", "6", "8", "9", "13", "14", "17"]
-            },
-            {
-                "number": "15",
-                "paragraph_before": ["1", "2", "5"]
-            },
-            {
-                "number": "16",
-                "paragraph_before": ["1", "2", "3", "4", "8", "10", "12", "17"]
-            },
-            {
-                "number": "17",
-                "paragraph_before": ["1"]
-            },
-            {
-                "number": "18",
-                "paragraph_before": ["1", "21"]
-            },
-            {
-                "number": "19",
-                "paragraph_before": ["1", "9", "11", "17", "19"]
-            },
-            {
-                "number": "20",
-                "paragraph_before": ["1", "4", "7", "11"]
-            },
-            {
-                "number": "21",
-                "paragraph_before": ["1", "9"]
-            },
-            {
-                "number": "22",
-                "paragraph_before": ["6", "8", "10", "16", "17", "18", "20", "21"]
-            }
-        ]
-    }
-]
+from __future__ import unicode_literals
+import json
+import os
+import sys
+from array import array
+from app_code.util import app_utils
+
+# The verses that begin a paragraph, by book and chapter. These are used to insert \p markers in text that does not
+# have paragraphs, see Bible.insert_paragraph_markers.
+#
+# The data is in static/bible-paragraphs.bin, and each book is read from the file the first time it is needed. The
+# file starts with a line of json, {"format": 1, "books": {book_id: [offset, length], ...}}, where offset is from the
+# end of that line. Each book is a list of little-endian unsigned 16-bit integers: for every chapter the chapter
+# number, the number of verses, and then the verses in order. A few verses are written as the beginning of a verse
+# bridge, like "36-", those have the bridge_flag bit set.
+
+bridge_flag = 0x8000
+
+file_format = 1
+
+# do not access these directly, use get_paragraph_verses
+book_index = None  # type: dict<str, list<int>>
+loaded_books = {}  # type: dict<str, dict<int, frozenset>>
+
+
+def get_data_file():
+    return os.path.join(app_utils.get_static_dir(), 'bible-paragraphs.bin')
+
+
+def get_paragraph_verses(book_id, chapter_num):
+    """
+    Returns the verses that begin paragraphs in the chapter. Raises KeyError if the chapter is not in the data.
+    :param str|unicode book_id:
+    :param int chapter_num:
+    :return: frozenset<str> The verse numbers as text, like "1" or "36-"
+    """
+    if book_id not in loaded_books:
+        loaded_books[book_id] = load_book(book_id)
+
+    return loaded_books[book_id][chapter_num]
+
+
+def load_book(book_id):
+    """
+    :param str|unicode book_id:
+    :return: dict<int, frozenset>
+    """
+    global book_index
+
+    with open(get_data_file(), 'rb') as in_file:
+        header = in_file.readline()
+        if book_index is None:
+            book_index = json.loads(header.decode('utf-8'))['books']
+
+        if book_id not in book_index:
+            raise KeyError(book_id)
+
+        offset, length = book_index[book_id]
+        in_file.seek(len(header) + offset)
+        values = from_bytes(in_file.read(length))
+
+    chapters = {}
+    i = 0
+    while i < len(values):
+        chapter_num, count = values[i], values[i + 1]
+        chapters[chapter_num] = frozenset(verse_to_str(v) for v in values[i + 2:i + 2 + count])
+        i += 2 + count
+
+    return chapters
+
+
+def verse_to_str(value):
+    if value & bridge_flag:
+        return '{0}-'.format(value & ~bridge_flag)
+
+    return '{0}'.format(value)
+
+
+def verse_from_str(verse):
+    if verse.endswith('-'):
+        return int(verse[:-1]) | bridge_flag
+
+    return int(verse)
+
+
+def from_bytes(data):
+    values = array(str('H'))
+    if hasattr(values, 'frombytes'):
+        values.frombytes(data)
+    else:
+        values.fromstring(data)
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+def to_bytes(values):
+    values = array(str('H'), values)
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values.tobytes() if hasattr(values, 'tobytes') else values.tostring()
+
+
+def write_data_file(paragraph_verses, file_name=None):
+    """
+    Writes the data file. Use this with read_data_file to update the paragraph data.
+    :param dict paragraph_verses: {(book_id, chapter_num): [verse, ...], ...} with the verse numbers as text
+    :param str|unicode file_name: Defaults to static/bible-paragraphs.bin
+    """
+    books = {}
+    for (book_id, chapter_num), verses in paragraph_verses.items():
+        values = sorted((verse_from_str(v) for v in verses), key=lambda v: (v & ~bridge_flag, v))
+        books.setdefault(book_id, []).append((chapter_num, values))
+
+    index = {}
+    data = b''
+    for book_id in sorted(books):
+        values = []
+        for chapter_num, verses in sorted(books[book_id]):
+            values.extend([chapter_num, len(verses)])
+            values.extend(verses)
+
+        book_data = to_bytes(values)
+        index[book_id] = [len(data), len(book_data)]
+        data += book_data
+
+    header = json.dumps({'format': file_format, 'books': index}, sort_keys=True).encode('utf-8') + b'\n'
+    with open(file_name if file_name else get_data_file(), 'wb') as out_file:
+        out_file.write(header + data)
+
+
+def read_data_file():
+    """
+    Reads all the books
+    :return: dict {(book_id, chapter_num): frozenset<str>, ...}
+    """
+    with open(get_data_file(), 'rb') as in_file:
+        index = json.loads(in_file.readline().decode('utf-8'))['books']
+
+    paragraph_verses = {}
+    for book_id in index:
+        for chapter_num, verses in load_book(book_id).items():
+            paragraph_verses[(book_id, chapter_num)] = verses
+
+    return paragraph_verses
@@ -2,27 +2,29 @@ from __future__ import print_function, unicode_literals
 import json
 from future.builtins import chr
 import re
-from general_tools.print_utils import print_error
-from general_tools.url_utils import get_url
+from app_code.util.url_cache import get_cached_url
 import bible_classes
+import error_collector
+import usfm_lexer
+import usfm_normalizer
+import versification
+from error_collector import ErrorCollector, ErrorRecord
+from usfm_lexer import UsfmLexer
 
 
 class Book(object):
 
     # TODO: change these to point to the API when it is available
     api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
-    vrs_file = api_root + '/versification/ufw/ufw.vrs'
-    book_file = api_root + '/versification/ufw/books.json'
     chunk_url = api_root + '/versification/ufw/chunks/{0}.json'
 
-    verse_re = re.compile(r'(\\v[\u00A0 ][0-9-\u2013\u2014]*\s+)', re.UNICODE)
-    chapter_re = re.compile(r'(\\c[\u00A0 ][0-9]+\s*\n)', re.UNICODE)
+    # the chapter and verse markers, and the git merge conflicts, are found by the UsfmLexer
 
     # chapter tag with other characters following the chapter number
     bad_chapter_re = re.compile(r'\\c[\u00A0 ][0-9]+([^0-9\n]+)', re.UNICODE)
 
-    # back-slash with no tag character following it
-    empty_tag_re = re.compile(r'\n(.*?\\[\u00A0 ]*?\n.*?)\n', re.UNICODE)
+    # back-slash with no tag character following it, at the end of the line
+    empty_tag_end_re = re.compile(r'[\u00A0 ]*\n', re.UNICODE)
 
     # chapter or verse with missing number
     missing_num_re = re.compile(r'(\\[cv][\u00A0 ][^0-9]+?)[\u00A0\s]+?', re.UNICODE)
@@ -30,20 +32,15 @@ class Book(object):
     # verse with no text
     missing_verse_text_re = re.compile(r'(\\v[\u00A0 ][0-9-\u2013\u2014]*[\u00A0 ]*[\r\n])', re.UNICODE)
 
-    # git merge conflicts
-    git_conflict_re = re.compile(r'<<<<<<<.*?=======.*?>>>>>>>', re.UNICODE | re.DOTALL)
-
     tag_re = re.compile(r'\s(\\\S+)\s', re.UNICODE)
     bad_tag_re = re.compile(r'(\S\\\S+)\s', re.UNICODE)
     tag_exceptions = ('\\f*', '\\fe*', '\\fqa*', '\\qs*')
-    nbsp_re = re.compile(r'(\\[a-z0-9]+)([\u00A0])', re.UNICODE)
 
-    # clean-up usfm
-    s5_re = re.compile(r'\\s5\s*')
-    nl_re = re.compile(r'\n{2,}')
+    # change this when the checks change, so the results in the validation cache are not used
+    checker_version = 2
 
     # initialization
-    book_skeletons = None  # type: list<Book>
+    book_skeletons = None  # type: Versification
 
     def __init__(self, book_id, name, number):
         """
@@ -59,20 +56,79 @@ class Book(object):
         self.dir_name = str(number).zfill(2) + '-' + book_id  # type: str
         self.usfm = None             # type: str
         self.validation_errors = []  # type: list<str>
+        self.error_records = []      # type: list<ErrorRecord>
         self.header_usfm = ''        # type: str
+        self.tokens = None           # type: list<UsfmToken>
+        self.tokens_usfm = None      # type: str
+
+        # lookups by chapter number, kept in sync with self.chapters and self.chunks
+        self.chapter_index = {}      # type: dict<int, Chapter>
+        self.chapter_chunks = {}     # type: dict<int, list<Chunk>>
+        self.indexed_chapters = 0    # type: int
+        self.indexed_chunks = 0      # type: int
 
     def number_string(self):
         return str(self.number).zfill(2)
 
-    def set_usfm(self, new_usfm):
+    def add_chapter(self, chapter):
+        """
+        :param Chapter chapter:
+        """
+        self.chapters.append(chapter)
+        self.get_chapter(chapter.number)
+
+    def add_chunk(self, chunk):
+        """
+        :param Chunk chunk:
+        """
+        self.chunks.append(chunk)
+        self.get_chapter_chunks(chunk.chapter_num)
+
+    def get_chapter(self, chapter_num):
+        """
+        Returns the chapter with this number, using the chapter index
+        :param int chapter_num:
+        :return: Chapter|None
+        """
+        # index the chapters that were added since the last time
+        if self.indexed_chapters != len(self.chapters):
+            if self.indexed_chapters > len(self.chapters):
+                self.chapter_index = {}
+                self.indexed_chapters = 0
+
+            for chapter in self.chapters[self.indexed_chapters:]:
+                self.chapter_index.setdefault(chapter.number, chapter)
+            self.indexed_chapters = len(self.chapters)
 
-        # remove Windows line endings
-        temp = new_usfm.replace('\r\n', '\n')
+        return self.chapter_index.get(chapter_num)
+
+    def get_chapter_chunks(self, chapter_num):
+        """
+        Returns the chunks that belong to the chapter with this number, in the order they were added
+        :param int chapter_num:
+        :return: list<Chunk>
+        """
+        # group the chunks that were added since the last time
+        if self.indexed_chunks != len(self.chunks):
+            if self.indexed_chunks > len(self.chunks):
+                self.chapter_chunks = {}
+                self.indexed_chunks = 0
 
-        # replace nbsp in USFM tags with normal space (32)
-        temp = self.nbsp_re.sub(r'\1 ', temp)
+            for chunk in self.chunks[self.indexed_chunks:]:
+                self.chapter_chunks.setdefault(chunk.chapter_num, []).append(chunk)
+            self.indexed_chunks = len(self.chunks)
 
-        self.usfm = temp
+        return self.chapter_chunks.get(chapter_num, [])
+
+    def set_usfm(self, new_usfm, strip_s5=False):
+        """
+        Remove Windows line endings and replace nbsp in USFM tags with normal space (32), in one pass
+        :param str|unicode new_usfm:
+        :param bool strip_s5: Also remove the \\s5 chunk markers
+        :return: dict The number of changes of each kind, see usfm_normalizer
+        """
+        self.usfm, counts = usfm_normalizer.normalize(new_usfm, crlf=True, nbsp=True, strip_s5=strip_s5)
+        return counts
 
     def build_usfm_from_chapters(self):
         self.usfm = self.header_usfm
@@ -82,12 +138,23 @@ class Book(object):
             self.usfm += "\n\n\\c {0}\n{1}".format(chapter.number, chapter.usfm)
 
     def clean_usfm(self):
+        """
+        Remove \\s5 lines and superfluous line breaks, in one pass
+        :return: dict The number of changes of each kind, see usfm_normalizer
+        """
+        self.usfm, counts = usfm_normalizer.normalize(self.usfm, crlf=False, nbsp=False, collapse=True, strip_s5=True)
+        return counts
 
-        # remove superfluous line breaks
-        self.usfm = self.nl_re.sub('\n', self.usfm)
+    def get_tokens(self):
+        """
+        Returns the USFM of this book as a list of UsfmToken. The text is only tokenized again if it has changed.
+        :return: list<UsfmToken>
+        """
+        if self.tokens is None or self.tokens_usfm is not self.usfm:
+            self.tokens = list(usfm_lexer.tokenize(self.usfm))
+            self.tokens_usfm = self.usfm
 
-        # remove \s5 lines
-        self.usfm = self.s5_re.sub('', self.usfm)
+        return self.tokens
 
     def verify_chapters_and_verses(self, same_line=False):
 
@@ -96,30 +163,101 @@ class Book(object):
         else:
             print('Verifying ' + self.book_id)
 
+        tokens = self.get_tokens()
+
         # check for git conflicts
-        conflicts = self.git_conflict_re.findall(self.usfm)
-        if conflicts:
-            if len(conflicts) == 1:
-                self.append_error('There is 1 Git conflict in {0}'.format(self.book_id))
-            else:
-                self.append_error('There are {0} Git conflicts in {1}'.format(len(conflicts), self.book_id))
+        self.append_conflict_errors(UsfmLexer.count_conflicts(tokens))
 
-        # check for bad chapter tags
-        for bad_chapter in self.bad_chapter_re.finditer(self.usfm):
-            if bad_chapter.group(1).strip():
-                self.append_error('Invalid chapter marker: "{0}"'.format(bad_chapter.group(0)))
+        self.append_marker_errors(*self.check_markers(self.usfm, tokens, [-1, -1, -1]))
 
-        # check for empty tags
-        for bad_tag in self.empty_tag_re.finditer(self.usfm):
-            if bad_tag.group(1).strip():
-                self.append_error('Empty USFM marker: "{0}"'.format(bad_tag.group(1)))
+        # split into chapters
+        self.check_chapters(tokens)
 
-        # check for chapter or verse tags without numbers
-        for no_num in self.missing_num_re.finditer(self.usfm):
-            self.append_error('Chapter or verse tag without a number: "{0}"'.format(no_num.group(1)))
+        self.error_collector.finish(self.book_id)
 
-        # split into chapters
-        self.check_chapters(self.chapter_re.split(self.usfm))
+    def append_conflict_errors(self, conflicts):
+        """
+        :param int conflicts: The number of git conflicts in the book
+        """
+        if conflicts == 1:
+            self.append_error('There is 1 Git conflict in {0}'.format(self.book_id), code=error_collector.GIT_CONFLICT)
+        elif conflicts:
+            self.append_error('There are {0} Git conflicts in {1}'.format(conflicts, self.book_id),
+                              code=error_collector.GIT_CONFLICT)
+
+    def append_marker_errors(self, bad_chapters, empty_tags, no_nums):
+        """
+        :param list<str> bad_chapters: From check_markers
+        :param list<str> empty_tags: From check_markers
+        :param list<str> no_nums: From check_markers
+        """
+        for bad_chapter in bad_chapters:
+            self.append_error('Invalid chapter marker: "{0}"'.format(bad_chapter),
+                              code=error_collector.INVALID_CHAPTER_MARKER)
+
+        for bad_tag in empty_tags:
+            self.append_error('Empty USFM marker: "{0}"'.format(bad_tag), code=error_collector.EMPTY_MARKER)
+
+        for no_num in no_nums:
+            self.append_error('Chapter or verse tag without a number: "{0}"'.format(no_num),
+                              code=error_collector.MISSING_NUMBER)
+
+    def check_markers(self, usfm, tokens, ends, line_offset=0, check_end=None):
+        """
+        Finds chapter markers with other characters after the number, empty markers, and chapter or verse markers
+        without a number.
+        :param str|unicode usfm: The text the tokens are from
+        :param list<UsfmToken> tokens:
+        :param list<int> ends: [end of the last bad chapter, line of the last empty tag, end of the last marker without
+                               a number], the matches that overlap these are skipped. Updated for the next call.
+        :param int line_offset: The number of lines before usfm, when it is part of a book
+        :param int check_end: Only check the tokens that start before this, the text after it is only used to finish
+                              the messages
+        :return: tuple of (bad chapters, empty tags, markers without numbers), each a list<str>
+        """
+        bad_chapters = []
+        empty_tags = []
+        no_nums = []
+        bad_chapter_end, empty_tag_line, no_num_end = ends
+        check_end = len(usfm) if check_end is None else check_end
+
+        for token in tokens:
+            if token.start >= check_end:
+                break
+
+            if token.marker == 'c' and token.start >= bad_chapter_end:
+
+                # check for bad chapter tags
+                bad_chapter = self.bad_chapter_re.match(usfm, token.start)
+                if bad_chapter:
+                    bad_chapter_end = bad_chapter.end()
+                    if bad_chapter.group(1).strip():
+                        bad_chapters.append(bad_chapter.group(0))
+
+            elif token.marker == '' and token.line + line_offset > 1 and \
+                    token.line + line_offset > empty_tag_line + 2:
+
+                # check for empty tags, the back-slash must be the last thing on the line
+                empty_tag = self.empty_tag_end_re.match(usfm, token.end)
+                if empty_tag:
+
+                    # the message includes this line and the next one
+                    line_start = token.start - token.column + 1
+                    next_line_end = usfm.find('\n', empty_tag.end())
+                    if next_line_end > -1:
+                        empty_tag_line = token.line + line_offset
+                        empty_tags.append(usfm[line_start:next_line_end])
+
+            if (token.marker == 'c' or token.marker == 'v') and token.start >= no_num_end:
+
+                # check for chapter or verse tags without numbers
+                no_num = self.missing_num_re.match(usfm, token.start)
+                if no_num:
+                    no_num_end = no_num.end()
+                    no_nums.append(no_num.group(1))
+
+        ends[:] = [bad_chapter_end, empty_tag_line, no_num_end]
+        return bad_chapters, empty_tags, no_nums
 
     def verify_usfm_tags(self, same_line=False):
 
@@ -129,102 +267,173 @@ class Book(object):
             print('Checking USFM in ' + self.book_id)
 
         # split into chapters
-        chapters_usfm = self.chapter_re.split(self.usfm)
-        current_chapter = '\c 0'
+        current_chapter = '\\c 0'
+        chapter_num = None
+
+        for block_start, block_end, block_tokens in self.get_blocks(self.get_tokens()):
+            if self.usfm.startswith('\\c', block_start, block_end):
+                current_chapter = self.usfm[block_start:block_end].strip()
+                if block_tokens and block_tokens[0].kind == usfm_lexer.CHAPTER:
+                    chapter_num = int(block_tokens[0].number)
+                continue
 
-        for chapter_usfm in chapters_usfm:
-            if chapter_usfm[0:2] == '\c':
-                current_chapter = chapter_usfm.strip()
-            else:
-                # get all tags
-                matches = re.findall(self.tag_re, chapter_usfm)
-                for match in matches:
-                    if not bible_classes.USFM.is_valid_tag(match):
+            invalid_tags = []
+            bad_tags = []
+            no_texts = []
+            tag_end = bad_tag_end = block_start
+
+            for token in block_tokens:
+                if not UsfmLexer.is_tag(token):
+                    continue
+
+                # get all tags, there must be white space before and after
+                if self.usfm[token.start - 1].isspace():
+                    if token.start > tag_end:
+                        match = self.tag_re.match(self.usfm, token.start - 1, block_end)
+                        if match:
+                            tag_end = match.end()
+                            invalid_tags.append(match.group(1))
+
+                # check for bad tags, something other than white space before the back-slash
+                elif token.start > bad_tag_end:
+                    match = self.bad_tag_re.match(self.usfm, token.start - 1, block_end)
+                    if match:
+                        bad_tag_end = match.end()
+                        bad_tags.append(match.group(1))
 
-                        # check the exceptions
-                        if not match.startswith(self.tag_exceptions):
-                            self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match)
+                # check for verses with no text
+                if token.marker == 'v':
+                    no_text = self.missing_verse_text_re.match(self.usfm, token.start, block_end)
+                    if no_text:
+                        no_texts.append(no_text.group(1))
 
-                # check for bad tags
-                matches = re.findall(self.bad_tag_re, chapter_usfm)
-                for match in matches:
+            for match in invalid_tags:
+                if not bible_classes.USFM.is_valid_tag(match):
 
                     # check the exceptions
-                    if not match.endswith(self.tag_exceptions):
-                        self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match)
+                    if not match.startswith(self.tag_exceptions):
+                        self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match,
+                                          code=error_collector.INVALID_TAG, chapter=chapter_num)
 
-                # check for verses with no text
-                for no_text in self.missing_verse_text_re.finditer(chapter_usfm):
-                    self.append_error('Verse tag without text in {0}: "{1}"'.format(current_chapter,
-                                                                                    no_text.group(1).strip()))
+            for match in bad_tags:
+
+                # check the exceptions
+                if not match.endswith(self.tag_exceptions):
+                    self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match,
+                                      code=error_collector.INVALID_TAG, chapter=chapter_num)
+
+            for no_text in no_texts:
+                self.append_error('Verse tag without text in {0}: "{1}"'.format(current_chapter, no_text.strip()),
+                                  code=error_collector.VERSE_WITHOUT_TEXT, chapter=chapter_num)
 
-    def check_chapters(self, blocks):
+        self.error_collector.finish(self.book_id)
 
+    def get_blocks(self, tokens):
+        """
+        Splits the tokens the same way the text is split by the chapter markers: the text before the first chapter,
+        then each chapter marker followed by the text of that chapter.
+        :param list<UsfmToken> tokens:
+        :return: generator of (block_start, block_end, list<UsfmToken>)
+        """
+        block_start = 0
+        block_tokens = []
+
+        for token in tokens:
+            if token.kind == usfm_lexer.CHAPTER:
+                yield block_start, token.start, block_tokens
+                yield token.start, token.end, [token]
+                block_start = token.end
+                block_tokens = []
+            else:
+                block_tokens.append(token)
+
+        yield block_start, len(self.usfm), block_tokens
+
+    def check_chapters(self, tokens):
+        self.read_chapters(tokens, self.check_chapter)
+
+    def read_chapters(self, tokens, get_found_chapter):
+        """
+        Fills in header_usfm, and the usfm of each chapter that get_found_chapter returns
+        :param list<UsfmToken> tokens:
+        :param get_found_chapter: Called with the chapter marker token and the tokens of the chapter text, returns
+                                  the Chapter or None
+        """
         self.header_usfm = ''
 
-        # find the first chapter marker, should be the second block
-        # the first block should be everything before the first chapter marker
-        current_index = 0
-        while blocks[current_index][:2] != '\c':
-            self.header_usfm += blocks[current_index].rstrip()
-            current_index += 1
-
-        # loop through the blocks
-        while current_index < len(blocks):
-
-            # parse the chapter number
-            test_num = blocks[current_index][3:].strip()
-            if not test_num.isdigit():
-                self.append_error('Invalid chapter number, ' + self.book_id + ' "' + test_num + '"')
-
-            # compare this chapter number to the numbers from the versification file
-            try:
-                chapter_num = int(test_num)
-            except ValueError:
-                self.append_error('Invalid chapter number, ' + self.book_id + ' "' + blocks[current_index] + '"')
-                continue
+        blocks = list(self.get_blocks(tokens))
 
-            found_chapter = next((c for c in self.chapters if c.number == chapter_num), None)  # type: Chapter
-            if not found_chapter:
-                self.append_error('Invalid chapter number, ' + self.book_id + ' "' + test_num + '"')
+        # the first block is everything before the first chapter marker
+        self.header_usfm = self.usfm[:blocks[0][1]].rstrip()
 
-            else:
-                found_chapter.found = True
+        # loop through the chapters, a chapter marker followed by the chapter body
+        for current_index in range(1, len(blocks), 2):
+            marker_start, marker_end, marker_tokens = blocks[current_index]
+            body_start, body_end, body_tokens = blocks[current_index + 1]
 
-                # make sure there is a chapter body
-                if current_index + 1 >= len(blocks):
-                    self.append_error('No verses found in ' + self.book_id + ' ' + str(found_chapter.number))
+            found_chapter = get_found_chapter(marker_tokens[0], body_tokens)  # type: Chapter
+            if found_chapter:
 
-                else:
-                    # split the chapter text into verses
-                    self.check_verses(found_chapter, self.verse_re.split(blocks[current_index + 1]))
+                # remember for later
+                found_chapter.usfm = self.usfm[marker_start:marker_end] + '\n' + \
+                    self.usfm[body_start:body_end] + '\n'
 
-                    # remember for later
-                    found_chapter.usfm = blocks[current_index] + '\n' + blocks[current_index + 1] + '\n'
+    def check_chapter(self, marker_token, body_tokens):
+        """
+        Checks the chapter number and the verse markers of one chapter
+        :param UsfmToken marker_token: The chapter marker
+        :param list<UsfmToken> body_tokens: The tokens of the chapter text, after the marker
+        :return: Chapter|None The chapter, if the number is in the versification
+        """
+        # compare this chapter number to the numbers from the versification file
+        test_num = marker_token.number
+        chapter_num = int(test_num)
 
-            # increment the counter
-            current_index += 2
+        found_chapter = self.get_chapter(chapter_num)  # type: Chapter
+        if not found_chapter:
+            self.append_error('Invalid chapter number, ' + self.book_id + ' "' + test_num + '"',
+                              code=error_collector.INVALID_CHAPTER_NUMBER, chapter=chapter_num)
+            return None
 
-    def check_verses(self, found_chapter, verse_blocks):
+        found_chapter.found = True
 
-        last_verse = 0
-        processed_verses = []
+        # check the verse markers in the chapter text
+        self.check_verses(found_chapter, [t for t in body_tokens if t.kind == usfm_lexer.VERSE])
+
+        return found_chapter
+
+    def split_chapters(self):
+        """
+        Fills in header_usfm and the usfm of each chapter the same way check_chapters does, without checking anything.
+        Use this when the book has already been checked, see validation_cache.verify_book.
+        """
+        self.read_chapters(self.get_tokens(), self.find_chapter)
+
+    # noinspection PyUnusedLocal
+    def find_chapter(self, marker_token, body_tokens):
+        found_chapter = self.get_chapter(int(marker_token.number))  # type: Chapter
+        if found_chapter:
+            found_chapter.found = True
+
+        return found_chapter
 
-        # go to the first verse marker
-        current_cv_index = 0
-        while current_cv_index < len(verse_blocks) and verse_blocks[current_cv_index][:2] != '\\v':
-            current_cv_index += 1
+    def check_verses(self, found_chapter, verse_tokens):
+
+        last_verse = 0
+        found_chapter.reset_coverage()
 
         # are all the verse markers missing?
-        if current_cv_index >= len(verse_blocks):
-            self.append_error('All verse markers are missing for ' + self.book_id + ' ' + str(found_chapter.number))
+        if not verse_tokens:
+            self.append_error('All verse markers are missing for ' + self.book_id + ' ' + str(found_chapter.number),
+                              code=error_collector.VERSES_MISSING, chapter=found_chapter.number)
+            found_chapter.missing_verses = found_chapter.get_missing_verses()
             return
 
         # verses should be sequential, starting at 1 and ending at found_chapter.expected_max_verse_number
-        while current_cv_index < len(verse_blocks):
+        for verse_token in verse_tokens:
 
             # parse the verse number
-            test_num = verse_blocks[current_cv_index][3:].strip()
+            test_num = verse_token.number
 
             bridge_marker = None  # type: str
 
@@ -234,12 +443,16 @@ class Book(object):
             if chr(8211) in test_num:
                 bridge_marker = chr(8211)
                 self.append_error('Invalid verse bridge (en dash used), ' + self.book_id + ' ' +
-                                  str(found_chapter.number) + ':' + test_num)
+                                  str(found_chapter.number) + ':' + test_num,
+                                  code=error_collector.INVALID_VERSE_BRIDGE, chapter=found_chapter.number,
+                                  verse=test_num)
 
             elif chr(8212) in test_num:
                 bridge_marker = chr(8212)
                 self.append_error('Invalid verse bridge (em dash used), ' + self.book_id + ' ' +
-                                  str(found_chapter.number) + ':' + test_num)
+                                  str(found_chapter.number) + ':' + test_num,
+                                  code=error_collector.INVALID_VERSE_BRIDGE, chapter=found_chapter.number,
+                                  verse=test_num)
 
             # is this a verse bridge?
             elif '-' in test_num:
@@ -249,71 +462,107 @@ class Book(object):
                 nums = test_num.split(bridge_marker)
                 if len(nums) != 2 or not nums[0].strip().isdigit() or not nums[1].strip().isdigit():
                     self.append_error('Invalid verse bridge, ' + self.book_id + ' ' +
-                                      str(found_chapter.number) + ':' + test_num)
+                                      str(found_chapter.number) + ':' + test_num,
+                                      code=error_collector.INVALID_VERSE_BRIDGE, chapter=found_chapter.number,
+                                      verse=test_num)
 
                 else:
                     for bridge_num in range(int(nums[0].strip()), int(nums[1].strip()) + 1):
-                        last_verse = self.check_this_verse(found_chapter, bridge_num, last_verse, processed_verses)
+                        last_verse = self.check_this_verse(found_chapter, bridge_num, last_verse)
 
             else:
                 if not test_num.isdigit():
 
                     # the verse number isn't a number
                     self.append_error('Invalid verse number, ' + self.book_id + ' ' +
-                                      str(found_chapter.number) + ':' + test_num)
+                                      str(found_chapter.number) + ':' + test_num,
+                                      code=error_collector.INVALID_VERSE_NUMBER, chapter=found_chapter.number,
+                                      verse=test_num)
 
                 else:
                     verse_num = int(test_num)
-                    last_verse = self.check_this_verse(found_chapter, verse_num, last_verse, processed_verses)
-
-            current_cv_index += 2
+                    last_verse = self.check_this_verse(found_chapter, verse_num, last_verse)
 
         # are there verses missing from the end
         if last_verse < found_chapter.expected_max_verse_number:
             self.append_error('Verses ' + str(last_verse + 1) + ' through ' +
                               str(found_chapter.expected_max_verse_number) + ' for ' + self.book_id + ' ' +
-                              str(found_chapter.number) + ' are missing.')
+                              str(found_chapter.number) + ' are missing.',
+                              code=error_collector.VERSES_MISSING, chapter=found_chapter.number, verse=last_verse + 1)
+
+        found_chapter.missing_verses = found_chapter.get_missing_verses()
 
-    def check_this_verse(self, found_chapter, verse_num, last_verse, processed_verses):
+    def check_this_verse(self, found_chapter, verse_num, last_verse):
 
         # is this verse number too large?
         if verse_num > found_chapter.expected_max_verse_number:
             self.append_error('Invalid verse number, ' + self.book_id + ' ' +
-                              str(found_chapter.number) + ':' + str(verse_num))
+                              str(found_chapter.number) + ':' + str(verse_num),
+                              code=error_collector.INVALID_VERSE_NUMBER, chapter=found_chapter.number, verse=verse_num)
 
         # look for gaps in the verse numbers
         while verse_num > last_verse + 1 and last_verse < found_chapter.expected_max_verse_number:
             # there is a verse missing
             self.append_error('Verse not found, ' + self.book_id + ' ' +
-                              str(found_chapter.number) + ':' + str(last_verse + 1))
+                              str(found_chapter.number) + ':' + str(last_verse + 1),
+                              code=error_collector.VERSE_NOT_FOUND, chapter=found_chapter.number, verse=last_verse + 1)
             last_verse += 1
 
         # look for out-of-order verse numbers
         if verse_num < last_verse:
             self.append_error('Verse out-of-order, ' + self.book_id + ' ' +
-                              str(found_chapter.number) + ':' + str(verse_num))
+                              str(found_chapter.number) + ':' + str(verse_num),
+                              code=error_collector.VERSE_OUT_OF_ORDER, chapter=found_chapter.number, verse=verse_num)
 
-        # look for duplicate verse numbers
-        if verse_num == last_verse or verse_num in processed_verses:
+        # look for duplicate verse numbers, add_verse returns the number of times the verse was already found
+        if found_chapter.add_verse(verse_num) or verse_num == last_verse:
             self.append_error('Duplicate verse, ' + self.book_id + ' ' +
-                              str(found_chapter.number) + ':' + str(verse_num))
+                              str(found_chapter.number) + ':' + str(verse_num),
+                              code=error_collector.DUPLICATE_VERSE, chapter=found_chapter.number, verse=verse_num)
 
         # remember for next time
         if verse_num > last_verse:
             last_verse = verse_num
 
-        processed_verses.append(verse_num)
-
         return last_verse
 
-    def append_error(self, message, prefix='** '):
+    def get_verse_coverage(self):
+        """
+        Totals the verse coverage of the chapters, after verify_chapters_and_verses has been run
+        :return: tuple of (verses found, verses expected)
+        """
+        found = 0
+        expected = 0
 
-        print_error(prefix + message)
+        for chapter in self.chapters:
+            found += chapter.count_found_verses()
+            expected += chapter.expected_max_verse_number
+
+        return found, expected
+
+    def append_error(self, message, prefix='** ', code=error_collector.OTHER, chapter=None, verse=None):
+        """
+        :param str|unicode message:
+        :param str|unicode prefix: Printed before the message
+        :param str code: One of the codes in error_collector
+        :param int chapter:
+        :param int|str verse:
+        """
+        record = ErrorRecord(self.book_id, chapter, verse, code, message)
         self.validation_errors.append(message)
+        self.error_records.append(record)
+        self.error_collector.add(record, prefix)
+
+    @property
+    def error_collector(self):
+        """
+        :return: ErrorCollector Prints the errors
+        """
+        return ErrorCollector.get_default()
 
     def get_chunks(self):
 
-        chunk_str = get_url(self.chunk_url.format(self.book_id.lower()))
+        chunk_str = get_cached_url(self.chunk_url.format(self.book_id.lower()))
         if not chunk_str:
             raise Exception('Could not load chunks for ' + self.book_id)
 
@@ -322,7 +571,7 @@ class Book(object):
         # chunk it
         for chapter in chunks_obj:
             for first_verse in chapter['first_verses']:
-                self.chunks.append(Chunk(chapter['chapter'], first_verse))
+                self.add_chunk(Chunk(chapter['chapter'], first_verse))
 
     def apply_chunks(self):
 
@@ -330,7 +579,7 @@ class Book(object):
             self.get_chunks()
 
         for chap in self.chapters:
-            chap.apply_chunks([c for c in self.chunks if c.chapter_num == chap.number])
+            chap.apply_chunks(self.get_chapter_chunks(chap.number))
 
         new_usfm = ''
         for chap in self.chapters:
@@ -342,45 +591,21 @@ class Book(object):
     @staticmethod
     def create_book(book_key):
         """
-        Returns the requested initialized Book object
+        Returns a new Book, with the chapters from the ufw versification
         :param str|unicode book_key: Either the 3 letter USFM code or a 6 character repo directory name, like 01-GEN.
         :return: Book|None
         """
         if not Book.book_skeletons:
+            vrs = versification.Versification.get('ufw')
 
-            # get the list of books
-            books = json.loads(get_url(Book.book_file))
-
-            # get the versification file
-            raw = get_url(Book.vrs_file)
-            lines = [l for l in raw.replace('\r', '').split('\n') if l and l[0:1] != '#']
-
-            scheme = []
+            for book in vrs.books:
+                if not vrs.has_chapters(book[0]):
+                    raise Exception('Could not load chapter information for ' + book[0])
 
-            for key, value in iter(books.items()):
+            Book.book_skeletons = vrs
 
-                book = Book(key, value[0], int(value[1]))
-
-                # find the key in the lines
-                line = [line for line in lines if line[0:3] == key]
-                if not line:
-                    raise Exception('Could not load chapter information for ' + key)
-
-                chapters = line[0][4:].split()
-                for chapter in chapters:
-                    parts = chapter.split(':')
-                    book.chapters.append(Chapter(int(parts[0]), int(parts[1])))
-                scheme.append(book)
-
-            Book.book_skeletons = scheme
-
-        # is the book_key a directory name?
-        if len(book_key) == 3:
-            found = [book for book in Book.book_skeletons if book.book_id == book_key]
-        else:
-            found = [book for book in Book.book_skeletons if book.dir_name == book_key]
-
-        return found[0] if found else None
+        # every caller gets a new Book, the skeletons are not changed
+        return Book.book_skeletons.create_book(book_key)
 
 
 class Chapter(object):
@@ -388,6 +613,9 @@ class Chapter(object):
     # lines that are just a \q tag
     q_alone_re = re.compile(r'^\\q[0-9a-z]*\s*$', re.UNICODE)
 
+    # the verse markers in a line, the verse number must be followed by white space or a dash
+    verse_marker_re = re.compile(r'\\v[\u00A0\s]([0-9]+)(?=[\s-])')
+
     def __init__(self, number, expected_max_verse_number):
         """
         :type number: int
@@ -399,11 +627,73 @@ class Chapter(object):
         self.found = False  # type: bool
         self.usfm = ''
 
-    def apply_chunks(self, chunks):
+        # one byte per verse number, counting the times the verse was found. Index 0 is not a verse.
+        self.verse_coverage = bytearray(expected_max_verse_number + 1)  # type: bytearray
+
+        # the times each verse number larger than expected_max_verse_number was found
+        self.extra_verses = {}  # type: dict<int, int>
+
+    def reset_coverage(self):
+        self.verse_coverage = bytearray(self.expected_max_verse_number + 1)
+        self.extra_verses = {}
+
+    def add_verse(self, verse_num):
+        """
+        Records that verse_num was found in the chapter text
+        :param int verse_num:
+        :return: int The number of times the verse was found before this one
+        """
+        coverage = self.verse_coverage
+
+        # verse numbers that are too large are counted separately, the text can contain any number
+        if verse_num >= len(coverage):
+            previous = self.extra_verses.get(verse_num, 0)
+            self.extra_verses[verse_num] = previous + 1
+            return previous
+
+        previous = coverage[verse_num]
+        if previous < 255:
+            coverage[verse_num] = previous + 1
+
+        return previous
+
+    def count_found_verses(self):
+        """
+        The number of expected verses that were found at least one time
+        :return: int
+        """
+        return self.expected_max_verse_number - self.verse_coverage.count(b'\x00', 1,
+                                                                          self.expected_max_verse_number + 1)
+
+    def get_missing_verses(self):
         """
+        :return: list<int> The expected verse numbers that were not found
+        """
+        coverage = self.verse_coverage
+        missing = []
+
+        verse_num = coverage.find(b'\x00', 1, self.expected_max_verse_number + 1)
+        while verse_num > -1:
+            missing.append(verse_num)
+            verse_num = coverage.find(b'\x00', verse_num + 1, self.expected_max_verse_number + 1)
+
+        return missing
 
+    def get_duplicate_verses(self):
+        """
+        :return: list<int> The verse numbers that were found more than one time
+        """
+        duplicates = [verse_num for verse_num, count in enumerate(self.verse_coverage) if count > 1]
+        return duplicates + sorted(verse_num for verse_num, count in self.extra_verses.items() if count > 1)
+
+    def apply_chunks(self, chunks):
+        """
+        Inserts a \\s5 marker at the beginning of each chunk. The chunks are expected in verse order.
         :type chunks: list<Chunk>
         """
+        # the verse number text that begins each chunk
+        first_verses = ['{0}'.format(chunk.first_verse) for chunk in chunks]
+        chunk_count = len(chunks)
         previous_line = ''
 
         # insert the first marker now
@@ -414,25 +704,22 @@ class Chapter(object):
             if line in ['', ' ', '\n']:
                 continue
 
-            if i < len(chunks):
+            if i < chunk_count:
 
                 # we already inserted the beginning marker
                 if chunks[i].first_verse == 1:
                     i += 1
 
-                if i < len(chunks):
-                    verse_search = re.search(r'\\v[\u00A0\s]{0}[\s-]'.format(chunks[i].first_verse), line)
-                    if verse_search:
+                # only one chunk can begin on each line
+                if i < chunk_count and '\\v' in line and first_verses[i] in self.verse_marker_re.findall(line):
 
-                        # insert before \p and \q, not after
-                        if previous_line == '\\p':
-                            newlines.insert(len(newlines) - 1, '\n\\s5')
-                        elif self.q_alone_re.search(previous_line):
-                            newlines.insert(len(newlines) - 1, '\n\\s5')
-                        else:
-                            newlines.append('\n\\s5')
+                    # insert before \p and \q, not after
+                    if previous_line == '\\p' or self.q_alone_re.search(previous_line):
+                        newlines[-1:] = ['\n\\s5', previous_line]
+                    else:
+                        newlines.append('\n\\s5')
 
-                        i += 1
+                    i += 1
 
             newlines.append(line)
             previous_line = line
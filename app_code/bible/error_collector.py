@@ -0,0 +1,172 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import json
+import threading
+from collections import namedtuple
+from general_tools.print_utils import FAIL, NOTICE, BOLD, ENDC
+
+# error codes
+GIT_CONFLICT = 'git-conflict'
+INVALID_CHAPTER_MARKER = 'invalid-chapter-marker'
+EMPTY_MARKER = 'empty-marker'
+MISSING_NUMBER = 'missing-number'
+INVALID_TAG = 'invalid-tag'
+VERSE_WITHOUT_TEXT = 'verse-without-text'
+INVALID_CHAPTER_NUMBER = 'invalid-chapter-number'
+VERSES_MISSING = 'verses-missing'
+INVALID_VERSE_BRIDGE = 'invalid-verse-bridge'
+INVALID_VERSE_NUMBER = 'invalid-verse-number'
+VERSE_NOT_FOUND = 'verse-not-found'
+VERSE_OUT_OF_ORDER = 'verse-out-of-order'
+DUPLICATE_VERSE = 'duplicate-verse'
+OTHER = 'other'
+
+# book:    the book id, like "PHP"
+# chapter: the chapter number, or None if the error is not in a chapter
+# verse:   the verse number, or the verse text for a bad verse bridge, or None
+# code:    one of the error codes above
+# message: the text that is printed, and kept in Book.validation_errors
+ErrorRecord = namedtuple('ErrorRecord', ['book', 'chapter', 'verse', 'code', 'message'])
+
+
+class ConsoleRenderer(object):
+    """
+    The human-readable output, the same as calling print_error for each error, but printed in batches
+    """
+
+    @staticmethod
+    def render_errors(messages):
+        """
+        :param list<str|unicode> messages:
+        """
+        print(''.join('\n' + FAIL + BOLD + 'ERROR: ' + ENDC + FAIL + m + ENDC + '\n' for m in messages), end='')
+
+    @staticmethod
+    def render_notice(message):
+        print('\n' + NOTICE + BOLD + 'NOTICE: ' + ENDC + NOTICE + message + ENDC)
+
+
+class ErrorCollector(object):
+    """
+    Receives the validation errors from Book.append_error. The errors are printed in batches by the renderer, and
+    only the first max_per_code errors of each code in a book are printed, followed by a line that says how many more
+    there were. Every error is still kept in the Book, see Book.error_records.
+    """
+
+    # do not access this directly, use ErrorCollector.get_default
+    default_collector = None
+
+    default_max_per_code = 100
+
+    # the most errors waiting to be printed
+    batch_size = 500
+
+    def __init__(self, renderer=None, max_per_code=None):
+        """
+        :param ConsoleRenderer renderer: Defaults to ConsoleRenderer
+        :param int max_per_code: The most errors of one code to print for a book, 0 for no limit
+        """
+        self.renderer = renderer if renderer else ConsoleRenderer()
+        self.max_per_code = self.default_max_per_code if max_per_code is None else max_per_code
+
+        self.pending = []      # type: list<str>  # messages waiting to be printed
+        self.book_counts = {}  # type: dict<tuple, int>  # (book, code): number of errors in the current check
+        self.totals = {}       # type: dict<str, int>  # code: number of errors in finished checks
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: ErrorCollector
+        """
+        if not ErrorCollector.default_collector:
+            ErrorCollector.default_collector = ErrorCollector()
+
+        return ErrorCollector.default_collector
+
+    def add(self, record, prefix='** '):
+        """
+        :param ErrorRecord record:
+        :param str|unicode prefix: Printed before the message
+        """
+        with self.lock:
+            key = (record.book, record.code)
+            count = self.book_counts.get(key, 0) + 1
+            self.book_counts[key] = count
+
+            if not self.max_per_code or count <= self.max_per_code:
+                self.pending.append(prefix + record.message)
+
+            if len(self.pending) < self.batch_size:
+                return
+
+        self.flush()
+
+    def flush(self):
+        """
+        Prints the errors that are waiting
+        """
+        with self.lock:
+            pending = self.pending
+            self.pending = []
+
+        if pending:
+            self.renderer.render_errors(pending)
+
+    def finish(self, book_id):
+        """
+        Call at the end of each check of a book. Prints the errors that are waiting, and how many were not printed.
+        :param str|unicode book_id:
+        """
+        self.flush()
+
+        with self.lock:
+            finished = sorted((key, count) for key, count in self.book_counts.items() if key[0] == book_id)
+            for key, count in finished:
+                del self.book_counts[key]
+                self.totals[key[1]] = self.totals.get(key[1], 0) + count
+
+        for (book, code), count in finished:
+            if self.max_per_code and count > self.max_per_code:
+                self.renderer.render_notice('{0} more "{1}" errors in {2} were not shown'.format(
+                    count - self.max_per_code, code, book))
+
+    def get_summary(self):
+        """
+        :return: dict<str, int> The number of errors of each code
+        """
+        with self.lock:
+            summary = dict(self.totals)
+            for (book, code), count in self.book_counts.items():
+                summary[code] = summary.get(code, 0) + count
+
+        return summary
+
+
+def get_summary(records):
+    """
+    :param list<ErrorRecord> records:
+    :return: dict<str, int> The number of errors of each code
+    """
+    summary = {}
+    for record in records:
+        summary[record.code] = summary.get(record.code, 0) + 1
+
+    return summary
+
+
+def write_report(records, file_name):
+    """
+    Writes the errors for other programs to read. If the file name ends with .jsonl each line is one error, otherwise
+    the file is one json object with the list of errors and the summary.
+    :param list<ErrorRecord> records:
+    :param str|unicode file_name:
+    """
+    with codecs.open(file_name, 'w', 'utf-8') as out_file:
+        if file_name.endswith('.jsonl'):
+            for record in records:
+                out_file.write(json.dumps(dict(record._asdict()), sort_keys=True) + '\n')
+        else:
+            report = {'errors': [dict(r._asdict()) for r in records], 'summary': get_summary(records)}
+            out_file.write(json.dumps(report, sort_keys=True, indent=2))
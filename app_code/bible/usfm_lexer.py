@@ -0,0 +1,133 @@
+from __future__ import unicode_literals
+from collections import namedtuple
+import re
+
+# token kinds
+CHAPTER = 'chapter'        # a chapter marker on a line by itself, like "\c 1"
+VERSE = 'verse'            # a verse marker followed by white space, like "\v 1 " or "\v 1-2 "
+MARKER = 'marker'          # any other back-slash, with the tag name following it (which may be empty)
+CONFLICT_START = 'conflict_start'  # <<<<<<<
+CONFLICT_MIDDLE = 'conflict_middle'  # =======
+CONFLICT_END = 'conflict_end'  # >>>>>>>
+
+# kind:     one of the token kinds above
+# marker:   the tag name without the back-slash, like "c", "v" or "q1" (None for git conflict markers)
+# number:   the chapter or verse number text, like "1" or "1-2" (None for other tokens)
+# start:    offset of the token in the USFM text
+# end:      offset of the end of the token, including the white space that belongs to a chapter or verse marker
+# text_end: offset of the next token, so the text span of this token is usfm[end:text_end]
+# line:     line number of the token, starting at 1
+# column:   column number of the token, starting at 1
+UsfmToken = namedtuple('UsfmToken', ['kind', 'marker', 'number', 'start', 'end', 'text_end', 'line', 'column'])
+
+
+class UsfmLexer(object):
+    """
+    Walks USFM text one time and produces a stream of tokens for all the markers in the text. Every back-slash in
+    the text is the start of exactly one token, so checks can be run against the token positions instead of
+    scanning the whole text again.
+
+    The chapter and verse tokens match the way Book has always split the text into chapters and verses.
+    """
+
+    # every alternative starts with a literal character, so the regular expression engine can skip ahead to the
+    # next candidate position instead of trying each alternative at every character
+    token_re = re.compile(r'\\(?:c[\u00A0 ](?P<chapter_num>[0-9]+)\s*\n'
+                          r'|v[\u00A0 ](?P<verse_num>[0-9-\u2013\u2014]*)\s+'
+                          r'|(?P<tag>[^\s\\<=>]*))'
+                          r'|<<<<<<<|=======|>>>>>>>', re.UNICODE)
+
+    conflict_kinds = {'<': CONFLICT_START, '=': CONFLICT_MIDDLE, '>': CONFLICT_END}
+
+    def __init__(self, usfm):
+        """
+        :param str|unicode usfm: The USFM text to tokenize
+        """
+        self.usfm = usfm
+
+    def __iter__(self):
+        return self.tokenize()
+
+    def tokenize(self):
+        """
+        Generator that yields a UsfmToken for every marker in the text, in order.
+        :return: generator<UsfmToken>
+        """
+        usfm = self.usfm
+        conflict_kinds = self.conflict_kinds
+        line = 1
+        line_start = 0
+        last_start = 0
+        pending = None
+
+        for match in self.token_re.finditer(usfm):
+            start = match.start()
+
+            # keep track of the line and column without another pass through the text
+            new_lines = usfm.count('\n', last_start, start)
+            if new_lines:
+                line += new_lines
+                line_start = usfm.rfind('\n', last_start, start) + 1
+            last_start = start
+
+            # the text span of the previous token ends where this one starts
+            if pending:
+                yield UsfmToken(pending[0], pending[1], pending[2], pending[3], pending[4], start, pending[5],
+                                pending[6])
+
+            group = match.lastgroup
+            if group == 'tag':
+                pending = (MARKER, match.group('tag'), None, start, match.end(), line, start - line_start + 1)
+            elif group == 'verse_num':
+                pending = (VERSE, 'v', match.group('verse_num'), start, match.end(), line, start - line_start + 1)
+            elif group == 'chapter_num':
+                pending = (CHAPTER, 'c', match.group('chapter_num'), start, match.end(), line,
+                           start - line_start + 1)
+            else:
+                pending = (conflict_kinds[usfm[start]], None, None, start, match.end(), line, start - line_start + 1)
+
+        if pending:
+            yield UsfmToken(pending[0], pending[1], pending[2], pending[3], pending[4], len(usfm), pending[5],
+                            pending[6])
+
+    @staticmethod
+    def count_conflicts(tokens):
+        """
+        Counts the complete git merge conflicts (<<<<<<< ... ======= ... >>>>>>>) in the token stream
+        :param list<UsfmToken> tokens:
+        :return: int
+        """
+        count = 0
+        expecting = CONFLICT_START
+
+        for token in tokens:
+            if token.kind != expecting:
+                continue
+
+            if expecting == CONFLICT_START:
+                expecting = CONFLICT_MIDDLE
+            elif expecting == CONFLICT_MIDDLE:
+                expecting = CONFLICT_END
+            else:
+                count += 1
+                expecting = CONFLICT_START
+
+        return count
+
+    @staticmethod
+    def is_tag(token):
+        """
+        Returns True if the token begins with a back-slash
+        :param UsfmToken token:
+        :return: bool
+        """
+        return token.kind in (CHAPTER, VERSE, MARKER)
+
+
+def tokenize(usfm):
+    """
+    Convenience function, returns a generator of the tokens in usfm
+    :param str|unicode usfm:
+    :return: generator<UsfmToken>
+    """
+    return UsfmLexer(usfm).tokenize()
@@ -0,0 +1,103 @@
+from __future__ import unicode_literals
+import re
+
+# the names of the counts returned by UsfmNormalizer.normalize
+CRLF = 'crlf'      # Windows line endings changed to \n
+NBSP = 'nbsp'      # non-breaking spaces after a USFM tag changed to a normal space
+BLANK = 'blank'    # runs of blank lines collapsed to one line break
+S5 = 's5'          # \s5 chunk markers removed, with the white space following them
+
+
+class UsfmNormalizer(object):
+    """
+    Makes all the requested clean-up changes to USFM text in one regular expression pass, instead of one copy of the
+    text per change.
+
+    The result is the same as making the changes one at a time in this order:
+      1. strip_s5: remove \\s5 and the white space and non-breaking spaces following it
+      2. crlf:     replace \\r\\n with \\n
+      3. nbsp:     replace a non-breaking space directly after a tag, like "\\v\\u00A0", with a normal space
+      4. collapse: replace two or more line breaks with one
+
+    The one exception is a \\s5 written directly between a tag and letters, like "\\q\\s5a\\u00A0". Removing it
+    one step at a time would join "\\qa" into a new tag before the nbsp step, this does not.
+
+    Line endings are changed with str.replace before the regular expression pass, and only if the text has any. That
+    is faster than a Python call for every line, and gives the same result because \\s5 removes the line break after
+    it either way.
+    """
+
+    # every alternative starts with a literal character outside of its group, so the regular expression engine can
+    # scan for those characters instead of trying every alternative at every position
+    patterns = [
+        (S5, r'\\(?P<s5>s5[\u00A0 \t\n\r\f\v]*)'),
+        (NBSP, r'\\(?P<nbsp>[a-z0-9]+)\u00A0'),
+        (BLANK, r'\n(?P<blank>\n+)'),
+    ]
+
+    # do not access this directly, use UsfmNormalizer.get
+    normalizers = {}
+
+    def __init__(self, crlf=True, nbsp=True, collapse=False, strip_s5=False):
+        """
+        :param bool crlf: Replace Windows line endings
+        :param bool nbsp: Replace non-breaking spaces after tags
+        :param bool collapse: Remove blank lines
+        :param bool strip_s5: Remove \\s5 chunk markers
+        """
+        self.crlf = crlf
+        self.nbsp = nbsp
+        self.collapse = collapse
+        self.strip_s5 = strip_s5
+
+        enabled = {S5: strip_s5, NBSP: nbsp, BLANK: collapse}
+        alternatives = [pattern for name, pattern in self.patterns if enabled[name]]
+        self.normalize_re = re.compile('|'.join(alternatives)) if alternatives else None
+
+    @staticmethod
+    def get(crlf=True, nbsp=True, collapse=False, strip_s5=False):
+        """
+        Returns a shared normalizer for these options, so the regular expression is only compiled one time
+        :return: UsfmNormalizer
+        """
+        key = (crlf, nbsp, collapse, strip_s5)
+        if key not in UsfmNormalizer.normalizers:
+            UsfmNormalizer.normalizers[key] = UsfmNormalizer(crlf, nbsp, collapse, strip_s5)
+
+        return UsfmNormalizer.normalizers[key]
+
+    def normalize(self, usfm):
+        """
+        :param str|unicode usfm:
+        :return: tuple of (the normalized text, dict of the number of each kind of change)
+        """
+        counts = {CRLF: 0, NBSP: 0, BLANK: 0, S5: 0}
+
+        if self.crlf and '\r\n' in usfm:
+            counts[CRLF] = usfm.count('\r\n')
+            usfm = usfm.replace('\r\n', '\n')
+
+        if not self.normalize_re:
+            return usfm, counts
+
+        def replace(match):
+            kind = match.lastgroup
+            counts[kind] += 1
+
+            if kind == S5:
+                return ''
+
+            if kind == NBSP:
+                return match.group()[:-1] + ' '
+
+            return '\n'
+
+        return self.normalize_re.sub(replace, usfm), counts
+
+
+def normalize(usfm, crlf=True, nbsp=True, collapse=False, strip_s5=False):
+    """
+    Convenience function, see UsfmNormalizer
+    :return: tuple of (the normalized text, dict of the number of each kind of change)
+    """
+    return UsfmNormalizer.get(crlf, nbsp, collapse, strip_s5).normalize(usfm)
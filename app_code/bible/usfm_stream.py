@@ -0,0 +1,197 @@
+from __future__ import print_function, unicode_literals
+import io
+import re
+import usfm_lexer
+import usfm_normalizer
+import versification
+
+
+class UsfmStreamVerifier(object):
+    """
+    Runs the checks of Book.verify_chapters_and_verses on a USFM file one chapter at a time, for files that are too
+    big to check as one string, like a whole Bible exported as a single file. Each \\id marker in the file starts a
+    new book.
+
+    The file is read and normalized in pieces of whole lines, and the text is split at the chapter markers the same
+    way UsfmLexer finds them. Only the current piece and the current chapter are in memory, with the per-chapter
+    results in the Book. The errors are the same as checking the normalized text of each book with
+    Book.verify_chapters_and_verses, but they are reported chapter by chapter, with the git conflicts at the end of
+    the book.
+    """
+
+    # the places the text is split: chapter markers, and the \id marker that starts a book
+    split_re = re.compile(r'\\(?:c[\u00A0 ](?P<chapter_num>[0-9]+)\s*\n|id[\u00A0\s](?P<book_id>\w{3}))', re.UNICODE)
+
+    # the white space that can follow \s5, which is removed with it
+    s5_space = '\u00A0 \t\n\r\f\v'
+
+    conflict_kinds = (usfm_lexer.CONFLICT_START, usfm_lexer.CONFLICT_MIDDLE, usfm_lexer.CONFLICT_END)
+
+    def __init__(self, scheme, strip_s5=True, piece_size=65536):
+        """
+        :param str|unicode scheme: The versification scheme
+        :param bool strip_s5: Remove the \\s5 chunk markers, like Book.set_usfm
+        :param int piece_size: About how many characters to read and normalize at a time
+        """
+        self.scheme = scheme
+        self.strip_s5 = strip_s5
+        self.piece_size = piece_size
+
+        # the book being checked, and its state between chapters
+        self.book = None         # type: Book
+        self.ends = None         # type: list<int>
+        self.line_offset = 0     # type: int
+        self.conflicts = []      # type: list<UsfmToken>
+        self.in_header = False   # type: bool
+
+    def verify_file(self, file_name):
+        """
+        Checks the books in the file, yielding each one when it is finished
+        :param str|unicode file_name:
+        :return: generator<Book>
+        """
+        with io.open(file_name, 'r', encoding='utf-8', newline='\n') as in_file:
+            for book in self.verify_pieces(self.read_pieces(in_file), file_name):
+                yield book
+
+    def read_pieces(self, lines):
+        """
+        Normalizes the text in pieces of whole lines. A piece never ends inside a \\s5 marker and the white space
+        following it, so the result is the same as normalizing all the text at once.
+        :param iterable<str|unicode> lines:
+        :return: generator<str|unicode>
+        """
+        piece = []
+        size = 0
+        in_s5 = False
+
+        for line in lines:
+            piece.append(line)
+            size += len(line)
+
+            # is the white space after a \s5 marker still going at the end of this line?
+            if self.strip_s5:
+                text = line.rstrip(self.s5_space)
+                if text:
+                    in_s5 = text.endswith('\\s5')
+
+            if size < self.piece_size or in_s5:
+                continue
+
+            yield usfm_normalizer.normalize(''.join(piece), crlf=True, nbsp=True, strip_s5=self.strip_s5)[0]
+            piece = []
+            size = 0
+
+        if piece:
+            yield usfm_normalizer.normalize(''.join(piece), crlf=True, nbsp=True, strip_s5=self.strip_s5)[0]
+
+    def verify_pieces(self, pieces, file_name=''):
+        """
+        :param iterable<str|unicode> pieces: Normalized USFM text, each piece ending with a complete line
+        :param str|unicode file_name: For the error messages
+        :return: generator<Book>
+        """
+        block = []  # type: list<str|unicode>
+
+        for piece in pieces:
+            block_start = 0
+
+            # a cheap test first, most pieces in a chapter have no split
+            if '\\c' in piece or '\\id' in piece:
+                for split in self.split_re.finditer(piece):
+                    start = split.start()
+                    block.append(piece[block_start:start])
+
+                    # the first line of the next block finishes the messages about the last line of this one
+                    line_end = piece.find('\n', start)
+                    lookahead = piece[start:line_end + 1] if line_end > -1 else piece[start:]
+
+                    if split.group('book_id'):
+                        if self.book:
+                            self.check_block(''.join(block), lookahead)
+                            yield self.finish_book()
+                            block = []
+
+                        # any text before the first book id is part of the first book, like Book.set_usfm
+                        self.start_book(split.group('book_id'))
+
+                    elif not self.book:
+                        raise Exception('Book id not found in {0}'.format(file_name))
+
+                    else:
+                        self.check_block(''.join(block), lookahead)
+                        self.in_header = False
+                        block = []
+
+                    block_start = start
+
+            block.append(piece[block_start:])
+
+        if not self.book:
+            raise Exception('Book id not found in {0}'.format(file_name))
+
+        self.check_block(''.join(block), '')
+        yield self.finish_book()
+
+    def start_book(self, book_id):
+        """
+        :param str|unicode book_id:
+        """
+        vrs = versification.Versification.get(self.scheme)
+        if not vrs.has_chapters(book_id):
+            raise Exception('Book versification data was not found for "{}"'.format(book_id))
+
+        self.book = vrs.create_book(book_id)
+        self.ends = [-1, -1, -1]
+        self.line_offset = 0
+        self.conflicts = []
+        self.in_header = True
+
+        print('Verifying ' + book_id + '... ', end=' ')
+
+    def check_block(self, text, lookahead):
+        """
+        Checks the text of the book header or of one chapter, starting with the chapter marker
+        :param str|unicode text:
+        :param str|unicode lookahead: The first line of the text that follows
+        """
+        book = self.book
+        usfm = text + lookahead
+        tokens = [t for t in usfm_lexer.tokenize(usfm) if t.start < len(text)]
+
+        self.conflicts.extend(t for t in tokens if t.kind in self.conflict_kinds)
+
+        book.append_marker_errors(*book.check_markers(usfm, tokens, self.ends, self.line_offset, len(text)))
+
+        if self.in_header:
+            book.header_usfm = text.rstrip()
+
+        elif tokens and tokens[0].kind == usfm_lexer.CHAPTER:
+            book.check_chapter(tokens[0], tokens[1:])
+
+        # print the errors of each chapter when it is finished
+        book.error_collector.flush()
+
+        # the positions of the next block start at zero
+        self.ends[0] -= len(text)
+        self.ends[2] -= len(text)
+        self.line_offset += text.count('\n')
+
+    def finish_book(self):
+        """
+        :return: Book
+        """
+        book = self.book
+        book.append_conflict_errors(usfm_lexer.UsfmLexer.count_conflicts(self.conflicts))
+        book.error_collector.finish(book.book_id)
+
+        self.book = None
+        return book
+
+
+def verify_file(file_name, scheme, strip_s5=True):
+    """
+    Convenience function, see UsfmStreamVerifier
+    :return: generator<Book>
+    """
+    return UsfmStreamVerifier(scheme, strip_s5).verify_file(file_name)
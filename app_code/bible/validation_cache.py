@@ -0,0 +1,190 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import hashlib
+import json
+import os
+import threading
+import time
+from app_code.bible.versification import Versification
+from app_code.util import app_utils
+from app_code.util.url_cache import UrlCache
+
+# the checks that can be run on a book, see verify_book
+CHAPTERS = 'chapters'  # Book.verify_chapters_and_verses
+TAGS = 'tags'          # Book.verify_usfm_tags
+
+
+class ValidationCache(object):
+    """
+    Remembers the validation errors of books that have already been checked, so an unchanged book does not have to be
+    checked again.
+
+    An entry is found by the SHA-1 of the normalized USFM, the book id, the versification scheme and the hash of the
+    versification data it was compiled from, the checks that were run and Book.checker_version, and is stored as a
+    small json file in <cache_dir>/validation. The modified time of the file is updated each time the entry is used,
+    see prune.
+    """
+
+    # do not access this directly, use ValidationCache.get_default
+    default_cache = None
+
+    # entries not used in this many days are removed by prune
+    default_max_age_days = 30
+
+    def __init__(self, cache_dir=None, enabled=True):
+        """
+        :param str|unicode cache_dir: Defaults to the validation directory in app_utils.get_cache_dir()
+        :param bool enabled: If False, nothing is read from the cache, but the results are still saved
+        """
+        self.cache_dir = cache_dir if cache_dir else os.path.join(app_utils.get_cache_dir(), 'validation')
+        self.enabled = enabled
+
+        self.hits = 0    # type: int
+        self.misses = 0  # type: int
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: ValidationCache
+        """
+        if not ValidationCache.default_cache:
+            ValidationCache.default_cache = ValidationCache()
+
+        return ValidationCache.default_cache
+
+    @staticmethod
+    def get_key(book_id, usfm, scheme, checks, checker_version):
+        """
+        :param str|unicode book_id:
+        :param str|unicode usfm: The normalized USFM of the book
+        :param str|unicode scheme: The versification scheme
+        :param list<str> checks: The checks that were run, CHAPTERS and/or TAGS
+        :param int checker_version: Book.checker_version
+        :return: str
+        """
+        # the versification data can change upstream, then the chapters and verses have to be checked again
+        source_hash = Versification.get(scheme).source_hash
+        sha = hashlib.sha1(json.dumps([checker_version, scheme, source_hash, book_id, sorted(checks)]).encode('utf-8'))
+        sha.update(b'\n')
+        sha.update(usfm.encode('utf-8'))
+        return sha.hexdigest()
+
+    def entry_file(self, key):
+        return os.path.join(self.cache_dir, key[:2], key + '.json')
+
+    def get_errors(self, key):
+        """
+        :param str key: From get_key
+        :return: list|None The validation errors as [chapter, verse, code, message], or None if the book has not been
+                 checked
+        """
+        file_name = self.entry_file(key)
+        if not self.enabled or not os.path.isfile(file_name):
+            self.count('misses')
+            return None
+
+        try:
+            with codecs.open(file_name, 'r', 'utf-8') as in_file:
+                entry = json.loads(in_file.read())
+
+            # remember that the entry is still being used
+            os.utime(file_name, None)
+
+        except (IOError, OSError, ValueError):
+            self.count('misses')
+            return None
+
+        self.count('hits')
+        return entry['errors']
+
+    def save_errors(self, key, book_id, scheme, checker_version, records):
+        """
+        :param str key: From get_key
+        :param str|unicode book_id:
+        :param str|unicode scheme:
+        :param int checker_version:
+        :param list<ErrorRecord> records:
+        """
+        errors = [[r.chapter, r.verse, r.code, r.message] for r in records]
+        entry = {'book_id': book_id, 'scheme': scheme, 'checker_version': checker_version, 'errors': errors}
+        UrlCache.write_atomic(self.entry_file(key), json.dumps(entry, sort_keys=True).encode('utf-8'))
+
+    def prune(self, checker_version, max_age_days=None):
+        """
+        Removes the entries for other checker versions, and the entries that have not been used in max_age_days
+        :param int checker_version: Book.checker_version
+        :param int max_age_days: Defaults to default_max_age_days
+        :return: tuple of (number of entries removed, number of entries kept)
+        """
+        max_age_days = self.default_max_age_days if max_age_days is None else max_age_days
+        oldest = time.time() - max_age_days * 24 * 60 * 60
+        removed = kept = 0
+
+        if not os.path.isdir(self.cache_dir):
+            return removed, kept
+
+        for root, dirs, files in os.walk(self.cache_dir):
+            for file_name in files:
+                file_name = os.path.join(root, file_name)
+
+                try:
+                    with codecs.open(file_name, 'r', 'utf-8') as in_file:
+                        version = json.loads(in_file.read()).get('checker_version')
+                    stale = version != checker_version or os.path.getmtime(file_name) < oldest
+
+                except (IOError, OSError, ValueError):
+                    stale = True
+
+                if stale:
+                    os.remove(file_name)
+                    removed += 1
+                else:
+                    kept += 1
+
+        return removed, kept
+
+    def count(self, counter):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_stats(self):
+        return 'Validation cache: {0} hits, {1} misses'.format(self.hits, self.misses)
+
+
+def verify_book(book, scheme, checks=(CHAPTERS,), split_chapters=True, cache=None):
+    """
+    Runs the checks on the book, unless the same USFM has already been checked. Call book.set_usfm first.
+
+    When the errors come from the cache they are printed again and put in book.validation_errors, the same as if the
+    checks had been run. If split_chapters is True the chapters are still split and filled in, for apply_chunks.
+    :param Book book:
+    :param str|unicode scheme: The versification scheme
+    :param list<str> checks: TAGS and/or CHAPTERS
+    :param bool split_chapters:
+    :param ValidationCache cache: Defaults to ValidationCache.get_default()
+    :return: bool True if the errors came from the cache
+    """
+    cache = cache if cache else ValidationCache.get_default()
+    key = cache.get_key(book.book_id, book.usfm, scheme, checks, book.checker_version)
+    errors = cache.get_errors(key)
+
+    if errors is None:
+        if TAGS in checks:
+            book.verify_usfm_tags()
+        if CHAPTERS in checks:
+            book.verify_chapters_and_verses(True)
+
+        cache.save_errors(key, book.book_id, scheme, book.checker_version, book.error_records)
+        return False
+
+    print('Verifying ' + book.book_id + ' (unchanged)... ', end=' ')
+    for chapter, verse, code, message in errors:
+        book.append_error(message, code=code, chapter=chapter, verse=verse)
+    book.error_collector.finish(book.book_id)
+
+    if split_chapters:
+        book.split_chapters()
+
+    return True
@@ -0,0 +1,281 @@
+from __future__ import unicode_literals
+import codecs
+import hashlib
+import json
+import os
+import sys
+import time
+from array import array
+from collections import namedtuple
+import content
+from app_code.util import app_utils
+from app_code.util.url_cache import UrlCache
+
+
+class BookSkeleton(namedtuple('BookSkeleton', ['book_id', 'name', 'number', 'dir_name', 'chapters'])):
+    """
+    The read-only information about a book in a versification. chapters is a tuple of (chapter number, max verse).
+    Use create_book to get a Book to work with, the skeleton itself is shared.
+    """
+    __slots__ = ()
+
+    def create_book(self):
+        """
+        :return: Book A new Book with its chapters
+        """
+        book = content.Book(self.book_id, self.name, self.number)
+        for chapter_num, max_verse in self.chapters:
+            book.add_chapter(content.Chapter(chapter_num, max_verse))
+
+        return book
+
+
+class Versification(object):
+    """
+    The books, chapters and verse counts of one versification scheme, compiled from books.json and the .vrs file.
+
+    The compiled data is saved in the url cache directory as one file per scheme: a line of json with the books,
+    followed by the verse counts as unsigned 16-bit integers. Each book has one slot per chapter, so the maximum verse
+    number of a chapter is an index into the array.
+    """
+
+    # TODO: change these to point to the API when it is available
+    api_root = 'https://raw.githubusercontent.com/unfoldingWord-dev/uw-api/develop/static'
+    vrs_file = api_root + '/versification/{0}/{0}.vrs'
+    book_file = api_root + '/versification/{0}/books.json'
+
+    # change this when the compiled file format changes
+    file_format = 1
+
+    # do not access this directly, use Versification.get
+    loaded = {}  # type: dict<str, Versification>
+
+    # the scheme of each language and slug, see resolve_scheme
+    schemes_file = os.path.join(app_utils.get_static_dir(), 'versification-schemes.json')
+
+    # do not access this directly, use Versification.get_schemes
+    schemes = None  # type: dict
+
+    def __init__(self, scheme, books, verse_counts, source_hash):
+        """
+        :param str|unicode scheme: The name of the scheme, like "ufw"
+        :param list books: [book_id, name, number, offset, chapter_count] for each book, in book number order
+        :param array verse_counts: The verse counts of all the chapters of all the books
+        :param str|unicode source_hash: SHA-1 of the books.json and .vrs text this was compiled from
+        """
+        self.scheme = scheme
+        self.books = books
+        self.verse_counts = verse_counts
+        self.source_hash = source_hash
+        self.book_index = dict((book[0], book) for book in books)  # type: dict<str, list>
+
+        # the skeletons can be found by book_id or by dir_name, like "51-PHP"
+        self.skeletons = {}  # type: dict<str, BookSkeleton>
+        for book in books:
+            skeleton = self.create_skeleton(book)
+            self.skeletons[skeleton.book_id] = skeleton
+            self.skeletons[skeleton.dir_name] = skeleton
+
+    @staticmethod
+    def get(scheme):
+        """
+        Returns the compiled versification, loading or compiling it only the first time
+        :param str|unicode scheme:
+        :return: Versification
+        """
+        if scheme not in Versification.loaded:
+            Versification.loaded[scheme] = Versification.load(scheme)
+
+        return Versification.loaded[scheme]
+
+    @staticmethod
+    def get_schemes():
+        """
+        Reads schemes_file the first time it is needed
+        :return: dict {'default': scheme, 'languages': {lang: scheme}, 'slugs': {slug: scheme}}
+        """
+        if Versification.schemes is None:
+            with codecs.open(Versification.schemes_file, 'r', 'utf-8') as in_file:
+                schemes = json.loads(in_file.read())
+
+            # slugs are matched without case, like "ulb-sr-latn" in status.json
+            schemes['slugs'] = dict((slug.lower(), scheme) for slug, scheme in schemes.get('slugs', {}).items())
+            Versification.schemes = schemes
+
+        return Versification.schemes
+
+    @staticmethod
+    def resolve_scheme(lang, slug=None):
+        """
+        Finds the versification scheme of a Bible in schemes_file. A slug in the file takes precedence over the
+        language, and a Bible that is not in the file uses the default scheme.
+        :param str|unicode lang: The language code, like "sr-Latn"
+        :param str|unicode slug: Like "ulb-sr-latn"
+        :return: str|unicode
+        """
+        schemes = Versification.get_schemes()
+
+        if slug and slug.lower() in schemes['slugs']:
+            return schemes['slugs'][slug.lower()]
+
+        return schemes['languages'].get(lang, schemes['default'])
+
+    @staticmethod
+    def get_compiled_file(scheme):
+        return os.path.join(UrlCache.get_default().cache_dir, 'versification', scheme + '.bin')
+
+    @staticmethod
+    def load(scheme):
+        """
+        Reads the compiled file if it is still current, otherwise compiles it again from the source files
+        :param str|unicode scheme:
+        :return: Versification
+        """
+        cache = UrlCache.get_default()
+        file_name = Versification.get_compiled_file(scheme)
+        compiled = Versification.read_compiled(scheme, file_name)
+
+        # the compiled file is current for as long as the cached source files are
+        if compiled and (cache.offline or time.time() - os.path.getmtime(file_name) < cache.ttl):
+            return compiled
+
+        books_json = cache.get_url(Versification.book_file.format(scheme))
+        vrs = cache.get_url(Versification.vrs_file.format(scheme))
+        source_hash = hashlib.sha1((books_json + '\n' + vrs).encode('utf-8')).hexdigest()
+
+        if compiled and compiled.source_hash == source_hash:
+            os.utime(file_name, None)
+            return compiled
+
+        compiled = Versification.compile(scheme, books_json, vrs, source_hash)
+        compiled.write_compiled(file_name)
+        return compiled
+
+    @staticmethod
+    def compile(scheme, books_json, vrs, source_hash=''):
+        """
+        :param str|unicode scheme:
+        :param str|unicode books_json: The text of books.json, {book_id: [name, number], ...}
+        :param str|unicode vrs: The text of the .vrs file, one line per book like "PHP 1:30 2:30 3:21 4:23"
+        :param str|unicode source_hash:
+        :return: Versification
+        """
+        # index the vrs lines by book id, so each book does not have to search all the lines
+        vrs_lines = {}
+        for line in vrs.replace('\r', '').split('\n'):
+            if line and line[0:1] != '#':
+                vrs_lines.setdefault(line[0:3], line)
+
+        books_obj = json.loads(books_json)
+        books = []
+        verse_counts = array(str('H'))
+
+        for book_id in sorted(books_obj, key=lambda k: (int(books_obj[k][1]), k)):
+            name, number = books_obj[book_id][0], int(books_obj[book_id][1])
+
+            # books without a line in the vrs file have no chapters
+            chapters = {}
+            if book_id in vrs_lines:
+                for chapter in vrs_lines[book_id][4:].split():
+                    parts = chapter.split(':')
+                    chapters.setdefault(int(parts[0]), int(parts[1]))
+
+            chapter_count = max(chapters) if chapters else 0
+            books.append([book_id, name, number, len(verse_counts), chapter_count])
+            verse_counts.extend(chapters.get(c, 0) for c in range(1, chapter_count + 1))
+
+        return Versification(scheme, books, verse_counts, source_hash)
+
+    @staticmethod
+    def read_compiled(scheme, file_name):
+        """
+        :return: Versification|None None if the file does not exist or is not in the current format
+        """
+        if not os.path.isfile(file_name):
+            return None
+
+        with open(file_name, 'rb') as in_file:
+            data = in_file.read()
+
+        header_end = data.find(b'\n')
+        try:
+            header = json.loads(data[:header_end].decode('utf-8'))
+        except ValueError:
+            return None
+
+        if header.get('format') != Versification.file_format:
+            return None
+
+        verse_counts = array(str('H'))
+        if hasattr(verse_counts, 'frombytes'):
+            verse_counts.frombytes(data[header_end + 1:])
+        else:
+            verse_counts.fromstring(data[header_end + 1:])
+
+        # the file is always little-endian
+        if sys.byteorder == 'big':
+            verse_counts.byteswap()
+
+        return Versification(scheme, header['books'], verse_counts, header['source_hash'])
+
+    def write_compiled(self, file_name):
+        header = {'format': self.file_format, 'scheme': self.scheme, 'books': self.books,
+                  'source_hash': self.source_hash}
+
+        verse_counts = array(str('H'), self.verse_counts)
+        if sys.byteorder == 'big':
+            verse_counts.byteswap()
+
+        data = verse_counts.tobytes() if hasattr(verse_counts, 'tobytes') else verse_counts.tostring()
+        UrlCache.write_atomic(file_name, json.dumps(header, sort_keys=True).encode('utf-8') + b'\n' + data)
+
+    def get_max_verse(self, book_id, chapter_num):
+        """
+        :param str|unicode book_id:
+        :param int chapter_num:
+        :return: int The number of verses in the chapter, or 0 if the book or chapter is not in this versification
+        """
+        book = self.book_index.get(book_id)
+        if not book or chapter_num < 1 or chapter_num > book[4]:
+            return 0
+
+        return self.verse_counts[book[3] + chapter_num - 1]
+
+    def has_chapters(self, book_id):
+        book = self.book_index.get(book_id)
+        return bool(book and book[4])
+
+    def create_skeleton(self, book):
+        """
+        :param list book: [book_id, name, number, offset, chapter_count]
+        :return: BookSkeleton
+        """
+        book_id, name, number, offset, chapter_count = book
+        chapters = tuple((chapter_num, self.verse_counts[offset + chapter_num - 1])
+                         for chapter_num in range(1, chapter_count + 1)
+                         if self.verse_counts[offset + chapter_num - 1])
+
+        return BookSkeleton(book_id, name, number, str(number).zfill(2) + '-' + book_id, chapters)
+
+    def get_skeleton(self, book_key):
+        """
+        :param str|unicode book_key: Either the 3 letter USFM code or a repo directory name, like 51-PHP
+        :return: BookSkeleton|None
+        """
+        return self.skeletons.get(book_key)
+
+    def create_book(self, book_key):
+        """
+        Returns a new Book with its chapters, or None if the book is not in this versification
+        :param str|unicode book_key: Either the 3 letter USFM code or a repo directory name, like 51-PHP
+        :return: Book|None
+        """
+        skeleton = self.skeletons.get(book_key)
+        return skeleton.create_book() if skeleton else None
+
+    def create_books(self):
+        """
+        Returns a new Book for each book that has chapters in this versification
+        :return: list<Book>
+        """
+        return [self.skeletons[book[0]].create_book() for book in self.books if book[4]]
@@ -15,15 +15,32 @@ This script publishes the Unlocked Bible into the tS v2 API.
 """
 
 from __future__ import print_function, unicode_literals
-from usfm_tools.transform import UsfmTransform
+from usfm_tools.support.books import bookID, silNames
+from usfm_tools.support.parseUsfm import parseString
+from usfm_tools.support.usxRenderer import USXRenderer
+import hashlib
+import io
+import json
 import os
 import re
 import sys
-import codecs
-import shutil
+import time
 import argparse
 import datetime
-from general_tools.file_utils import write_file
+from collections import namedtuple
+from multiprocessing import Pool
+from general_tools.print_utils import print_warning, print_ok
+from app_code.util.compressor import Compressor
+from app_code.util import app_utils, output_writer
+from app_code.util.output_writer import OutputWriter, write_json
+
+# the result of publishing one book, see api_publish.publish_book
+# file_name: the USFM file the book came from
+# sha1:      the hash of the USFM, see api_publish.get_hash
+# skipped:   True if the book had not changed since it was last published
+# files_written: the output files that were written, the others already had the same content
+BookResult = namedtuple('BookResult', ['ver', 'lang', 'slug', 'file_name', 'sha1', 'skipped', 'files_written',
+                                       'bytes_written', 'seconds'])
 
 
 class api_publish(object):
@@ -36,36 +53,139 @@ class api_publish(object):
 
     api_v2 = '/var/www/vhosts/api.unfoldingword.org/httpdocs/ts/txt/2/'
     verse_re = re.compile(r'<verse number="([0-9]*)', re.UNICODE)
+    chunk_marker = '<note caller="u" style="s5"></note>'
+
+    # the files written for each book
+    output_files = ('source.json', 'chunks.json')
+
+    # change this when the output changes for the same USFM, so every book is published again
+    output_version = 1
 
-    def __init__(self, source):
+    def __init__(self, source, jobs=1, force=False):
+        """
+        :param str|unicode|list source: The directory to publish, a list of directories, or False to publish every
+                                        language in source_dirs
+        :param int jobs: The number of books to publish at the same time
+        :param bool force: Publish every book, even if it has not changed since it was last published
+        """
         self.source = source
+        self.jobs = jobs
+        self.force = force
 
-        # remember these so we can delete them
-        self.temp_dir = ''
+        # the manifest of each language that is being published, by source directory
+        self.manifests = {}  # type: dict<str, dict>
 
     def __enter__(self):
         return self
 
     # noinspection PyUnusedLocal
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # delete temp files
-        if os.path.isdir(self.temp_dir):
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
+        pass
+
+    @staticmethod
+    def read_book(source_dir, file_name, usfm_text=None):
+        """
+        Gets the USFM of a book the same way UsfmTransform.buildUSX does
+        :param str|unicode source_dir:
+        :param str|unicode file_name:
+        :param str|unicode usfm_text: The text of the file, if it is already in memory
+        :return: tuple of (book id, USFM), or None if the file is not a book
+        """
+        full_file_name = os.path.join(source_dir, file_name)
+        if not os.path.isfile(full_file_name) or file_name[-4:].lower() in ['.pdf', '.sig']:
+            return None
+
+        if usfm_text is not None:
+            # the same text as reading the file back: universal line endings and no byte order mark
+            usfm = usfm_text.replace('\r\n', '\n').replace('\r', '\n')
+            if usfm.startswith('\ufeff'):
+                usfm = usfm[1:]
+        else:
+            try:
+                with io.open(full_file_name, 'r', encoding='utf-8-sig') as in_file:
+                    usfm = in_file.read()
+            except (IOError, UnicodeDecodeError):
+                print_warning('Could not open {0}'.format(full_file_name))
+                return None
+
+        usfm = usfm.lstrip()
+        if usfm[:4] == '\\id ' and usfm[4:7] in silNames:
+            return bookID(usfm), usfm
+
+        return None
+
+    @staticmethod
+    def load_books(source_dir, usfm_texts=None):
+        """
+        Gets the USFM of the books in the directory, from the same files UsfmTransform.buildUSX uses
+        :param str|unicode source_dir:
+        :param dict<str, str|unicode> usfm_texts: The text of files that are already in memory, by file name
+        :return: dict<str, str|unicode> The USFM of each book, by book id
+        """
+        usfm_texts = usfm_texts if usfm_texts else {}
+        books = {}
+
+        for file_name in os.listdir(source_dir):
+            book = api_publish.read_book(source_dir, file_name, usfm_texts.get(file_name))
+            if book:
+                books[book[0]] = book[1]
+
+        return books
+
+    @staticmethod
+    def render_usx(book_id, usfm):
+        """
+        Converts the USFM of a book to USX in memory, the same text UsfmTransform.buildUSX writes to the .usx file
+        :param str|unicode book_id:
+        :param str|unicode usfm:
+        :return: str|unicode
+        """
+        renderer = USXRenderer('', '', '', True)
+        renderer.renderBook = book_id
+        renderer.f = io.StringIO()
+
+        for token in parseString(usfm):
+            token.renderOn(renderer)
+        renderer.f.write(renderer.stop_all())
+
+        return renderer.f.getvalue()
 
     @staticmethod
     def parse(usx):
         """
         Iterates through the source and splits it into frames based on the
-        s5 markers.
-        :param usx:
+        s5 markers. The chunks are listed at the same time.
+        :param list<str|unicode> usx: The lines of the USX
+        :return: tuple of (chapters, chunks)
         """
-        chunk_marker = '<note caller="u" style="s5"></note>'
         chapters = []
+        chunks = []
         chp = ''
-        fr_id = 0
         chp_num = 0
         fr_list = []
         current_vs = -1
+
+        def append_frame(frame_num, fr_text, first_vs):
+            frame_id = '{0}-{1}'.format(str(chp_num).zfill(2), frame_num.zfill(2))
+            chp['frames'].append({'id': frame_id,
+                                  'img': '',
+                                  'format': 'usx',
+                                  'text': fr_text,
+                                  'lastvs': current_vs
+                                  })
+            chunks.append({'id': frame_id,
+                           'firstvs': first_vs,
+                           'lastvs': current_vs
+                           })
+
+        def first_verse(fr_text, message):
+            match = api_publish.verse_re.search(fr_text)
+            if not match:
+                print('{0}, chp {1}'.format(message, chp_num))
+                print('Text: {0}'.format(fr_text))
+                sys.exit(1)
+            return match.group(1)
+
         for line in usx:
             if line.startswith('\n'):
                 continue
@@ -77,19 +197,8 @@ class api_publish(object):
                 if chp:
                     if fr_list:
                         fr_text = '\n'.join(fr_list)
-                        try:
-                            first_vs = api_publish.verse_re.search(fr_text).group(1)
-                        except AttributeError:
-                            print('myError, chp {0}'.format(chp_num))
-                            print('Text: {0}'.format(fr_text))
-                            sys.exit(1)
-                        chp['frames'].append({'id': '{0}-{1}'.format(
-                            str(chp_num).zfill(2), first_vs.zfill(2)),
-                            'img': '',
-                            'format': 'usx',
-                            'text': fr_text,
-                            'lastvs': current_vs
-                        })
+                        first_vs = first_verse(fr_text, 'myError')
+                        append_frame(first_vs, fr_text, first_vs)
                     chapters.append(chp)
                 chp_num += 1
                 chp = {'number': str(chp_num).zfill(2),
@@ -100,34 +209,22 @@ class api_publish(object):
                 fr_list = []
                 continue
 
-            if chunk_marker in line:
+            if api_publish.chunk_marker in line:
                 if chp_num == 0:
                     continue
 
                 # is there something else on the line with it? (probably an end-of-paragraph marker)
-                if len(line.strip()) > len(chunk_marker):
+                if len(line.strip()) > len(api_publish.chunk_marker):
                     # get the text following the chunk marker
-                    rest_of_line = line.replace(chunk_marker, '')
+                    rest_of_line = line.replace(api_publish.chunk_marker, '')
 
                     # append the text to the previous line, removing the unnecessary \n
                     fr_list[-1] = fr_list[-1][:-1] + rest_of_line
 
                 if fr_list:
                     fr_text = '\n'.join(fr_list)
-                    try:
-                        first_vs = api_publish.verse_re.search(fr_text).group(1)
-                    except AttributeError:
-                        print('Error, chp {0}'.format(chp_num))
-                        print('Text: {0}'.format(fr_text))
-                        sys.exit(1)
-
-                    chp['frames'].append({'id': '{0}-{1}'.format(
-                        str(chp_num).zfill(2), first_vs.zfill(2)),
-                        'img': '',
-                        'format': 'usx',
-                        'text': fr_text,
-                        'lastvs': current_vs
-                    })
+                    first_vs = first_verse(fr_text, 'Error')
+                    append_frame(first_vs, fr_text, first_vs)
                     fr_list = []
 
                 continue
@@ -135,59 +232,265 @@ class api_publish(object):
             fr_list.append(line)
 
         # Append the last frame and the last chapter
-        chp['frames'].append({'id': '{0}-{1}'.format(
-            str(chp_num).zfill(2), str(fr_id).zfill(2)),
-            'img': '',
-            'format': 'usx',
-            'text': '\n'.join(fr_list),
-            'lastvs': current_vs
-        })
+        fr_text = '\n'.join(fr_list)
+        append_frame('0', fr_text, api_publish.verse_re.search(fr_text).group(1))
         chapters.append(chp)
-        return chapters
+        return chapters, chunks
 
     @staticmethod
-    def get_chunks(book):
-        chunks = []
-        for c in book:
-            for frame in c['frames']:
-                chunks.append({'id': frame['id'],
-                               'firstvs': api_publish.verse_re.search(frame['text']).group(1),
-                               'lastvs': frame["lastvs"]
-                               })
-        return chunks
+    def get_ver_lang(source_dir):
+        """
+        :param str|unicode source_dir: A language directory, like .../ulb/txt/1/ulb-en
+        :return: tuple of (ver, lang), like ('ulb', 'en')
+        """
+        ver, lang = source_dir.rstrip('/').rsplit('/', 1)[1].split('-', 1)
+        return ver, lang
+
+    @staticmethod
+    def get_out_dir(slug, lang, ver):
+        return os.path.join(api_publish.api_v2, slug, lang, ver)
+
+    @staticmethod
+    def get_hash(usfm):
+        """
+        :param str|unicode usfm: The USFM of a book, from read_book
+        :return: str
+        """
+        sha = hashlib.sha1('{0}\n'.format(api_publish.output_version).encode('utf-8'))
+        sha.update(usfm.encode('utf-8'))
+        return sha.hexdigest()
+
+    @staticmethod
+    def get_manifest_file(ver, lang):
+        # kept out of api_v2, which is served by the web server
+        return os.path.join(app_utils.get_cache_dir(), 'api-manifests', '{0}-{1}.json'.format(ver, lang))
+
+    @staticmethod
+    def load_manifest(ver, lang):
+        """
+        The manifest of a language remembers the hash of the USFM each book was last published from
+        :param str|unicode ver:
+        :param str|unicode lang:
+        :return: dict<str, dict> {slug: {'file': USFM file name, 'sha1': hash}}, empty if there is no manifest
+        """
+        try:
+            with io.open(api_publish.get_manifest_file(ver, lang), 'r', encoding='utf-8') as in_file:
+                manifest = json.loads(in_file.read())
+
+        except (IOError, ValueError):
+            return {}
 
-    def run(self):
+        return manifest.get('books', {})
 
+    @staticmethod
+    def save_manifest(ver, lang, books):
+        """
+        :param str|unicode ver:
+        :param str|unicode lang:
+        :param dict<str, dict> books: See load_manifest
+        """
+        manifest = {'ver': ver, 'lang': lang, 'books': books}
+        write_json(api_publish.get_manifest_file(ver, lang), manifest, indent=2)
+
+    @staticmethod
+    def remove_book(slug, lang, ver):
+        """
+        Removes the files published for a book that is no longer in the source directory
+        """
+        out_dir = api_publish.get_out_dir(slug, lang, ver)
+        for json_file in api_publish.output_files:
+            for file_name in (json_file, json_file + '.gz'):
+                if os.path.isfile(os.path.join(out_dir, file_name)):
+                    os.remove(os.path.join(out_dir, file_name))
+
+        if os.path.isdir(out_dir) and not os.listdir(out_dir):
+            os.rmdir(out_dir)
+
+    @staticmethod
+    def publish_book(source_dir, file_name, usfm_text, today, published_sha1=None):
+        """
+        Writes the source.json and chunks.json of one book, unless they were already written from the same USFM
+        :param str|unicode source_dir: A language directory, like .../ulb/txt/1/ulb-en
+        :param str|unicode file_name: The USFM file in source_dir
+        :param str|unicode usfm_text: The text of the file, if it is already in memory
+        :param str|unicode today: The date_modified, like 20160725
+        :param str published_sha1: The hash of the USFM the book was last published from, see get_hash
+        :return: BookResult|None None if the file is not a book
+        """
+        start = time.time()
+        book = api_publish.read_book(source_dir, file_name, usfm_text)
+        if not book:
+            return None
+
+        book_id, usfm = book
+        ver, lang = api_publish.get_ver_lang(source_dir)
+        slug = book_id.lower()
+        sha1 = api_publish.get_hash(usfm)
+        out_files = [os.path.join(api_publish.get_out_dir(slug, lang, ver), f) for f in api_publish.output_files]
+
+        if sha1 == published_sha1 and all(os.path.isfile(f) for f in out_files):
+            return BookResult(ver, lang, slug, file_name, sha1, True, (), 0, time.time() - start)
+
+        usx = api_publish.render_usx(book_id, usfm)
+        chapters, chunks = api_publish.parse(usx.splitlines(True))
+        payload = {'chapters': chapters,
+                   'date_modified': today
+                   }
+
+        files_written = []
+        bytes_written = 0
+        for out_file, content in zip(out_files, (payload, chunks)):
+            if write_json(out_file, content):
+                files_written.append(os.path.basename(out_file))
+                bytes_written += os.path.getsize(out_file)
+
+        return BookResult(ver, lang, slug, file_name, sha1, False, tuple(files_written), bytes_written,
+                          time.time() - start)
+
+    def get_jobs(self, usfm_texts=None):
+        """
+        :param dict<str, str|unicode> usfm_texts: The USFM of files in the source directory that are already in memory,
+                                                   by file name, so they are not read again
+        :return: list<tuple> The arguments of publish_book for each file
+        """
         today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])
         dirs = []
-        if self.source:
+        if isinstance(self.source, list):
+            dirs += self.source
+        elif self.source:
             dirs.append(self.source)
         else:
             for source_dir in api_publish.source_dirs:
                 udb_dir = [os.path.join(source_dir, x) for x in os.listdir(source_dir)]
                 dirs += udb_dir
 
+        jobs = []
         for d in dirs:
-            ver, lang = d.rsplit('/', 1)[1].split('-', 1)
-            self.temp_dir = '/tmp/{0}-{1}'.format(ver, lang)
-            if os.path.isdir(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
-            UsfmTransform.buildUSX(d, self.temp_dir, '', True)
-            print("#### Chunking...")
-            for f in os.listdir(self.temp_dir):
-                # use utf-8-sig to remove the byte order mark
-                with codecs.open(os.path.join(self.temp_dir, f), 'r', encoding='utf-8-sig') as in_file:
-                    usx = in_file.readlines()
-
-                slug = f.split('.')[0].lower()
-                print('     ({0})'.format(slug.upper()))
-                book = self.parse(usx)
-                payload = {'chapters': book,
-                           'date_modified': today
-                           }
-                write_file(os.path.join(api_publish.api_v2, slug, lang, ver, 'source.json'), payload)
-                chunks = self.get_chunks(book)
-                write_file(os.path.join(api_publish.api_v2, slug, lang, ver, 'chunks.json'), chunks)
+            texts = usfm_texts if usfm_texts and d == self.source else {}
+
+            manifest = {} if self.force else self.load_manifest(*self.get_ver_lang(d))
+            self.manifests[d] = manifest
+
+            # a book is published again if it comes from a different file, so a renamed file still updates it
+            published = dict((entry['file'], entry['sha1']) for entry in manifest.values())
+            jobs.extend((d, file_name, texts.get(file_name), today, published.get(file_name))
+                        for file_name in sorted(os.listdir(d)))
+
+        return jobs
+
+    def publish_books(self, jobs):
+        """
+        Publishes the books, in a pool of processes if self.jobs is more than 1. The results are returned as the books
+        are finished, in any order.
+        :param list<tuple> jobs: From get_jobs
+        :return: generator<BookResult>
+        """
+        if self.jobs < 2 or len(jobs) < 2:
+            for job in jobs:
+                result = api_publish.publish_book(*job)
+                if result:
+                    yield result
+            return
+
+        # the files written in the pool processes are not counted by the OutputWriter of this process
+        writer = OutputWriter.get_default()
+
+        pool = Pool(min(self.jobs, len(jobs)))
+        try:
+            for result in pool.imap_unordered(publish_book_job, jobs):
+                if result:
+                    if not result.skipped:
+                        written = len(result.files_written)
+                        writer.count(written, len(self.output_files) - written)
+                    yield result
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def update_manifests(self, results):
+        """
+        Saves the manifest of each language, and removes the books that are no longer in the source directories. A book
+        whose file is still there but could not be read keeps its published files and its old manifest entry.
+        :param list<BookResult> results:
+        """
+        for source_dir, old_books in self.manifests.items():
+            ver, lang = self.get_ver_lang(source_dir)
+            books = dict((r.slug, {'file': r.file_name, 'sha1': r.sha1}) for r in results
+                         if (r.ver, r.lang) == (ver, lang))
+
+            # when forced there is no old manifest, so read it to find the books that were removed
+            if self.force:
+                old_books = self.load_manifest(ver, lang)
+
+            for slug in sorted(set(old_books) - set(books)):
+                old_file = old_books[slug].get('file')
+                if old_file and os.path.isfile(os.path.join(source_dir, old_file)):
+                    print_warning('({0}) {1}-{2} could not be read from {3}, the published files were kept'.format(
+                        slug.upper(), ver, lang, os.path.join(source_dir, old_file)))
+                    books[slug] = old_books[slug]
+                    continue
+
+                print('     ({0}) {1}-{2} removed'.format(slug.upper(), ver, lang))
+                self.remove_book(slug, lang, ver)
+
+            self.save_manifest(ver, lang, books)
+
+    def run(self, usfm_texts=None):
+        """
+        :param dict<str, str|unicode> usfm_texts: The USFM of files in the source directory that are already in memory,
+                                                   by file name, so they are not read again
+        :return: list<BookResult>
+        """
+        start = time.time()
+        results = []
+        compressor = Compressor.get_default()
+
+        print("#### Chunking...")
+        for result in self.publish_books(self.get_jobs(usfm_texts)):
+            print('     ({0}) {1}-{2}{3}'.format(result.slug.upper(), result.ver, result.lang,
+                                                 ' unchanged' if result.skipped else ''))
+            results.append(result)
+
+            # compressed here rather than in the pool processes, while they go on with the next books
+            out_dir = self.get_out_dir(result.slug, result.lang, result.ver)
+            for json_file in self.output_files:
+                compressor.add(os.path.join(out_dir, json_file), changed=json_file in result.files_written)
+
+        self.update_manifests(results)
+
+        print_summary(results, time.time() - start)
+        compressor.finish()
+        return results
+
+
+def publish_book_job(args):
+    """
+    Runs api_publish.publish_book in a pool process
+    :param tuple args: From api_publish.get_jobs
+    :return: BookResult|None
+    """
+    try:
+        return api_publish.publish_book(*args)
+
+    except SystemExit:
+        # parse exits when a frame has no verse, which would leave the pool waiting for this result
+        raise Exception('Publishing {0} failed'.format(os.path.join(args[0], args[1])))
+
+
+def print_summary(results, seconds):
+    """
+    :param list<BookResult> results:
+    :param float seconds: The total elapsed time
+    """
+    languages = len(set((r.ver, r.lang) for r in results))
+    published = sum(1 for r in results if not r.skipped)
+    files_written = sum(len(r.files_written) for r in results)
+    bytes_written = sum(r.bytes_written for r in results)
+    print_ok('Published: ', '{0} books in {1} languages in {2:.1f} seconds, {3:.2f} books/s, {4} files ({5:,} bytes) '
+                            'written, {6} files already the same, {7} books unchanged'
+             .format(published, languages, seconds, published / seconds if seconds else 0, files_written,
+                     bytes_written, published * len(api_publish.output_files) - files_written,
+                     len(results) - published))
 
 
 if __name__ == '__main__':
@@ -195,8 +498,19 @@ if __name__ == '__main__':
                                      formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('-s', '--sourceDir', dest="sourcedir", default=False,
                         help="Source directory.")
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=1, required=False,
+                        help='Number of books to publish at the same time. Default is 1.')
+    parser.add_argument('--force', dest='force', action='store_true',
+                        help='Publish every book, even the ones that have not changed.')
+    parser.add_argument('--gzip', dest='gzip', action='store_true',
+                        help='Also write a .gz copy of each file. Same as setting UW_PUBLISH_GZIP.')
     args = parser.parse_args(sys.argv[1:])
 
-    with api_publish(args.sourcedir) as api:
+    if args.gzip:
+        Compressor.get_default().enabled = True
+
+    output_writer.report_stats_at_exit()
+
+    with api_publish(args.sourcedir, args.jobs, args.force) as api:
         api.run()
     # chown -R syncthing:syncthing /var/www/vhosts/api.unfoldingword.org/httpdocs/
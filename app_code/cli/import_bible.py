@@ -12,20 +12,23 @@
 
 from __future__ import print_function, unicode_literals
 import argparse
-import codecs
 import os
 import re
-import shutil
 import sys
 import datetime
-from glob import glob
 from general_tools.print_utils import print_error, print_ok, print_notice
-from uw.update_catalog import update_catalog
 from app_code.bible.bible_classes import BibleMetaData, Bible
 from app_code.bible.content import Book
-from general_tools.file_utils import unzip, make_dir, write_file
-from general_tools.url_utils import download_file, join_url_parts
+from app_code.bible import validation_cache
+from app_code.bible.validation_cache import ValidationCache
+from app_code.util import archive_cache, output_writer, url_cache
+from app_code.util.archive_cache import get_cached_archive
+from general_tools.url_utils import join_url_parts
 from app_code.cli.api_publish import api_publish
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import write_file
+from app_code.util.repo_archive import RepoArchive
 
 if sys.version_info < (3, 0):
     prompt = raw_input
@@ -38,13 +41,9 @@ except ImportError:
     import urllib2
 
 
-# remember this so we can delete it
-download_dir = ''
-
 out_template = '/var/www/vhosts/api.unfoldingword.org/httpdocs/{0}/txt/1/{1}-{2}'
 
 id_re = re.compile(r'\\id[\u00A0\s](\w{3}).*')
-s5_re = re.compile(r'\\s5[\u00A0\s]*')
 nl_re = re.compile(r'\n{2,}')
 
 # TODO: change these to point to the API when it is available
@@ -56,7 +55,7 @@ chunk_url = api_root + '/versification/{0}/chunks/{1}.json'
 
 def main(git_repo, tag, domain):
 
-    global download_dir, out_template
+    global out_template
 
     # clean up the git repo url
     if git_repo[-4:] == '.git':
@@ -67,67 +66,58 @@ def main(git_repo, tag, domain):
 
     # initialize some variables
     today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])
-    download_dir = '/tmp/{0}'.format(git_repo.rpartition('/')[2])
-    make_dir(download_dir)
-    downloaded_file = '{0}/{1}.zip'.format(download_dir, git_repo.rpartition('/')[2])
     file_to_download = join_url_parts(git_repo, 'archive/' + tag + '.zip')
     books_published = {}
+    usfm_texts = {}  # type: dict<str, unicode>  # file name: the USFM written to it
     metadata_obj = None
     usfm_dir = None
 
-    # download the repository
+    # download the repository, or check that the cached copy is still current
     try:
         print('Downloading {0}...'.format(file_to_download), end=' ')
-        if not os.path.isfile(downloaded_file):
-            download_file(file_to_download, downloaded_file)
+        downloaded_file = get_cached_archive(git_repo, tag)
     finally:
         print('finished.')
 
-    try:
-        print('Unzipping...'.format(downloaded_file), end=' ')
-        unzip(downloaded_file, download_dir)
-    finally:
-        print('finished.')
+    # examine the repository, reading the files straight from the zip archive
+    with RepoArchive(downloaded_file) as archive:
+        for root, dirs, files in archive.walk():
 
-    # examine the repository
-    for root, dirs, files in os.walk(download_dir):
+            if 'meta.json' in files:
+                # read the metadata
+                try:
+                    print('Reading the metadata...', end=' ')
+                    metadata_obj = BibleMetaData.from_dict(archive.load_json(os.path.join(root, 'meta.json')))
+                finally:
+                    print('finished.')
 
-        if 'meta.json' in files:
-            # read the metadata
-            try:
-                print('Reading the metadata...', end=' ')
-                metadata_obj = BibleMetaData(os.path.join(root, 'meta.json'))
-            finally:
-                print('finished.')
+            if 'usfm' in dirs:
+                usfm_dir = os.path.join(root, 'usfm')
 
-        if 'usfm' in dirs:
-            usfm_dir = os.path.join(root, 'usfm')
+            # if we have everything, exit the loop
+            if usfm_dir and metadata_obj:
+                break
 
-        # if we have everything, exit the loop
-        if usfm_dir and metadata_obj:
-            break
+        # check for valid repository structure
+        if not metadata_obj:
+            print_error('Did not find meta.json in {}'.format(git_repo))
+            sys.exit(1)
 
-    # check for valid repository structure
-    if not metadata_obj:
-        print_error('Did not find meta.json in {}'.format(git_repo))
-        sys.exit(1)
+        if not usfm_dir:
+            print_error('Did not find the usfm directory in {}'.format(git_repo))
+            sys.exit(1)
 
-    if not usfm_dir:
-        print_error('Did not find the usfm directory in {}'.format(git_repo))
-        sys.exit(1)
+        # a Bible is a few megabytes of text, so read all the books now and close the archive
+        usfm_files = [(usfm_file, archive.read_text(usfm_file, 'utf-8'))
+                      for usfm_file in archive.glob(usfm_dir, '*.usfm')]
 
     # get the versification data
     vrs = Bible.get_versification(metadata_obj.versification)  # type: list<Book>
     out_dir = out_template.format(domain, metadata_obj.slug, metadata_obj.lang)
 
     # walk through the usfm files
-    usfm_files = glob(os.path.join(usfm_dir, '*.usfm'))
     errors_found = False
-    for usfm_file in usfm_files:
-
-        # read the file
-        with codecs.open(usfm_file, 'r', 'utf-8') as in_file:
-            book_text = in_file.read()
+    for usfm_file, book_text in usfm_files:
 
         # get the book id
         book_search = id_re.search(book_text)
@@ -145,15 +135,12 @@ def main(git_repo, tag, domain):
             print_error('Book versification data was not found for "{}"'.format(book_id))
             sys.exit(1)
 
-        # remove \s5 lines
-        book_text = s5_re.sub('', book_text)
-
-        # get the usfm for the book
-        book.set_usfm(book_text)
+        # get the usfm for the book, without the \s5 lines
+        book.set_usfm(book_text, strip_s5=True)
 
-        # do basic checks
-        book.verify_usfm_tags()
-        book.verify_chapters_and_verses(True)
+        # do basic checks, unless this text has already been checked
+        validation_cache.verify_book(book, metadata_obj.versification,
+                                     [validation_cache.TAGS, validation_cache.CHAPTERS])
         if book.validation_errors:
             errors_found = True
 
@@ -164,7 +151,9 @@ def main(git_repo, tag, domain):
         # produces something like '01-GEN.usfm'
         book_file_name = '{0}-{1}.usfm'.format(str(book.number).zfill(2), book.book_id)
         print('Writing ' + book_file_name + '...', end=' ')
-        write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+        changed = write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+        Compressor.get_default().add('{0}/{1}'.format(out_dir, book_file_name), 'usfm', changed)
+        usfm_texts[book_file_name] = book.usfm
 
         meta = ['Bible: OT']
         if book.number > 39:
@@ -203,14 +192,10 @@ def main(git_repo, tag, domain):
     print()
     print('Publishing to the API...')
     with api_publish(out_dir) as api:
-        api.run()
+        api.run(usfm_texts)
     print('Finished publishing to the API.')
 
-    # update the catalog
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+    CatalogUpdater.get_default().request_update(os.path.basename(out_dir))
 
     print_notice('Check {0} and do a git push'.format(out_dir))
 
@@ -235,19 +220,26 @@ if __name__ == '__main__':
     parser.add_argument('-d', '--domain', dest='domain', choices=['udb', 'ulb', 'pdb'],
                         required=True, help='ulb, udb or pdb')
 
+    parser.add_argument('--no-cache', dest='no_cache', action='store_true', default=False,
+                        help='Check every book, even if the same text has been checked before.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
+
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
 
     # prompt user to update meta.json
     print_notice('Check meta.json in the git repository and update the information if needed.')
     prompt('Press Enter to continue when ready...')
 
-    try:
-        print_ok('STARTING: ', 'importing USFM repository.')
-        main(args.gitrepo, args.tag, args.domain)
-        print_ok('ALL FINISHED: ', 'importing USFM repository.')
-        print_notice('Don\'t forget to notify the interested parties.')
-
-    finally:
-        # delete temp files
-        if os.path.isdir(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
+    archive_cache.report_stats_at_exit()
+    url_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
+    ValidationCache.get_default().enabled = not args.no_cache
+    print_ok('STARTING: ', 'importing USFM repository.')
+    main(args.gitrepo, args.tag, args.domain)
+    print_ok('ALL FINISHED: ', 'importing USFM repository.')
+    print_notice('Don\'t forget to notify the interested parties.')
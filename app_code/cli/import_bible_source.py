@@ -21,14 +21,16 @@ import shutil
 import sys
 import datetime
 from general_tools.print_utils import print_warning
-from uw.update_catalog import update_catalog
 from app_code.bible.content import Book
-from general_tools.file_utils import unzip, write_file
-from general_tools.url_utils import download_file
+from general_tools.file_utils import unzip
 from app_code.cli.api_publish import api_publish
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util import archive_cache, output_writer
+from app_code.util.archive_cache import ArchiveCache
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import write_file
 
-# remember these so we can delete them
-downloaded_file = ''
+# remember this so we can delete it
 unzipped_dir = ''
 
 out_template = '/var/www/vhosts/api.unfoldingword.org/httpdocs/{0}/txt/1/{0}-{1}'
@@ -37,19 +39,18 @@ out_template = '/var/www/vhosts/api.unfoldingword.org/httpdocs/{0}/txt/1/{0}-{1}
 def main(resource, lang, slug, name, checking, contrib, ver, check_level,
          comments, source):
 
-    global downloaded_file, unzipped_dir, out_template
+    global unzipped_dir, out_template
 
     today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])
-    downloaded_file = '/tmp/{0}'.format(resource.rpartition('/')[2])
     unzipped_dir = '/tmp/{0}'.format(resource.rpartition('/')[2].strip('.zip'))
     out_dir = out_template.format(slug, lang)
 
-    if not os.path.isfile(downloaded_file):
-        download_file(resource, downloaded_file)
-
+    # download the zip file, or check that the cached copy is still current
+    downloaded_file = ArchiveCache.get_default().get_file(resource)
     unzip(downloaded_file, unzipped_dir)
 
     books_published = {}
+    usfm_texts = {}  # type: dict<str, unicode>  # file name: the USFM written to it
     there_were_errors = False
 
     for root, dirs, files in os.walk(unzipped_dir):
@@ -90,7 +91,9 @@ def main(resource, lang, slug, name, checking, contrib, ver, check_level,
             # produces something like '01-GEN.usfm'
             book_file_name = '{0}-{1}.usfm'.format(str(book.number).zfill(2), book.book_id)
             print('Writing ' + book_file_name)
-            write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+            changed = write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+            Compressor.get_default().add('{0}/{1}'.format(out_dir, book_file_name), 'usfm', changed)
+            usfm_texts[book_file_name] = book.usfm
 
             meta = ['Bible: OT']
             if book.number > 39:
@@ -127,14 +130,10 @@ def main(resource, lang, slug, name, checking, contrib, ver, check_level,
 
     print('Publishing to the API...')
     with api_publish(out_dir) as api:
-        api.run()
+        api.run(usfm_texts)
     print('Finished publishing to the API.')
 
-    # update the catalog
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+    CatalogUpdater.get_default().request_update(os.path.basename(out_dir))
 
     print('Check {0} and do a git push'.format(out_dir))
 
@@ -170,16 +169,21 @@ if __name__ == '__main__':
                         required=False, help="Comments on the resource.")
     parser.add_argument('-o', '--source', dest="source", default="en",
                         required=False, help="Source language code.")
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
+    archive_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
 
     try:
         main(args.resource, args.lang, args.slug, args.name, args.checking,
              args.contrib, args.version, args.check_level, args.comments, args.source)
     finally:
         # delete temp files
-        if os.path.isfile(downloaded_file):
-            os.remove(downloaded_file)
-
         if os.path.isdir(unzipped_dir):
             shutil.rmtree(unzipped_dir, ignore_errors=True)
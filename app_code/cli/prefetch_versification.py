@@ -0,0 +1,103 @@
+#!/usr/bin/env python2
+# -*- coding: utf8 -*-
+#
+#  Copyright (c) 2016 unfoldingWord
+#  http://creativecommons.org/licenses/MIT/
+#  See LICENSE file for details.
+#
+"""
+Downloads the versification, book and chunk files for all the versification schemes into the local url cache, and
+compiles the versification of each scheme, so the Bible scripts can run without waiting for the network (or with
+UW_PUBLISH_OFFLINE set).
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import json
+import sys
+from multiprocessing.pool import ThreadPool
+from general_tools.print_utils import print_ok, print_error
+from app_code.bible.bible_classes import Bible
+from app_code.bible.versification import Versification
+from app_code.util.url_cache import UrlCache
+
+schemes = ['ufw', 'rsc', 'ufw-odx', 'ufw-bn', 'avd', 'ufw-rev']
+
+
+def fetch(url):
+    """
+    :param str|unicode url:
+    :return: str|unicode|None The error message, if the url could not be retrieved
+    """
+    try:
+        UrlCache.get_default().get_url(url)
+        return None
+    except Exception as e:
+        return '{0}: {1}'.format(url, e)
+
+
+def get_scheme_urls(scheme):
+    """
+    Gets the list of books for the scheme, and returns the urls of the rest of the files for the scheme
+    :param str|unicode scheme:
+    :return: list<str|unicode>
+    """
+    books = json.loads(UrlCache.get_default().get_url(Versification.book_file.format(scheme)))
+    urls = [Versification.vrs_file.format(scheme)]
+    urls.extend(Bible.chunk_url.format(scheme, book_id.lower()) for book_id in sorted(books))
+
+    return urls
+
+
+def main(scheme_list, jobs, refresh):
+    """
+    :param list<str|unicode> scheme_list:
+    :param int jobs: The number of downloads to run at the same time
+    :param bool refresh: Check every file with the server, even if the cached copy has not expired
+    """
+    cache = UrlCache.get_default()
+    if refresh:
+        cache.ttl = 0
+
+    pool = ThreadPool(jobs)
+    try:
+        # the book lists first, they are needed to find the chunk files
+        urls = [Bible.usfm_data_file]
+        errors = []
+        for scheme_urls in pool.imap(get_scheme_urls, scheme_list):
+            urls.extend(scheme_urls)
+
+        errors.extend(e for e in pool.imap_unordered(fetch, urls) if e)
+
+        # compile the versification of each scheme from the downloaded files
+        for scheme in scheme_list:
+            try:
+                Versification.get(scheme)
+            except Exception as e:
+                errors.append('{0}: {1}'.format(scheme, e))
+    finally:
+        pool.close()
+        pool.join()
+
+    print(cache.get_stats())
+
+    if errors:
+        for error in sorted(errors):
+            print_error(error)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-s', '--scheme', dest='schemes', action='append', choices=schemes, required=False,
+                        help='Versification scheme to fetch, may be repeated. Default is all of them.')
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=8, required=False,
+                        help='Number of files to download at the same time. Default is 8.')
+    parser.add_argument('--refresh', dest='refresh', action='store_true', default=False,
+                        help='Check every cached file for a new version.')
+
+    args = parser.parse_args(sys.argv[1:])
+
+    print_ok('STARTING: ', 'prefetching versification files.')
+    main(args.schemes if args.schemes else schemes, args.jobs, args.refresh)
+    print_ok('ALL FINISHED: ', 'prefetching versification files.')
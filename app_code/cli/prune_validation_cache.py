@@ -0,0 +1,40 @@
+#!/usr/bin/env python2
+# -*- coding: utf8 -*-
+#
+#  Copyright (c) 2016 unfoldingWord
+#  http://creativecommons.org/licenses/MIT/
+#  See LICENSE file for details.
+#
+"""
+Removes the validation cache entries that were made by an older version of the USFM checks, or that have not been
+used recently.
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import sys
+from general_tools.print_utils import print_ok
+from app_code.bible.content import Book
+from app_code.bible.validation_cache import ValidationCache
+
+
+def main(max_age_days):
+    """
+    :param int max_age_days: Remove entries not used in this many days
+    """
+    cache = ValidationCache.get_default()
+    removed, kept = cache.prune(Book.checker_version, max_age_days)
+    print('Removed {0} entries from {1}, kept {2}.'.format(removed, cache.cache_dir, kept))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--days', dest='days', type=int, default=ValidationCache.default_max_age_days, required=False,
+                        help='Remove entries not used in this many days. Default is {0}.'.format(
+                            ValidationCache.default_max_age_days))
+
+    args = parser.parse_args(sys.argv[1:])
+
+    print_ok('STARTING: ', 'pruning the validation cache.')
+    main(args.days)
+    print_ok('ALL FINISHED: ', 'pruning the validation cache.')
@@ -11,29 +11,28 @@
 
 from __future__ import print_function, unicode_literals
 import argparse
-import codecs
 import datetime
 import json
 import re
-from glob import glob
-from general_tools.file_utils import make_dir, unzip, load_json_object, write_file
 from general_tools.print_utils import print_notice, print_ok, print_error
-from general_tools.url_utils import join_url_parts, download_file
-from uw.update_catalog import update_catalog
+from general_tools.url_utils import join_url_parts
 from app_code.bible.bible_classes import BibleMetaData, Bible, BibleStatus, BibleEncoder
 from app_code.bible.content import Book, Chapter
+from app_code.util import archive_cache, output_writer, url_cache
+from app_code.util.archive_cache import get_cached_archive
 import sys
-import shutil
 import os
 from app_code.cli.api_publish import api_publish
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import write_file
+from app_code.util.repo_archive import RepoArchive
 
 if sys.version_info < (3, 0):
     prompt = raw_input
 else:
     prompt = input
 
-# remember this so we can delete it
-download_dir = ''
 
 out_template = '/var/www/vhosts/api.unfoldingword.org/httpdocs/{0}/txt/1/{1}'
 
@@ -43,7 +42,7 @@ add_q_re = re.compile(r'\n\s+(\S+)')
 
 
 def main(git_repo, tag, domain):
-    global download_dir, out_template
+    global out_template
 
     # clean up the git repo url
     if git_repo[-4:] == '.git':
@@ -54,83 +53,74 @@ def main(git_repo, tag, domain):
 
     # initialize some variables
     today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])  # str(datetime.date.today())
-    download_dir = '/tmp/{0}'.format(git_repo.rpartition('/')[2])
-    make_dir(download_dir)
-    downloaded_file = '{0}/{1}.zip'.format(download_dir, git_repo.rpartition('/')[2])
     file_to_download = join_url_parts(git_repo, 'archive/' + tag + '.zip')
     manifest = None
     metadata_obj = None
     content_dir = ''
     usfm_file = None
 
-    # download the repository
+    # download the repository, or check that the cached copy is still current
     try:
         print('Downloading {0}...'.format(file_to_download), end=' ')
-        if not os.path.isfile(downloaded_file):
-            download_file(file_to_download, downloaded_file)
+        downloaded_file = get_cached_archive(git_repo, tag)
     finally:
         print('finished.')
 
-    try:
-        print('Unzipping...'.format(downloaded_file), end=' ')
-        unzip(downloaded_file, download_dir)
-    finally:
-        print('finished.')
-
-    # examine the repository
-    for root, dirs, files in os.walk(download_dir):
-
-        if 'manifest.json' in files:
-            # read the manifest
-            try:
-                print('Reading the manifest...', end=' ')
-                manifest = load_json_object(os.path.join(root, 'manifest.json'))
-                content_dir = root
-
-                # look for the usfm file for the whole book
-                found_usfm = glob(os.path.join(content_dir, '*.usfm'))
-                if len(found_usfm) == 1:
-                    usfm_file = os.path.join(content_dir, found_usfm[0])
-            finally:
-                print('finished.')
-
-        if 'meta.json' in files:
-            # read the metadata
-            try:
-                print('Reading the metadata...', end=' ')
-                metadata_obj = BibleMetaData(os.path.join(root, 'meta.json'))
-            finally:
-                print('finished.')
-
-        # if we have everything, exit the loop
-        if manifest and metadata_obj:
-            break
-
-    # check for valid repository structure
-    if not manifest:
-        print_error('Did not find manifest.json in {}'.format(git_repo))
-        sys.exit(1)
+    # examine the repository, reading the files straight from the zip archive
+    with RepoArchive(downloaded_file) as archive:
+        for root, dirs, files in archive.walk():
+
+            if 'manifest.json' in files:
+                # read the manifest
+                try:
+                    print('Reading the manifest...', end=' ')
+                    manifest = archive.load_json(os.path.join(root, 'manifest.json'))
+                    content_dir = root
+
+                    # look for the usfm file for the whole book
+                    found_usfm = archive.glob(content_dir, '*.usfm')
+                    if len(found_usfm) == 1:
+                        usfm_file = found_usfm[0]
+                finally:
+                    print('finished.')
+
+            if 'meta.json' in files:
+                # read the metadata
+                try:
+                    print('Reading the metadata...', end=' ')
+                    metadata_obj = BibleMetaData.from_dict(archive.load_json(os.path.join(root, 'meta.json')))
+                finally:
+                    print('finished.')
+
+            # if we have everything, exit the loop
+            if manifest and metadata_obj:
+                break
+
+        # check for valid repository structure
+        if not manifest:
+            print_error('Did not find manifest.json in {}'.format(git_repo))
+            sys.exit(1)
 
-    if not metadata_obj:
-        print_error('Did not find meta.json in {}'.format(git_repo))
-        sys.exit(1)
+        if not metadata_obj:
+            print_error('Did not find meta.json in {}'.format(git_repo))
+            sys.exit(1)
 
-    # get the versification data
-    print('Getting versification info...', end=' ')
-    vrs = Bible.get_versification(metadata_obj.versification)  # type: list<Book>
+        # get the versification data
+        print('Getting versification info...', end=' ')
+        vrs = Bible.get_versification(metadata_obj.versification)  # type: list<Book>
 
-    # get the book object for this repository
-    book = next((b for b in vrs if b.book_id.lower() == manifest['project']['id']), None)  # type: Book
-    if not book:
-        print_error('Book versification data was not found for "{}"'.format(manifest['project']['id']))
-        sys.exit(1)
-    print('finished')
+        # get the book object for this repository
+        book = next((b for b in vrs if b.book_id.lower() == manifest['project']['id']), None)  # type: Book
+        if not book:
+            print_error('Book versification data was not found for "{}"'.format(manifest['project']['id']))
+            sys.exit(1)
+        print('finished')
 
-    if usfm_file:
-        read_unified_file(book, usfm_file)
+        if usfm_file:
+            read_unified_file(archive, book, usfm_file)
 
-    else:
-        read_chunked_files(book, content_dir, metadata_obj)
+        else:
+            read_chunked_files(archive, book, content_dir, metadata_obj)
 
     # do basic checks
     print('Running USFM checks...', end=' ')
@@ -158,7 +148,8 @@ def main(git_repo, tag, domain):
     # produces something like '01-GEN.usfm'
     book_file_name = '{0}-{1}.usfm'.format(str(book.number).zfill(2), book.book_id)
     print('Writing ' + book_file_name + '...', end=' ')
-    write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+    changed = write_file('{0}/{1}'.format(out_dir, book_file_name), book.usfm)
+    Compressor.get_default().add('{0}/{1}'.format(out_dir, book_file_name), 'usfm', changed)
     print('finished.')
 
     # look for an existing status.json file
@@ -187,14 +178,10 @@ def main(git_repo, tag, domain):
     # let the API know it is there
     print('Publishing to the API...')
     with api_publish(out_dir) as api:
-        api.run()
+        api.run({book_file_name: book.usfm})
     print('Finished publishing to the API.')
 
-    # update the catalog
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+    CatalogUpdater.get_default().request_update(os.path.basename(out_dir))
 
     print_notice('Check {0} and do a git push'.format(out_dir))
 
@@ -222,26 +209,31 @@ def remove_chapter_markers(usfm_in):
     return chapter_re.sub(r'', usfm_in)
 
 
-def read_chunked_files(book, content_dir, metadata_obj):
+def read_chunked_files(archive, book, content_dir, metadata_obj):
+    """
+    :param RepoArchive archive:
+    :param Book book:
+    :param str|unicode content_dir: The directory in the archive with a directory for each chapter
+    :param BibleMetaData metadata_obj:
+    """
 
     print('Reading chapter USFM files...', end=' ')
     for i in range(0, len(book.chapters) + 1):
 
         # get the directory for this chapter
         chapter_dir = os.path.join(content_dir, str(i).zfill(2))
-        if not os.path.isdir(chapter_dir):
+        if not archive.isdir(chapter_dir):
             print_error('Did not find directory for chapter {}.'.format(i))
             sys.exit(1)
 
         # directory 00 contains the translated book title
         if i == 0:
             file_name = os.path.join(chapter_dir, 'title.txt')
-            if not os.path.isfile(file_name):
+            if not archive.isfile(file_name):
                 print_error('Did not find file "{}".'.format(file_name))
                 sys.exit(1)
 
-            with codecs.open(file_name, 'r', 'utf-8-sig') as in_file:
-                translated_name = in_file.read()
+            translated_name = archive.read_text(file_name)
 
             header_usfm = Bible.get_header_text()
             header_usfm = header_usfm.replace('{BOOK_CODE}', book.book_id)
@@ -254,9 +246,9 @@ def read_chunked_files(book, content_dir, metadata_obj):
 
         else:
             # other directories will have the chunk files for the chapter
-            chapter = next((c for c in book.chapters if c.number == i), None)  # type: Chapter
+            chapter = book.get_chapter(i)  # type: Chapter
 
-            chunk_list = [f for f in os.listdir(chapter_dir) if re.search(r'[0-1]?[0-9][0-9]\.txt$', f)]
+            chunk_list = [f for f in archive.listdir(chapter_dir) if re.search(r'[0-1]?[0-9][0-9]\.txt$', f)]
             chunk_list.sort()
             for chunk_file in chunk_list:
 
@@ -265,12 +257,11 @@ def read_chunked_files(book, content_dir, metadata_obj):
                     continue
 
                 file_name = os.path.join(chapter_dir, chunk_file)
-                if not os.path.isfile(file_name):
+                if not archive.isfile(file_name):
                     print_error('Did not find file "{}".'.format(file_name))
                     sys.exit(1)
 
-                with codecs.open(file_name, 'r', 'utf-8-sig') as in_file:
-                    chunk_usfm = in_file.read()
+                chunk_usfm = archive.read_text(file_name)
 
                 chapter.usfm += reformat_usfm(remove_chapter_markers(chunk_usfm)) + "\n"
 
@@ -278,12 +269,16 @@ def read_chunked_files(book, content_dir, metadata_obj):
     print('finished.')
 
 
-def read_unified_file(book, usfm_file):
+def read_unified_file(archive, book, usfm_file):
+    """
+    :param RepoArchive archive:
+    :param Book book:
+    :param str|unicode usfm_file: The path of the usfm file in the archive
+    """
 
     # read the file
     print('Reading {}...'.format(usfm_file), end=' ')
-    with codecs.open(usfm_file, 'r', 'utf-8') as in_file:
-        book_text = in_file.read()
+    book_text = archive.read_text(usfm_file, 'utf-8')
 
     # remove \s5
     s5_re = re.compile(r'\\s5\s*')
@@ -303,20 +298,23 @@ if __name__ == '__main__':
                         required=False, help='Branch or tag to use as the source. Default is master.')
     parser.add_argument('-d', '--domain', dest='domain', choices=['udb', 'ulb', 'pdb'],
                         required=True, help='ulb, udb or pdb')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
 
     # prompt user to update meta.json
     print_notice('Check meta.json in the git repository and update the information if needed.')
     prompt('Press Enter to continue when ready...')
 
-    try:
-        print_ok('STARTING: ', 'publishing Bible repository.')
-        main(args.gitrepo, args.tag, args.domain)
-        print_ok('ALL FINISHED: ', 'publishing Bible repository.')
-        print_notice('Don\'t forget to notify the interested parties.')
-
-    finally:
-        # delete temp files
-        if os.path.isdir(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
+    archive_cache.report_stats_at_exit()
+    url_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
+    print_ok('STARTING: ', 'publishing Bible repository.')
+    main(args.gitrepo, args.tag, args.domain)
+    print_ok('ALL FINISHED: ', 'publishing Bible repository.')
+    print_notice('Don\'t forget to notify the interested parties.')
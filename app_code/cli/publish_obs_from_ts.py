@@ -11,20 +11,23 @@
 
 from __future__ import print_function, unicode_literals
 import argparse
-import codecs
-import glob
 import json
 import shutil
 import datetime
 import subprocess
-from general_tools.file_utils import make_dir, unzip, load_json_object, write_file
+from general_tools.file_utils import make_dir, load_json_object
 from general_tools.git_wrapper import *
 from general_tools.print_utils import print_error, print_ok, print_notice
-from general_tools.url_utils import join_url_parts, download_file
+from general_tools.url_utils import join_url_parts
 from app_code.cli.obs_published_langs import ObsPublishedLangs
 from app_code.obs.export_to_tex import OBSTexExport
 from app_code.obs.obs_classes import OBSStatus, OBS, OBSChapter, OBSEncoder
-from uw.update_catalog import update_catalog
+from app_code.util import archive_cache, output_writer
+from app_code.util.archive_cache import get_cached_archive
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import write_file
+from app_code.util.repo_archive import RepoArchive
 import sys
 import os
 
@@ -58,69 +61,62 @@ def main(git_repo, tag, no_pdf):
     today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])  # str(datetime.date.today())
     download_dir = '/tmp/{0}'.format(git_repo.rpartition('/')[2])
     make_dir(download_dir)
-    downloaded_file = '{0}/{1}.zip'.format(download_dir, git_repo.rpartition('/')[2])
     file_to_download = join_url_parts(git_repo, 'archive/' + tag + '.zip')
     manifest = None
     status = None  # type: OBSStatus
     content_dir = None
 
-    # download the repository
+    # download the repository, or check that the cached copy is still current
     try:
         print('Downloading {0}...'.format(file_to_download), end=' ')
-        if not os.path.isfile(downloaded_file):
-            download_file(file_to_download, downloaded_file)
+        downloaded_file = get_cached_archive(git_repo, tag)
     finally:
         print('finished.')
 
-    try:
-        print('Unzipping...'.format(downloaded_file), end=' ')
-        unzip(downloaded_file, download_dir)
-    finally:
-        print('finished.')
-
-    # examine the repository
-    for root, dirs, files in os.walk(download_dir):
-
-        if 'manifest.json' in files:
-            # read the manifest
-            try:
-                print('Reading the manifest...', end=' ')
-                content_dir = root
-                manifest = load_json_object(os.path.join(root, 'manifest.json'))
-            finally:
-                print('finished.')
-
-        if 'status.json' in files:
-            # read the meta data
-            try:
-                print('Reading the status...', end=' ')
-                content_dir = root
-                status = OBSStatus(os.path.join(root, 'status.json'))
-            finally:
-                print('finished.')
-
-        # if we have everything, exit the loop
-        if content_dir and manifest and status:
-            break
-
-    # check for valid repository structure
-    if not manifest:
-        print_error('Did not find manifest.json in {}'.format(git_repo))
-        sys.exit(1)
+    # examine the repository, reading the files straight from the zip archive
+    with RepoArchive(downloaded_file) as archive:
+        for root, dirs, files in archive.walk():
+
+            if 'manifest.json' in files:
+                # read the manifest
+                try:
+                    print('Reading the manifest...', end=' ')
+                    content_dir = root
+                    manifest = archive.load_json(os.path.join(root, 'manifest.json'))
+                finally:
+                    print('finished.')
+
+            if 'status.json' in files:
+                # read the meta data
+                try:
+                    print('Reading the status...', end=' ')
+                    content_dir = root
+                    status = OBSStatus.from_dict(archive.load_json(os.path.join(root, 'status.json')))
+                finally:
+                    print('finished.')
+
+            # if we have everything, exit the loop
+            if content_dir and manifest and status:
+                break
+
+        # check for valid repository structure
+        if not manifest:
+            print_error('Did not find manifest.json in {}'.format(git_repo))
+            sys.exit(1)
 
-    if not status:
-        print_error('Did not find status.json in {}'.format(git_repo))
-        sys.exit(1)
+        if not status:
+            print_error('Did not find status.json in {}'.format(git_repo))
+            sys.exit(1)
 
-    print('Initializing OBS object...', end=' ')
-    lang = manifest['target_language']['id']
-    obs_obj = OBS()
-    obs_obj.date_modified = today
-    obs_obj.direction = manifest['target_language']['direction']
-    obs_obj.language = lang
-    print('finished')
+        print('Initializing OBS object...', end=' ')
+        lang = manifest['target_language']['id']
+        obs_obj = OBS()
+        obs_obj.date_modified = today
+        obs_obj.direction = manifest['target_language']['direction']
+        obs_obj.language = lang
+        print('finished')
 
-    obs_obj.chapters = load_obs_chapters(content_dir)
+        obs_obj.chapters = load_obs_chapters(archive, content_dir)
     obs_obj.chapters.sort(key=lambda c: c['number'])
 
     if not obs_obj.verify_all():
@@ -164,10 +160,7 @@ def main(git_repo, tag, no_pdf):
     cat_json = json.dumps(catalog, sort_keys=True, cls=OBSEncoder)
     write_file(cat_path, cat_json)
 
-    # update the catalog
-    print_ok('STARTING: ', 'updating the catalogs.')
-    update_catalog()
-    print_ok('FINISHED: ', 'updating the catalogs.')
+    CatalogUpdater.get_default().request_update('obs-' + lang)
 
     if no_pdf:
         return
@@ -283,9 +276,11 @@ def export_unfolding_word(status, git_dir, json_data, lang_code, github_organiza
     Exports JSON data for each language into its own Github repo.
     """
     global github_org
-    write_file(os.path.join(git_dir, 'obs-{0}.json'.format(lang_code)), json_data)
-    write_file(os.path.join(git_dir, 'obs-{0}-front-matter.json'.format(lang_code)), front_matter)
-    write_file(os.path.join(git_dir, 'obs-{0}-back-matter.json'.format(lang_code)), back_matter)
+    for file_name, content in (('obs-{0}.json', json_data), ('obs-{0}-front-matter.json', front_matter),
+                               ('obs-{0}-back-matter.json', back_matter)):
+        out_file = os.path.join(git_dir, file_name.format(lang_code))
+        changed = write_file(out_file, content)
+        Compressor.get_default().add(out_file, file_name.format('xx'), changed)
     status_str = json.dumps(status, sort_keys=True, cls=OBSEncoder)
     write_file(os.path.join(git_dir, 'status-{0}.json'.format(lang_code)), status_str)
     write_file(os.path.join(git_dir, 'README.md'), OBS.get_readme_text())
@@ -293,13 +288,16 @@ def export_unfolding_word(status, git_dir, json_data, lang_code, github_organiza
     if not github_org:
         return
 
+    # the .gz copies are only for the web server, and must be finished before the files are added to git
+    Compressor.get_default().finish()
+
     gitCreate(git_dir)
     name = 'obs-{0}'.format(lang_code)
     desc = 'Open Bible Stories for {0}'.format(lang_code)
     url = 'http://unfoldingword.org/{0}/'.format(lang_code)
     githubCreate(git_dir, name, desc, url, github_organization)
     commit_msg = status_str
-    gitCommit(git_dir, commit_msg)
+    gitCommit(git_dir, commit_msg, ". ':(exclude)*.gz'")
     gitPush(git_dir)
 
 
@@ -329,7 +327,12 @@ def update_language_catalog(lang, direction, status, date_modified, lang_dict, c
     return updated
 
 
-def load_obs_chapters(content_dir):
+def load_obs_chapters(archive, content_dir):
+    """
+    :param RepoArchive archive:
+    :param str|unicode content_dir: The directory in the archive with a directory for each chapter
+    :return: list<OBSChapter>
+    """
     print('Reading OBS pages...', end=' ')
     chapters = []
 
@@ -340,18 +343,15 @@ def load_obs_chapters(content_dir):
         obs_chapter.number = chapter_num
 
         # get the translated chapter ref
-        with codecs.open(os.path.join(story_dir, 'reference.txt'), 'r', encoding='utf-8-sig') as in_file:
-            obs_chapter.ref = in_file.read()
+        obs_chapter.ref = archive.read_text(os.path.join(story_dir, 'reference.txt'))
 
         # get the translated chapter title
-        with codecs.open(os.path.join(story_dir, 'title.txt'), 'r', encoding='utf-8-sig') as in_file:
-            obs_chapter.title = in_file.read()
+        obs_chapter.title = archive.read_text(os.path.join(story_dir, 'title.txt'))
 
         # loop through the frames for this chapter
-        frame_list = glob.glob('{0}/[0-9][0-9].txt'.format(story_dir))
+        frame_list = archive.glob(story_dir, '[0-9][0-9].txt')
         for frame_file in frame_list:
-            with codecs.open(frame_file, 'r', encoding='utf-8-sig') as in_file:
-                frame_text = in_file.read()
+            frame_text = archive.read_text(frame_file)
 
             frame_id = chapter_num + '-' + os.path.splitext(os.path.basename(frame_file))[0]
 
@@ -380,8 +380,16 @@ if __name__ == '__main__':
     parser.add_argument('-t', '--tag', dest='tag', default='master',
                         required=False, help='Branch or tag to use as the source. Default is master.')
     parser.add_argument('-p', '--nopdf', dest='nopdf', action='store_true', help='Do not produce a PDF.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
+    archive_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
 
     # prompt user to update status.json
     print_notice('Check status.json in the git repository and update the information if needed.')
@@ -14,14 +14,14 @@ from __future__ import print_function, unicode_literals
 import argparse
 import codecs
 import glob
-import json
 import os
 import re
 import datetime
 import sys
-from general_tools.file_utils import make_dir
 from general_tools.print_utils import print_ok, print_notice
-from uw.update_catalog import update_catalog
+from app_code.util import output_writer
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
 
 root = '/var/www/vhosts/door43.org/httpdocs/data/gitrepo'
 pages = os.path.join(root, 'pages')
@@ -79,14 +79,8 @@ def write_json(outfile, p):
     """
     Simple wrapper to write a file as JSON.
     """
-    make_dir(outfile.rsplit('/', 1)[0])
-    f = codecs.open(outfile, 'w', encoding='utf-8')
-    f.write(get_dump(p))
-    f.close()
-
-
-def get_dump(j):
-    return json.dumps(j, sort_keys=True)
+    changed = output_writer.write_json(outfile, p)
+    Compressor.get_default().add(outfile, changed=changed)
 
 
 def get_frame(f, book):
@@ -232,10 +226,9 @@ def run_tn(version, lang, date_today):
         save_tw(version, '{0}/tw_cat.json'.format(api_path), date_today, tw_dict[book])
         del tw_dict[book]
 
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+    Compressor.get_default().finish()
+
+    CatalogUpdater.get_default().request_update('tN')
 
 
 def save_tw(version, filepath, date_today, tw_book_dict):
@@ -255,11 +248,18 @@ if __name__ == '__main__':
     parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
     parser.add_argument('-v', '--version', dest='version', default=False,
                         required=True, help='The version number.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
 
     today = ''.join(str(datetime.date.today()).rsplit('-')[0:3])
 
+    output_writer.report_stats_at_exit()
     print_ok('STARTING: ', 'publishing tN from Dokuwiki.')
     run_tn(args.version, 'en', today)
     print_ok('ALL FINISHED: ', 'publishing tN from Dokuwiki.')
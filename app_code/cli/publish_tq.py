@@ -1,16 +1,16 @@
 from __future__ import print_function, unicode_literals
 import argparse
-import codecs
 import os
 import re
 import sys
 import datetime
-import shutil
-import tempfile
-from general_tools.file_utils import write_file, unzip
 from general_tools.print_utils import print_error, print_ok, print_notice
-from general_tools.url_utils import join_url_parts, download_file
-from uw.update_catalog import update_catalog
+from general_tools.url_utils import join_url_parts
+from app_code.util import archive_cache, output_writer
+from app_code.util.archive_cache import get_cached_archive
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.repo_archive import RepoArchive
 
 api_v2 = '/var/www/vhosts/api.unfoldingword.org/httpdocs/ts/txt/2/'
 
@@ -18,34 +18,33 @@ q_re = re.compile(r'Q\?(.*)', re.UNICODE)
 a_re = re.compile(r'A\.(.*)', re.UNICODE)
 ref_re = re.compile(r'\[(.*?)]', re.UNICODE)
 
-# remember these so we can delete them
-download_dir = ''
-
 
 def main(date_today, tag, version):
-    global download_dir
-
     repo = 'https://git.door43.org/Door43/en-tq'
-    download_dir = tempfile.mkdtemp(prefix='tempTQ_')
-    download_url = join_url_parts(repo, 'archive', '{0}.zip'.format(tag))
-    downloaded_file = os.path.join(download_dir, 'tQ.zip')
 
-    # download the repository
+    # download the repository, or check that the cached copy is still current
     try:
-        print('Downloading {0}...'.format(download_url), end=' ')
-        download_file(download_url, downloaded_file)
+        print('Downloading {0}...'.format(join_url_parts(repo, 'archive', '{0}.zip'.format(tag))), end=' ')
+        downloaded_file = get_cached_archive(repo, tag)
     finally:
         print('finished.')
 
-    try:
-        print('Unzipping...'.format(downloaded_file), end=' ')
-        unzip(downloaded_file, download_dir)
-    finally:
-        print('finished.')
+    with RepoArchive(downloaded_file) as archive:
+        publish_books(archive, date_today, version)
+
+    Compressor.get_default().finish()
+
+    CatalogUpdater.get_default().request_update('tQ')
+
 
-    # examine the repository
-    source_root = os.path.join(download_dir, 'en-tq', 'content')
-    books = [x for x in os.listdir(source_root) if os.path.isdir(os.path.join(source_root, x))]
+def publish_books(archive, date_today, version):
+    """
+    :param RepoArchive archive: The downloaded repository, read without unzipping it
+    :param str|unicode date_today:
+    :param str|unicode version:
+    """
+    source_root = 'en-tq/content'
+    books = [x for x in archive.listdir(source_root) if archive.isdir(os.path.join(source_root, x))]
 
     for book in books:
         print('Processing {}.'.format(book))
@@ -54,18 +53,9 @@ def main(date_today, tag, version):
         # noinspection PyUnresolvedReferences
         book_questions = []  # type: list[dict]
 
-        for entry in os.listdir(book_dir):
-            file_name = os.path.join(book_dir, entry)
-
-            # we are only processing files
-            if not os.path.isfile(file_name):
-                continue
-
-            # we are only processing markdown files
-            if entry[-3:] != '.md':
-                continue
-
-            book_questions.append(get_cq(file_name))
+        # we are only processing markdown files
+        for file_name in archive.glob(book_dir, '*.md'):
+            book_questions.append(get_cq(archive, file_name))
 
         # Check to see if there are published questions in this book
         pub_check = [x['cq'] for x in book_questions if len(x['cq']) > 0]
@@ -74,16 +64,16 @@ def main(date_today, tag, version):
             continue
         book_questions.sort(key=lambda y: y['id'])
         book_questions.append({'date_modified': date_today, 'version': version})
-        write_file('{0}/questions.json'.format(api_path), book_questions, indent=2)
-
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+        changed = output_writer.write_file('{0}/questions.json'.format(api_path), book_questions, indent=2)
+        Compressor.get_default().add('{0}/questions.json'.format(api_path), changed=changed)
 
 
-def get_cq(f):
-    page = codecs.open(f, 'r', encoding='utf-8').read()
+def get_cq(archive, f):
+    """
+    :param RepoArchive archive:
+    :param str|unicode f: The path of the markdown file in the archive
+    """
+    page = archive.read_text(f, 'utf-8')
     return {'id': f.rsplit('/')[-1].rstrip('.md'), 'cq': get_q_and_a(page)}
 
 
@@ -145,17 +135,19 @@ if __name__ == '__main__':
                         required=True, help='The version number of this resource.')
     parser.add_argument('-t', '--tag', dest='tag', default='master',
                         required=False, help='Branch or tag to use as the source. Default is master.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
     today = ''.join(str(datetime.date.today()).rsplit(str('-'))[0:3])
+    archive_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
 
-    try:
-        print_ok('STARTING: ', 'publishing tQ repository.')
-        main(today, args.tag, args.version)
-        print_ok('ALL FINISHED: ', 'publishing tQ repository.')
-        print_notice('Don\'t forget to notify the interested parties.')
-
-    finally:
-        # delete temp files
-        if os.path.isdir(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
+    print_ok('STARTING: ', 'publishing tQ repository.')
+    main(today, args.tag, args.version)
+    print_ok('ALL FINISHED: ', 'publishing tQ repository.')
+    print_notice('Don\'t forget to notify the interested parties.')
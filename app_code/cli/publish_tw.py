@@ -6,12 +6,13 @@ import os
 import re
 import datetime
 import sys
-import shutil
-import tempfile
-from general_tools.file_utils import write_file, unzip
 from general_tools.print_utils import print_ok, print_notice
-from general_tools.url_utils import join_url_parts, download_file
-from uw.update_catalog import update_catalog
+from general_tools.url_utils import join_url_parts
+from app_code.util import archive_cache, output_writer
+from app_code.util.archive_cache import get_cached_archive
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.repo_archive import RepoArchive
 
 api_v2 = '/var/www/vhosts/api.unfoldingword.org/httpdocs/ts/txt/2/'
 tw_aliases = {}
@@ -25,9 +26,6 @@ bold_re = re.compile(r'\*\*(.*?)\*\*', re.UNICODE)
 li_re = re.compile(r'^ *\* ', re.UNICODE | re.MULTILINE)
 h3_re = re.compile(r'\n#### (.*?) ####\n', re.UNICODE)
 
-# remember these so we can delete them
-download_dir = ''
-
 # for getting aliases from tN
 it_re = re.compile(r'==== translationWords: ====(.*?)====', re.UNICODE | re.DOTALL)
 link_re = re.compile(r':([^:]*\|.*?)\]\]', re.UNICODE)
@@ -41,34 +39,26 @@ def main(date_today, tag, version):
     :param str|unicode version:
     :return:
     """
-    global download_dir, tw_aliases
+    global tw_aliases
 
     repo = 'https://git.door43.org/Door43/en-tw'
-    download_dir = tempfile.mkdtemp(prefix='tempTW_')
-    download_url = join_url_parts(repo, 'archive', '{0}.zip'.format(tag))
-    downloaded_file = os.path.join(download_dir, 'tW.zip')
-
-    # download the repository
-    try:
-        print('Downloading {0}...'.format(download_url), end=' ')
-        download_file(download_url, downloaded_file)
-    finally:
-        print('finished.')
 
+    # download the repository, or check that the cached copy is still current
     try:
-        print('Unzipping...'.format(downloaded_file), end=' ')
-        unzip(downloaded_file, download_dir)
+        print('Downloading {0}...'.format(join_url_parts(repo, 'archive', '{0}.zip'.format(tag))), end=' ')
+        downloaded_file = get_cached_archive(repo, tag)
     finally:
         print('finished.')
 
-    # examine the repository
+    # examine the repository, reading the files straight from the zip archive
     tw_list = []
-    for root, dirs, files in os.walk(os.path.join(download_dir, 'en-tw', 'content')):
-        for f in files:
-            file_name = os.path.join(root, f)
-            tw = get_tw(file_name)
-            if tw:
-                tw_list.append(tw)
+    with RepoArchive(downloaded_file) as archive:
+        for root, dirs, files in archive.walk('en-tw/content'):
+            for f in files:
+                file_name = os.path.join(root, f)
+                tw = get_tw(archive, file_name)
+                if tw:
+                    tw_list.append(tw)
 
     for i in tw_list:  # type: dict
         if i['id'] in tw_aliases:
@@ -77,17 +67,19 @@ def main(date_today, tag, version):
     tw_list.sort(key=lambda y: len(y['term']), reverse=True)
     tw_list.append({'date_modified': date_today, 'version': version})
     api_path = os.path.join(api_v2, 'bible', 'en')
-    write_file('{0}/terms.json'.format(api_path), tw_list, indent=2)
+    changed = output_writer.write_json('{0}/terms.json'.format(api_path), tw_list, indent=2)
+    Compressor.get_default().add('{0}/terms.json'.format(api_path), changed=changed)
+    Compressor.get_default().finish()
 
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+    CatalogUpdater.get_default().request_update('tW')
 
 
-def get_tw(f):
-    with codecs.open(f, 'r', encoding='utf-8-sig') as in_file:
-        page = in_file.read()
+def get_tw(archive, f):
+    """
+    :param RepoArchive archive:
+    :param str|unicode f: The path of the markdown file in the archive
+    """
+    page = archive.read_text(f)
 
     # The filename is the ID
     tw = {'id': f.rsplit('/', 1)[1].replace('.md', '')}
@@ -221,18 +213,20 @@ if __name__ == '__main__':
                         required=True, help='The version number of this resource.')
     parser.add_argument('-t', '--tag', dest='tag', default='master',
                         required=False, help='Branch or tag to use as the source. Default is master.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
 
     args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
     today = ''.join(str(datetime.date.today()).rsplit(str('-'))[0:3])
-
-    try:
-        print_ok('STARTING: ', 'publishing tW repository.')
-        get_aliases()
-        main(today, args.tag, args.version)
-        print_ok('ALL FINISHED: ', 'publishing tW repository.')
-        print_notice('Don\'t forget to notify the interested parties.')
-
-    finally:
-        # delete temp files
-        if os.path.isdir(download_dir):
-            shutil.rmtree(download_dir, ignore_errors=True)
+    archive_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
+
+    print_ok('STARTING: ', 'publishing tW repository.')
+    get_aliases()
+    main(today, args.tag, args.version)
+    print_ok('ALL FINISHED: ', 'publishing tW repository.')
+    print_notice('Don\'t forget to notify the interested parties.')
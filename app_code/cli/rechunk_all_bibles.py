@@ -1,19 +1,37 @@
 from __future__ import unicode_literals, print_function
+import argparse
 import codecs
 import json
 import os
+from collections import namedtuple
 from glob import glob
+from multiprocessing import Pool
 import sys
 import re
-from general_tools.file_utils import write_file
+import time
 from general_tools.print_utils import print_notice, print_error, print_ok
-from uw.update_catalog import update_catalog
 from app_code.bible.bible_classes import Bible
 from app_code.bible.content import Book
+from app_code.bible import validation_cache
+from app_code.bible.validation_cache import ValidationCache
+from app_code.bible.versification import Versification
+from app_code.util import app_utils, output_writer, url_cache
 from app_code.cli.api_publish import api_publish
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import OutputWriter, atomic_file, write_file
 
 id_re = re.compile(r'\\id[\u00A0\s](\w{3}).*')
-s5_re = re.compile(r'\\s5[\u00A0\s]*')
+
+# the result of re-chunking one directory, see rechunk_job
+# usfm_files:    the USFM files of the books
+# files_written: the USFM files that were written, the others already had the same text
+# error:         why the directory could not be re-chunked, or None
+RechunkResult = namedtuple('RechunkResult', ['directory', 'usfm_files', 'files_written', 'error', 'seconds'])
+
+
+class RechunkError(Exception):
+    pass
 
 
 def get_source_directories():
@@ -31,7 +49,12 @@ def get_source_directories():
 
 
 def rechunk_this_one(api_directory):
-    global id_re, s5_re
+    """
+    Checks and re-chunks the books in the directory, and writes the ones that changed
+    :param str|unicode api_directory: A language directory, like .../ulb/txt/1/ulb-en
+    :return: tuple of (the USFM files, the USFM files that were written)
+    """
+    global id_re
 
     print_notice('Processing {}'.format(api_directory))
 
@@ -39,26 +62,9 @@ def rechunk_this_one(api_directory):
     with codecs.open(os.path.join(api_directory, 'status.json'), 'r', 'utf-8-sig') as in_file:
         status = json.loads(in_file.read())
 
-    # determine versification
-    if status['lang'] == 'ru':
-        versification = 'rsc'
-
-    elif status['lang'] == 'hi' or status['lang'] == 'sr-Latn' or status['lang'] == 'hu' or status['lang'] == 'ta':
-        versification = 'ufw-odx'
-
-    elif status['lang'] == 'bn':
-        versification = 'ufw-bn'
-
-    elif status['lang'] == 'ar':
-        versification = 'avd'
-
-    elif status['lang'] == 'kn':
-        versification = 'ufw-rev'
-
-    else:
-        versification = 'ufw'
-
-    versification_data = Bible.get_versification(versification)  # type: list<Book>
+    # determine versification, the parsed scheme is shared by all the directories that use it
+    versification = Versification.resolve_scheme(status['lang'], status.get('slug'))
+    versification_data = Versification.get(versification)  # type: Versification
 
     # remove all .sig files
     for f in os.listdir(api_directory):
@@ -68,6 +74,8 @@ def rechunk_this_one(api_directory):
     # rechunk files in this directory
     usfm_files = glob(os.path.join(api_directory, '*.usfm'))
     errors_found = False
+    book_files = []
+    files_written = []
     for usfm_file in usfm_files:
 
         if usfm_file.endswith('LICENSE.usfm'):
@@ -80,27 +88,22 @@ def rechunk_this_one(api_directory):
         # get the book id
         book_search = id_re.search(book_text)
         if not book_search:
-            print_error('Book id not found in {}'.format(usfm_file))
-            sys.exit(1)
+            raise RechunkError('Book id not found in {}'.format(usfm_file))
 
         book_id = book_search.group(1)
 
         print('Beginning {}...'.format(book_id), end=' ')
 
-        # get book versification info
-        book = next((b for b in versification_data if b.book_id == book_id), None)
-        if not book:
-            print_error('Book versification data was not found for "{}"'.format(book_id))
-            sys.exit(1)
-
-        # remove \s5 lines
-        book_text = s5_re.sub('', book_text)
+        # get book versification info, a new Book from the skeleton of the shared scheme
+        if not versification_data.has_chapters(book_id):
+            raise RechunkError('Book versification data was not found for "{}"'.format(book_id))
+        book = versification_data.create_book(book_id)  # type: Book
 
-        # get the usfm for the book
-        book.set_usfm(book_text)
+        # get the usfm for the book, without the \s5 lines
+        book.set_usfm(book_text, strip_s5=True)
 
-        # do basic checks
-        book.verify_chapters_and_verses(True)
+        # do basic checks, unless this text has already been checked
+        validation_cache.verify_book(book, versification)
         if book.validation_errors:
             errors_found = True
 
@@ -111,35 +114,186 @@ def rechunk_this_one(api_directory):
         # produces something like '01-GEN.usfm'
         book_file_name = '{0}-{1}.usfm'.format(str(book.number).zfill(2), book.book_id)
         print('Writing ' + book_file_name + '...', end=' ')
-        write_file(usfm_file, book.usfm)
+        book_files.append(usfm_file)
+        if write_file(usfm_file, book.usfm):
+            files_written.append(usfm_file)
 
         print('finished.')
 
     if errors_found:
-        print_error('These USFM errors must be corrected before publishing can continue.')
-        sys.exit(1)
-
-    # rebuild source for tS
-    print()
-    print('Publishing to the API...')
-    with api_publish(api_directory) as api:
-        api.run()
-    print('Finished publishing to the API.')
-
-    # update the catalog
-    print()
-    print('Updating the catalogs...', end=' ')
-    update_catalog()
-    print('finished.')
+        raise RechunkError('These USFM errors must be corrected before publishing can continue.')
+
+    return book_files, files_written
+
+
+def rechunk_job(api_directory):
+    """
+    Runs rechunk_this_one in a pool process, or in this process when there is no pool
+    :param str|unicode api_directory:
+    :return: RechunkResult
+    """
+    start = time.time()
+    try:
+        book_files, files_written = rechunk_this_one(api_directory)
+        return RechunkResult(api_directory, book_files, files_written, None, time.time() - start)
+
+    except RechunkError as e:
+        return RechunkResult(api_directory, [], [], e.args[0], time.time() - start)
+
+    except (Exception, SystemExit) as e:
+        # anything else that goes wrong only stops this directory
+        return RechunkResult(api_directory, [], [], '{0}: {1}'.format(type(e).__name__, e), time.time() - start)
+
+
+class RechunkScheduler(object):
+    """
+    Re-chunks the language directories on a pool of processes, then publishes the directories that finished to the
+    API and updates the catalogs once, at the end of the batch.
+
+    Each directory that finishes is saved in a checkpoint file, so if the script is stopped the next run only
+    re-chunks the directories that are left. A directory that fails does not stop the others: the failures are listed
+    at the end and those directories are tried again on the next run. The checkpoint is removed when every directory
+    has been re-chunked and published.
+    """
+
+    def __init__(self, checkpoint_file=None, jobs=1, restart=False):
+        """
+        :param str|unicode checkpoint_file: Defaults to rechunk-checkpoint.json in app_utils.get_cache_dir()
+        :param int jobs: The number of directories to re-chunk at the same time
+        :param bool restart: Ignore the checkpoint and re-chunk every directory
+        """
+        self.checkpoint_file = checkpoint_file if checkpoint_file else \
+            os.path.join(app_utils.get_cache_dir(), 'rechunk-checkpoint.json')
+        self.jobs = jobs
+        self.restart = restart
+
+    def load_checkpoint(self):
+        """
+        :return: list<str> The directories that have already been re-chunked, empty if there is no checkpoint
+        """
+        if self.restart:
+            return []
+
+        try:
+            with codecs.open(self.checkpoint_file, 'r', 'utf-8') as in_file:
+                return json.loads(in_file.read())['completed']
+
+        except (IOError, ValueError, KeyError):
+            return []
+
+    def save_checkpoint(self, completed):
+        """
+        :param list<str> completed: The directories that have been re-chunked
+        """
+        with atomic_file(self.checkpoint_file) as out_file:
+            out_file.write(json.dumps({'completed': sorted(completed)}, sort_keys=True, indent=2).encode('utf-8'))
+
+    def remove_checkpoint(self):
+        if os.path.isfile(self.checkpoint_file):
+            os.remove(self.checkpoint_file)
+
+    def rechunk_directories(self, directories):
+        """
+        Re-chunks the directories, in a pool of processes if self.jobs is more than 1. The results are returned as the
+        directories are finished, in any order.
+        :param list<str> directories:
+        :return: generator<RechunkResult>
+        """
+        if self.jobs < 2 or len(directories) < 2:
+            for directory in directories:
+                yield rechunk_job(directory)
+            return
+
+        # the files written in the pool processes are not counted by the OutputWriter of this process
+        writer = OutputWriter.get_default()
+
+        pool = Pool(min(self.jobs, len(directories)))
+        try:
+            for result in pool.imap_unordered(rechunk_job, directories):
+                writer.count(len(result.files_written), len(result.usfm_files) - len(result.files_written))
+                yield result
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def run(self, directories):
+        """
+        :param list<str> directories: The language directories to re-chunk, see get_source_directories
+        :return: list<RechunkResult> The directories that failed
+        """
+        completed = [d for d in self.load_checkpoint() if d in directories]
+        if completed:
+            print_notice('Resuming: {0} of {1} directories were already re-chunked'.format(len(completed),
+                                                                                       len(directories)))
+
+        failed = []
+        compressor = Compressor.get_default()
+
+        for result in self.rechunk_directories([d for d in directories if d not in completed]):
+            if result.error:
+                print_error('{0} failed: {1}'.format(result.directory, result.error))
+                failed.append(result)
+                continue
+
+            # compressed here, the pool processes end without finishing their own compressors
+            for usfm_file in result.usfm_files:
+                compressor.add(usfm_file, 'usfm', usfm_file in result.files_written)
+
+            completed.append(result.directory)
+            self.save_checkpoint(completed)
+
+        # the publish pool must not be forked while the compressor threads are writing, a process that inherits a lock
+        # held by one of the threads waits for it forever
+        compressor.finish()
+
+        if completed:
+            # rebuild source for tS
+            print()
+            print('Publishing to the API...')
+            with api_publish([d for d in directories if d in completed], self.jobs) as api:
+                api.run()
+            print('Finished publishing to the API.')
+
+            catalog = CatalogUpdater.get_default()
+            catalog.request_update('rechunked Bibles')
+            catalog.update_now()
+
+        if failed:
+            print()
+            print_error('{0} of {1} directories failed:'.format(len(failed), len(directories)))
+            for result in sorted(failed):
+                print('  {0}: {1}'.format(result.directory, result.error))
+        else:
+            self.remove_checkpoint()
+
+        return failed
 
 
 if __name__ == '__main__':
-
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--no-cache', dest='no_cache', action='store_true', default=False,
+                        help='Check every book, even if the same text has been checked before.')
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=1, required=False,
+                        help='Number of directories to re-chunk at the same time. Default is 1.')
+    parser.add_argument('--restart', dest='restart', action='store_true', default=False,
+                        help='Ignore the checkpoint of an earlier run and re-chunk every directory.')
+    parser.add_argument('--defer-catalog', dest='defer_catalog', action='store_true', default=False,
+                        help='Do not update the catalogs yet, when more publish commands follow. Same as setting '
+                             'UW_PUBLISH_DEFER_CATALOG.')
+
+    args = parser.parse_args(sys.argv[1:])
+    if args.defer_catalog:
+        CatalogUpdater.get_default().deferred = True
+    CatalogUpdater.get_default().register_at_exit()
+
+    url_cache.report_stats_at_exit()
+    output_writer.report_stats_at_exit()
+    ValidationCache.get_default().enabled = not args.no_cache
     print_ok('STARTING: ', 're-chunking all Bibles.')
 
-    source_directories = get_source_directories()
-
-    for source_directory in source_directories:
-        rechunk_this_one(source_directory)
+    failures = RechunkScheduler(jobs=args.jobs, restart=args.restart).run(get_source_directories())
+    if failures:
+        sys.exit(1)
 
     print_ok('ALL FINISHED: ', 're-chunking all Bibles.')
@@ -11,10 +11,12 @@
 
 from __future__ import print_function, unicode_literals
 from general_tools.print_utils import print_ok
-from uw.update_catalog import update_catalog
+from app_code.util.catalog_updater import CatalogUpdater
 
 if __name__ == '__main__':
     print()
     print_ok('STARTING: ', 'updating the catalogs.')
-    update_catalog()
+
+    # also clears the updates left by commands run with --defer-catalog
+    CatalogUpdater.get_default().update_now(force=True)
     print_ok('FINISHED: ', 'updating the catalogs.')
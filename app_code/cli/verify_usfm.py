@@ -3,15 +3,24 @@ import argparse
 import codecs
 import os
 import sys
+import time
+from collections import namedtuple
 from glob import glob
 import re
+from multiprocessing import Pool
 from general_tools.print_utils import print_ok, print_error
-from app_code.bible.bible_classes import Bible
-from app_code.bible.content import Book
+from app_code.bible import error_collector, validation_cache
+from app_code.bible.error_collector import ErrorCollector
+from app_code.bible.validation_cache import ValidationCache
+from app_code.bible.usfm_stream import UsfmStreamVerifier
+from app_code.bible.versification import Versification
+from app_code.util import url_cache
 
 if sys.version_info < (3, 0):
+    from StringIO import StringIO
     prompt = raw_input
 else:
+    from io import StringIO
     prompt = input
 
 try:
@@ -20,60 +29,218 @@ except ImportError:
     import urllib2
 
 id_re = re.compile(r'\\id[\u00A0\s](\w{3}).*')
-s5_re = re.compile(r'\\s5\s*')
 
+# the result of checking one file, output is what was printed while checking it, errors is a list<ErrorRecord>
+FileResult = namedtuple('FileResult', ['usfm_file', 'book_id', 'output', 'errors', 'fatal_error', 'cached',
+                                       'seconds'])
 
-def main(directory_to_check, versification):
+
+def find_usfm_files(directory_to_check):
+    """
+    :param str|unicode directory_to_check:
+    :return: list<str|unicode> The usfm files in the directory, in the order they are checked
+    """
+    patterns = ['*.usfm', '*.sfm', '*.SFM']
+    usfm_files = []
+    for pattern in patterns:
+        usfm_files.extend(sorted(glob(os.path.join(directory_to_check, pattern))))
+
+    return usfm_files
+
+
+def verify_file(usfm_file, versification, capture_output=False, stream=False):
+    """
+    Checks one usfm file
+    :param str|unicode usfm_file:
+    :param str|unicode versification:
+    :param bool capture_output: Return the printed messages in the result instead of printing them
+    :param bool stream: Check the file one chapter at a time, see verify_stream
+    :return: FileResult
+    """
+    start = time.time()
+    book_id = None
+    errors = []
+    fatal_error = None
+    cached = False
+
+    saved_stdout = sys.stdout
+    if capture_output:
+        sys.stdout = StringIO()
+
+    try:
+        if stream:
+            book_id, errors, fatal_error = verify_stream(usfm_file, versification)
+
+        else:
+            # read the file
+            with codecs.open(usfm_file, 'r', 'utf-8') as in_file:
+                book_text = in_file.read()
+
+            # get the book id
+            book_search = id_re.search(book_text)
+            if book_search:
+                book_id = book_search.group(1)
+                errors, fatal_error, cached = verify_book(book_id, book_text, versification)
+            else:
+                fatal_error = 'Book id not found in {}'.format(usfm_file)
+
+        output = sys.stdout.getvalue() if capture_output else ''
+
+    finally:
+        sys.stdout = saved_stdout
+
+    return FileResult(usfm_file, book_id, output, errors, fatal_error, cached, time.time() - start)
+
+
+def verify_book(book_id, book_text, versification):
+    """
+    :param str|unicode book_id:
+    :param str|unicode book_text:
+    :param str|unicode versification:
+    :return: tuple of (list<ErrorRecord>, fatal error message or None, True if the errors were cached)
+    """
+    print('Beginning {}...'.format(book_id), end=' ')
+
+    # get book versification info
+    vrs = Versification.get(versification)
+    book = vrs.create_book(book_id) if vrs.has_chapters(book_id) else None
+    if not book:
+        return [], 'Book versification data was not found for "{}"'.format(book_id), False
+
+    # get the usfm for the book, without the \s5 lines
+    book.set_usfm(book_text, strip_s5=True)
+
+    # do basic checks, unless this text has already been checked
+    cached = validation_cache.verify_book(book, versification, split_chapters=False)
+
+    print('finished.')
+
+    return book.error_records, None, cached
+
+
+def verify_stream(usfm_file, versification):
+    """
+    Checks the file one chapter at a time, so it does not have to fit in memory. The file may have more than one book.
+    :param str|unicode usfm_file:
+    :param str|unicode versification:
+    :return: tuple of (the book ids, list<ErrorRecord>, fatal error message or None)
+    """
+    book_ids = []
+    errors = []
+
+    try:
+        for book in UsfmStreamVerifier(versification).verify_file(usfm_file):
+            book_ids.append(book.book_id)
+            errors.extend(book.error_records)
+            print('finished.')
+
+    except Exception as e:
+        return ' '.join(book_ids), errors, '{0}'.format(e)
+
+    return ' '.join(book_ids), errors, None
+
+
+def verify_file_captured(args):
+    """
+    Runs verify_file in a pool process
+    :param tuple args: (usfm_file, versification, stream)
+    :return: FileResult
+    """
+    return verify_file(args[0], args[1], True, args[2])
+
+
+def verify_files(usfm_files, versification, jobs=1, stream=False):
+    """
+    Checks the files, in a pool of processes if jobs is more than 1. The results are always returned in the same
+    order as usfm_files, each one as soon as it and the ones before it are finished.
+    :param list<str|unicode> usfm_files:
+    :param str|unicode versification:
+    :param int jobs: The number of files to check at the same time
+    :param bool stream: Check each file one chapter at a time
+    :return: generator<FileResult>
+    """
+    # load the versification before starting the pool, so every process does not have to load it
+    Versification.get(versification)
+
+    if jobs < 2 or len(usfm_files) < 2:
+        for usfm_file in usfm_files:
+            yield verify_file(usfm_file, versification, stream=stream)
+        return
+
+    pool = Pool(min(jobs, len(usfm_files)))
+    try:
+        for result in pool.imap(verify_file_captured, [(f, versification, stream) for f in usfm_files]):
+            yield result
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def print_timings(results, seconds):
+    """
+    :param list<FileResult> results:
+    :param float seconds: The total elapsed time
+    """
+    print()
+    print('{0:<40}{1:<6}{2:>8}{3:>8}{4:>12}'.format('file', 'book', 'errors', 'cached', 'time (s)'))
+    for result in results:
+        print('{0:<40}{1:<6}{2:>8}{3:>8}{4:>12.3f}'.format(os.path.basename(result.usfm_file), result.book_id or '',
+                                                           len(result.errors), 'yes' if result.cached else 'no',
+                                                           result.seconds))
+
+    print('{0} files checked in {1:.3f} seconds, {2:.3f} seconds of checking, {3} unchanged'.format(
+        len(results), seconds, sum(r.seconds for r in results), sum(1 for r in results if r.cached)))
+
+
+def main(directory_to_check, versification, jobs=1, use_cache=True, stream=False, report_file=None,
+         max_per_code=None):
     """
 
     :param str|unicode directory_to_check:
     :param str|unicode versification:
+    :param int jobs: The number of files to check at the same time
+    :param bool use_cache: Use the results of earlier checks of the same text
+    :param bool stream: Check the files one chapter at a time, for files too big to check at once
+    :param str|unicode report_file: Also write the errors to this .json or .jsonl file
+    :param int max_per_code: The most errors of one kind to print for a book, 0 for no limit
     """
+    start = time.time()
 
-    # get the versification data
-    vrs = Bible.get_versification(versification)  # type: list<Book>
+    # set before starting the pool, so the pool processes get the same settings
+    ValidationCache.get_default().enabled = use_cache
+    if max_per_code is not None:
+        ErrorCollector.get_default().max_per_code = max_per_code
 
     # walk through the usfm files
-    patterns = ['*.usfm', '*.sfm', '*.SFM']
-    usfm_files = []
-    for pattern in patterns:
-        usfm_files.extend(glob(os.path.join(directory_to_check, pattern)))
+    usfm_files = find_usfm_files(directory_to_check)
 
     errors_found = False
-    for usfm_file in usfm_files:
+    results = []
+    for result in verify_files(usfm_files, versification, jobs, stream):
 
-        # read the file
-        with codecs.open(usfm_file, 'r', 'utf-8') as in_file:
-            book_text = in_file.read()
+        # the pool processes capture what they print, it is printed here in file order
+        if result.output:
+            print(result.output, end='')
 
-        # get the book id
-        book_search = id_re.search(book_text)
-        if not book_search:
-            print_error('Book id not found in {}'.format(usfm_file))
+        if result.fatal_error:
+            print_error(result.fatal_error)
             sys.exit(1)
 
-        book_id = book_search.group(1)
-
-        print('Beginning {}...'.format(book_id), end=' ')
-
-        # get book versification info
-        book = next((b for b in vrs if b.book_id == book_id), None)
-        if not book:
-            print_error('Book versification data was not found for "{}"'.format(book_id))
-            sys.exit(1)
+        if result.errors:
+            errors_found = True
 
-        # remove \s5 lines
-        book_text = s5_re.sub('', book_text)
+        results.append(result)
 
-        # get the usfm for the book
-        book.set_usfm(book_text)
+    print_timings(results, time.time() - start)
 
-        # do basic checks
-        book.verify_chapters_and_verses(True)
-        if book.validation_errors:
-            errors_found = True
+    records = [record for result in results for record in result.errors]
+    if records:
+        print()
+        for code, count in sorted(error_collector.get_summary(records).items()):
+            print('{0:<32}{1:>8}'.format(code, count))
 
-        print('finished.')
+    if report_file:
+        error_collector.write_report(records, report_file)
 
     # stop if errors were found
     if errors_found:
@@ -87,9 +254,23 @@ if __name__ == '__main__':
                         help='The directory to check.')
     parser.add_argument('-v', '--versification', dest='versification', default='ufw', required=False,
                         help='Versification system - current options are "ufw" (unfoldingWord) and "rsc" (Russian)')
+    parser.add_argument('--no-cache', dest='no_cache', action='store_true', default=False,
+                        help='Check every file, even if the same text has been checked before.')
+    parser.add_argument('--stream', dest='stream', action='store_true', default=False,
+                        help='Check each file one chapter at a time, for very large files or files with more than one '
+                             'book. The validation cache is not used.')
+    parser.add_argument('--report', dest='report', default=None, required=False,
+                        help='Also write the errors to this file, as json, or as one json object per line if the name '
+                             'ends with .jsonl.')
+    parser.add_argument('--max-errors', dest='max_errors', type=int, default=None, required=False,
+                        help='The most errors of one kind to print for a book, 0 for no limit. Default is {0}.'.format(
+                            ErrorCollector.default_max_per_code))
+    parser.add_argument('-j', '--jobs', dest='jobs', type=int, default=1, required=False,
+                        help='Number of files to check at the same time. Default is 1.')
 
     args = parser.parse_args(sys.argv[1:])
 
+    url_cache.report_stats_at_exit()
     print_ok('STARTING: ', 'validating USFM files.')
-    main(args.directory, args.versification)
+    main(args.directory, args.versification, args.jobs, not args.no_cache, args.stream, args.report, args.max_errors)
     print_ok('ALL FINISHED: ', 'validating USFM files.')
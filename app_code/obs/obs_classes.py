@@ -35,6 +35,16 @@ class OBSStatus(object):
     def __contains__(self, item):
         return item in self.__dict__
 
+    @staticmethod
+    def from_dict(status_dict):
+        """
+        :param dict status_dict: The deserialized status.json, like from RepoArchive.load_json
+        :return: OBSStatus
+        """
+        status = OBSStatus()
+        status.__dict__ = status_dict
+        return status
+
     @staticmethod
     def from_manifest(manifest):
         status = OBSStatus()
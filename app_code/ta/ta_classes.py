@@ -62,6 +62,14 @@ def load_yaml_object(file_name, default=None):
         # read the text from the file
         content = in_file.read()
 
+    return parse_yaml(content)
+
+
+def parse_yaml(content):
+    """
+    Deserializes yaml text, like from RepoArchive.read_text, into a Python object
+    :param unicode content:
+    """
     # convert Windows line endings to Linux line endings
     content = content.replace('\r\n', '\n')
 
@@ -78,30 +86,7 @@ class TAMetaData(object):
         # deserialize
         if file_name:
             if os.path.isfile(file_name):
-                meta = load_yaml_object(file_name)
-                self.mod = int(time.time())
-                self.manual = meta['manual']
-                self.manual_title = meta['manual_title']
-                self.volume = meta['volume']
-
-                language = meta['language']
-                self.language = {
-                    'lc': language['code'],
-                    'name': language['name'],
-                    'anglicized_name': language['anglicized_name'],
-                    'direction': language['direction']
-                }
-
-                self.status = TAStatus()
-                self.status.checking_entity = meta['checking_entity']
-                self.status.checking_level = meta['checking_level']
-                self.status.comments = meta['comments']
-                self.status.contributors = meta['contributors']
-                self.status.license = meta['license']
-                self.status.publish_date = meta['publish_date']
-                self.status.source_text = meta['source_text']
-                self.status.source_text_version = meta['source_text_version']
-                self.status.version = meta['version']
+                self.load_meta(load_yaml_object(file_name))
             else:
                 raise IOError('The file {0} was not found.'.format(file_name))
         else:
@@ -128,6 +113,44 @@ class TAMetaData(object):
             self.status.source_text_version = ''
             self.status.version = ''
 
+    def load_meta(self, meta):
+        """
+        :param dict meta: The deserialized meta.yaml
+        """
+        self.mod = int(time.time())
+        self.manual = meta['manual']
+        self.manual_title = meta['manual_title']
+        self.volume = meta['volume']
+
+        language = meta['language']
+        self.language = {
+            'lc': language['code'],
+            'name': language['name'],
+            'anglicized_name': language['anglicized_name'],
+            'direction': language['direction']
+        }
+
+        self.status = TAStatus()
+        self.status.checking_entity = meta['checking_entity']
+        self.status.checking_level = meta['checking_level']
+        self.status.comments = meta['comments']
+        self.status.contributors = meta['contributors']
+        self.status.license = meta['license']
+        self.status.publish_date = meta['publish_date']
+        self.status.source_text = meta['source_text']
+        self.status.source_text_version = meta['source_text_version']
+        self.status.version = meta['version']
+
+    @staticmethod
+    def from_dict(meta):
+        """
+        :param dict meta: The deserialized meta.yaml, like from parse_yaml
+        :return: TAMetaData
+        """
+        metadata_obj = TAMetaData()
+        metadata_obj.load_meta(meta)
+        return metadata_obj
+
     def to_serializable(self):
         return self.__dict__
 
@@ -147,10 +170,25 @@ class TATableOfContents(object):
         if not os.path.isfile(file_name):
             raise IOError('The file {0} was not found.'.format(file_name))
 
-        toc = load_yaml_object(file_name)
+        self.load_items(load_yaml_object(file_name))
+
+    def load_items(self, toc):
+        """
+        :param list toc: The deserialized toc.yaml
+        """
         for item in toc:
             self.items.append(TATableOfContentsItem(item))
 
+    @staticmethod
+    def from_list(toc):
+        """
+        :param list toc: The deserialized toc.yaml, like from parse_yaml
+        :return: TATableOfContents
+        """
+        toc_obj = TATableOfContents()
+        toc_obj.load_items(toc)
+        return toc_obj
+
     def all_slugs(self):
         slugs = []
 
@@ -389,16 +427,18 @@ class TAManual(object):
         self.toc = toc      # type: TATableOfContents
         self.articles = []  # type: list<TAArticle>
 
-    def load_pages(self, content_dir):
+    def load_pages(self, archive, content_dir):
+        """
+        :param RepoArchive archive: The downloaded repository
+        :param str|unicode content_dir: The directory in the archive with the markdown file for each page
+        """
 
         toc_slugs = self.toc.all_slugs()
         for slug in toc_slugs:
 
             print('Processing {0}...'.format(slug), end=' ')
 
-            file_name = os.path.join(content_dir, slug + '.md')
-            with codecs.open(file_name, 'r', 'utf-8-sig') as in_file:
-                content = in_file.read()
+            content = archive.read_text(os.path.join(content_dir, slug + '.md'))
 
             article = TAArticle(content, slug)
             if not article.yaml:
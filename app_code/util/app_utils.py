@@ -25,3 +25,11 @@ def get_tools_dir():
         return None
 
     return tools_dir
+
+
+def get_cache_dir():
+    cache_dir = os.environ.get('UW_PUBLISH_CACHE_DIR')
+    if not cache_dir:
+        cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'uw-publish')
+
+    return cache_dir
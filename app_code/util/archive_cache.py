@@ -0,0 +1,282 @@
+from __future__ import print_function, unicode_literals
+import atexit
+import codecs
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zipfile
+from contextlib import closing
+from general_tools.print_utils import print_notice
+from general_tools.url_utils import join_url_parts
+from app_code.util import app_utils
+from app_code.util.output_writer import atomic_file, buffer_size, get_temp_name, make_parent_dir, replace_file
+
+try:
+    import urllib.request as urllib2
+    from urllib.error import HTTPError
+except ImportError:
+    import urllib2
+    from urllib2 import HTTPError
+
+# git archive puts the id of the commit in the zip file comment
+commit_re = re.compile(r'^[0-9a-f]{40}$')
+
+
+class ArchiveCache(object):
+    """
+    A local cache for the repository archives the publishers download, like en-tw/archive/master.zip.
+
+    The archives are stored by the SHA-1 of their content in <cache_dir>/archives/objects, and each repository and tag
+    has a small json file in <cache_dir>/archives/refs that points to the content and remembers the ETag and
+    Last-Modified headers, and the commit from the zip file comment. A branch or tag can move, so a conditional request
+    is sent every time the archive is used, and the cached archive is only used without a download when the server
+    says it has not changed. If the server cannot be reached an IOError is raised, because the branch or tag may have
+    moved since the archive was cached. In offline mode only the cache is used.
+
+    The objects are evicted least recently used first when they take more than max_size bytes.
+    """
+
+    # do not access this directly, use ArchiveCache.get_default
+    default_cache = None
+
+    # two gigabytes
+    default_max_size = 2 * 1024 * 1024 * 1024
+
+    def __init__(self, cache_dir=None, max_size=None, offline=None):
+        """
+        :param str|unicode cache_dir: Defaults to archives in app_utils.get_cache_dir()
+        :param int max_size: Bytes the archives can use. Defaults to UW_PUBLISH_ARCHIVE_CACHE_MB if it is set.
+        :param bool offline: Never use the network. Defaults to True if UW_PUBLISH_OFFLINE is set.
+        """
+        self.cache_dir = cache_dir if cache_dir else os.path.join(app_utils.get_cache_dir(), 'archives')
+
+        if max_size is None:
+            max_mb = os.environ.get('UW_PUBLISH_ARCHIVE_CACHE_MB')
+            max_size = int(max_mb) * 1024 * 1024 if max_mb else self.default_max_size
+        self.max_size = max_size
+
+        self.offline = bool(os.environ.get('UW_PUBLISH_OFFLINE')) if offline is None else offline
+
+        self.revalidated = 0  # type: int  # the server said the cached archive has not changed
+        self.downloaded = 0   # type: int
+        self.evicted = 0      # type: int
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: ArchiveCache
+        """
+        if not ArchiveCache.default_cache:
+            ArchiveCache.default_cache = ArchiveCache()
+
+        return ArchiveCache.default_cache
+
+    def get_archive(self, git_repo, tag):
+        """
+        Returns the name of the cached zip file for the repository at this branch or tag, downloading it if needed
+        :param str|unicode git_repo: Like https://git.door43.org/Door43/en-tw
+        :param str|unicode tag: A branch or tag
+        :return: str|unicode
+        """
+        return self.get_file(join_url_parts(git_repo, 'archive/' + tag + '.zip'))
+
+    def get_file(self, url):
+        """
+        Returns the name of the cached copy of the url, downloading it if needed. Do not change or delete the file.
+        :param str|unicode url:
+        :return: str|unicode
+        """
+        ref = self.load_ref(url)
+        file_name = self.object_file(ref['object']) if ref else None
+        if file_name and not os.path.isfile(file_name):
+            file_name = None
+
+        if self.offline:
+            if not file_name:
+                raise IOError('The url {0} is not in the cache, and offline mode is on.'.format(url))
+
+            self.touch(file_name)
+            return file_name
+
+        request = urllib2.Request(url)
+        if file_name:
+            if ref.get('etag'):
+                request.add_header('If-None-Match', ref['etag'])
+            if ref.get('last_modified'):
+                request.add_header('If-Modified-Since', ref['last_modified'])
+
+        try:
+            with closing(urllib2.urlopen(request)) as response:
+                object_id = self.save_object(response)
+                headers = response.info()
+
+        except HTTPError as e:
+            if e.code != 304 or not file_name:
+                raise
+
+            # not modified
+            ref['fetched'] = time.time()
+            self.save_ref(url, ref)
+            self.touch(file_name)
+            self.count('revalidated')
+            return file_name
+
+        except IOError as e:
+            if not file_name:
+                raise
+
+            # do not publish from an archive that may be out of date without being told to
+            raise IOError('Could not check for changes to {0}, the cached archive is from commit {1}. Set '
+                          'UW_PUBLISH_OFFLINE to use it anyway. {2}'.format(url, ref.get('commit'), e))
+
+        file_name = self.object_file(object_id)
+        ref = {'url': url,
+               'object': object_id,
+               'commit': get_commit(file_name),
+               'etag': headers.get('ETag'),
+               'last_modified': headers.get('Last-Modified'),
+               'fetched': time.time()}
+        self.save_ref(url, ref)
+        self.count('downloaded')
+
+        self.evict(keep=object_id)
+        return file_name
+
+    def count(self, counter, amount=1):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def get_stats(self):
+        return 'Archive cache: {0} revalidated, {1} downloaded, {2} evicted'.format(
+            self.revalidated, self.downloaded, self.evicted)
+
+    def ref_file(self, url):
+        return os.path.join(self.cache_dir, 'refs', hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def object_file(self, object_id):
+        return os.path.join(self.cache_dir, 'objects', object_id + '.zip')
+
+    def load_ref(self, url):
+        """
+        :param str|unicode url:
+        :return: dict|None
+        """
+        file_name = self.ref_file(url)
+        if not os.path.isfile(file_name):
+            return None
+
+        try:
+            with codecs.open(file_name, 'r', 'utf-8') as in_file:
+                ref = json.loads(in_file.read())
+        except ValueError:
+            return None
+
+        # make sure this is not a hash collision
+        return ref if ref.get('url') == url else None
+
+    def save_ref(self, url, ref):
+        with atomic_file(self.ref_file(url)) as out_file:
+            out_file.write(json.dumps(ref, sort_keys=True).encode('utf-8'))
+
+    def save_object(self, response):
+        """
+        Saves the download a piece at a time, so the archive is never all in memory
+        :param response: The open url
+        :return: str The SHA-1 of the content
+        """
+        temp_name = get_temp_name(os.path.join(self.cache_dir, 'objects', 'download'))
+        make_parent_dir(temp_name)
+        try:
+            sha1 = hashlib.sha1()
+            with open(temp_name, 'wb') as out_file:
+                while True:
+                    chunk = response.read(buffer_size)
+                    if not chunk:
+                        break
+                    sha1.update(chunk)
+                    out_file.write(chunk)
+
+            object_id = sha1.hexdigest()
+            file_name = self.object_file(object_id)
+            if os.path.isfile(file_name):
+                self.touch(file_name)
+            else:
+                replace_file(temp_name, file_name)
+
+            return object_id
+
+        finally:
+            if os.path.isfile(temp_name):
+                os.remove(temp_name)
+
+    @staticmethod
+    def touch(file_name):
+        # the modified time of an object is the last time it was used
+        os.utime(file_name, None)
+
+    def evict(self, keep=None):
+        """
+        Removes the least recently used archives until they fit in max_size
+        :param str|unicode keep: The SHA-1 of an archive that is in use and is not removed
+        """
+        objects_dir = os.path.join(self.cache_dir, 'objects')
+        if not os.path.isdir(objects_dir):
+            return
+
+        objects = []
+        for name in os.listdir(objects_dir):
+            file_name = os.path.join(objects_dir, name)
+            if name.endswith('.zip') and os.path.isfile(file_name):
+                objects.append((os.path.getmtime(file_name), os.path.getsize(file_name), name[:-4], file_name))
+
+        total = sum(size for mtime, size, object_id, file_name in objects)
+        for mtime, size, object_id, file_name in sorted(objects):
+            if total <= self.max_size:
+                break
+
+            if object_id == keep:
+                continue
+
+            # a ref that points to a removed object is treated as not cached
+            os.remove(file_name)
+            total -= size
+            self.count('evicted')
+
+
+def get_commit(file_name):
+    """
+    :return: str|None The commit id git archive wrote in the zip file comment
+    """
+    try:
+        with zipfile.ZipFile(file_name) as zip_file:
+            comment = zip_file.comment.decode('ascii').strip()
+    except (zipfile.BadZipfile, UnicodeDecodeError):
+        return None
+
+    return comment if commit_re.match(comment) else None
+
+
+def get_cached_archive(git_repo, tag):
+    """
+    Use in place of general_tools.url_utils.download_file for repository archives
+    :param str|unicode git_repo:
+    :param str|unicode tag:
+    :return: str|unicode The name of the cached zip file
+    """
+    return ArchiveCache.get_default().get_archive(git_repo, tag)
+
+
+def print_stats():
+    print_notice(ArchiveCache.get_default().get_stats())
+
+
+def report_stats_at_exit():
+    """
+    Call this from a command line script to print the archive cache report when the script ends
+    """
+    atexit.register(print_stats)
@@ -0,0 +1,108 @@
+from __future__ import print_function, unicode_literals
+import atexit
+import codecs
+import os
+from general_tools.print_utils import print_notice
+from uw.update_catalog import update_catalog
+from app_code.util import app_utils
+
+
+class CatalogUpdater(object):
+    """
+    Updates the catalogs once for a publishing session, instead of after every resource that is published.
+
+    A publisher calls request_update after it changes something in the api, and the catalogs are updated when the
+    script ends, or when update_now is called at the end of a batch. The request is also saved in a marker file in the
+    cache directory. When the update is deferred, for example with --defer-catalog while several publish commands are
+    chained together, the marker is left in place. The next publish command that is not deferred updates the catalogs
+    when it ends, even if it did not publish anything itself, because each publish script calls register_at_exit when
+    it starts. update_catalog.py also updates them.
+    """
+
+    # do not access this directly, use CatalogUpdater.get_default
+    default_updater = None
+
+    def __init__(self, deferred=None, marker_file=None):
+        """
+        :param bool deferred: Defaults to True if UW_PUBLISH_DEFER_CATALOG is set
+        :param str|unicode marker_file: Defaults to catalog-pending in app_utils.get_cache_dir()
+        """
+        self.deferred = bool(os.environ.get('UW_PUBLISH_DEFER_CATALOG')) if deferred is None else deferred
+        self.marker_file = marker_file if marker_file else os.path.join(app_utils.get_cache_dir(), 'catalog-pending')
+
+        self.registered = False  # type: bool
+        self.updates = 0        # type: int
+
+    @staticmethod
+    def get_default():
+        """
+        :return: CatalogUpdater
+        """
+        if not CatalogUpdater.default_updater:
+            CatalogUpdater.default_updater = CatalogUpdater()
+
+        return CatalogUpdater.default_updater
+
+    def register_at_exit(self):
+        """
+        Calls finish when the script ends, to update the catalogs for this or an earlier deferred command
+        """
+        if not self.registered:
+            self.registered = True
+            atexit.register(self.finish)
+
+    def request_update(self, resource):
+        """
+        Remembers that the catalogs need to be updated
+        :param str|unicode resource: What was published, for the marker file
+        """
+        self.register_at_exit()
+
+        marker_dir = os.path.dirname(self.marker_file)
+        if marker_dir and not os.path.isdir(marker_dir):
+            os.makedirs(marker_dir)
+
+        with codecs.open(self.marker_file, 'a', 'utf-8') as out_file:
+            out_file.write(resource + '\n')
+
+    def get_pending(self):
+        """
+        :return: list<str> The resources published since the catalogs were last updated, in this or an earlier session
+        """
+        if not os.path.isfile(self.marker_file):
+            return []
+
+        with codecs.open(self.marker_file, 'r', 'utf-8') as in_file:
+            return [line.strip() for line in in_file if line.strip()]
+
+    def update_now(self, force=False):
+        """
+        Updates the catalogs if anything was published since they were last updated, unless the update is deferred
+        :param bool force: Update the catalogs even if nothing was published, or the update is deferred
+        :return: bool True if the catalogs were updated
+        """
+        if not force and (self.deferred or not self.get_pending()):
+            return False
+
+        print()
+        print('Updating the catalogs...', end=' ')
+        update_catalog()
+        print('finished.')
+
+        if os.path.isfile(self.marker_file):
+            os.remove(self.marker_file)
+        self.updates += 1
+        return True
+
+    def finish(self):
+        """
+        Updates the catalogs if needed, this is called when the script ends
+        """
+        if not self.deferred:
+            self.update_now()
+            return
+
+        pending = self.get_pending()
+        if pending:
+            print_notice('The catalogs were not updated for: {0}. Run update_catalog.py, or the last publish command '
+                         'without --defer-catalog.'.format(', '.join(sorted(set(pending)))))
@@ -0,0 +1,139 @@
+from __future__ import print_function, unicode_literals
+import atexit
+import gzip
+import io
+import os
+import shutil
+import threading
+from multiprocessing.pool import ThreadPool
+from app_code.util.output_writer import OutputWriter
+
+
+class Compressor(object):
+    """
+    Writes a gzip copy next to each published file, like source.json.gz next to source.json, so the web server can
+    send the compressed file instead of compressing it for every request.
+
+    The files are compressed on a pool of threads, so the compression runs while the publisher goes on with the next
+    book. The copies are the same every time for the same file: the gzip header has a modified time of 0 and only the
+    base name of the file, so OutputWriter leaves an unchanged copy alone. Call finish before reading the .gz files,
+    it is also called when the script ends.
+    """
+
+    # do not access this directly, use Compressor.get_default
+    default_compressor = None
+
+    default_threads = 2
+
+    compress_level = 9
+
+    def __init__(self, enabled=None, threads=None):
+        """
+        :param bool enabled: Defaults to True if UW_PUBLISH_GZIP is set
+        :param int threads: The number of files to compress at the same time
+        """
+        self.enabled = bool(os.environ.get('UW_PUBLISH_GZIP')) if enabled is None else enabled
+        self.threads = threads if threads else self.default_threads
+
+        self.pool = None     # type: ThreadPool
+        self.pending = []    # type: list<multiprocessing.pool.AsyncResult>
+        self.sizes = {}      # type: dict<str, list<int>>  # resource: [files, raw bytes, compressed bytes]
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: Compressor
+        """
+        if not Compressor.default_compressor:
+            Compressor.default_compressor = Compressor()
+
+        return Compressor.default_compressor
+
+    def add(self, file_name, resource=None, changed=True):
+        """
+        Starts compressing the file, if compression is enabled
+        :param str|unicode file_name:
+        :param str|unicode resource: The name to use in the report, defaults to the base name of the file
+        :param bool changed: False if the file was left unchanged by OutputWriter, then it is only compressed if there
+                             is no .gz copy yet, or the copy is older than the file
+        """
+        if not self.enabled or (not changed and is_current(file_name)):
+            return
+
+        with self.lock:
+            if not self.pool:
+                self.pool = ThreadPool(self.threads)
+                atexit.register(self.finish)
+
+            resource = resource if resource else os.path.basename(file_name)
+            self.pending.append(self.pool.apply_async(gzip_file, (file_name, self.compress_level),
+                                                      callback=lambda sizes: self.count(resource, sizes)))
+
+    def count(self, resource, sizes):
+        with self.lock:
+            totals = self.sizes.setdefault(resource, [0, 0, 0])
+            totals[0] += 1
+            totals[1] += sizes[0]
+            totals[2] += sizes[1]
+
+    def finish(self):
+        """
+        Waits for the files to be compressed, then prints the report
+        """
+        with self.lock:
+            pool = self.pool
+            pending = self.pending
+            self.pool = None
+            self.pending = []
+
+        if not pool:
+            return
+
+        try:
+            # raises the first error from the threads
+            for result in pending:
+                result.get()
+        finally:
+            pool.close()
+            pool.join()
+
+        self.print_report()
+
+    def print_report(self):
+        with self.lock:
+            sizes = sorted(self.sizes.items())
+            self.sizes = {}
+
+        print()
+        print('{0:<32}{1:>8}{2:>16}{3:>16}{4:>8}'.format('resource', 'files', 'raw bytes', 'gzip bytes', 'ratio'))
+        for resource, (files, raw, compressed) in sizes:
+            print('{0:<32}{1:>8}{2:>16,}{3:>16,}{4:>7.1f}%'.format(resource, files, raw, compressed,
+                                                                   100.0 * compressed / raw if raw else 0))
+
+
+def is_current(file_name):
+    """
+    :return: bool True if file_name.gz exists and is not older than file_name
+    """
+    gz_file_name = file_name + '.gz'
+    return os.path.isfile(gz_file_name) and os.path.getmtime(gz_file_name) >= os.path.getmtime(file_name)
+
+
+def gzip_file(file_name, compress_level=9):
+    """
+    Writes file_name.gz, with a modified time of 0 in the header so the output only depends on the content
+    :param str|unicode file_name:
+    :param int compress_level:
+    :return: tuple of (raw size, compressed size)
+    """
+    compressed = io.BytesIO()
+
+    with open(file_name, 'rb') as in_file:
+        with gzip.GzipFile(os.path.basename(file_name), 'wb', compress_level, compressed, 0) as gz_file:
+            shutil.copyfileobj(in_file, gz_file)
+
+    OutputWriter.get_default().write_bytes(file_name + '.gz', [compressed.getvalue()])
+
+    return os.path.getsize(file_name), len(compressed.getvalue())
@@ -0,0 +1,213 @@
+from __future__ import print_function, unicode_literals
+import atexit
+import json
+import os
+import threading
+from contextlib import contextmanager
+from general_tools.print_utils import print_notice
+
+# about how many characters to collect before writing them to the file
+buffer_size = 65536
+
+
+class OutputWriter(object):
+    """
+    Writes the published files, but only replaces a file when its content changes.
+
+    The new content is written to a temporary file and compared with the file already on disk. If they are the same the
+    temporary file is removed and the file on disk is not touched, so its modified time stays the same and syncthing
+    and the CDN do not see a new file. A changed file is renamed into place, so other processes never see a partial
+    file. The number of files written and left unchanged is counted for the report at the end of the script.
+    """
+
+    # do not access this directly, use OutputWriter.get_default
+    default_writer = None
+
+    def __init__(self):
+        self.written = 0    # type: int
+        self.unchanged = 0  # type: int
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: OutputWriter
+        """
+        if not OutputWriter.default_writer:
+            OutputWriter.default_writer = OutputWriter()
+
+        return OutputWriter.default_writer
+
+    def write_bytes(self, file_name, chunks):
+        """
+        :param str|unicode file_name:
+        :param iterable<bytes> chunks: The content of the file, a piece at a time
+        :return: bool True if the file was written, False if it already had the same content
+        """
+        make_parent_dir(file_name)
+        temp_name = get_temp_name(file_name)
+        try:
+            with open(temp_name, 'wb') as out_file:
+                for chunk in chunks:
+                    out_file.write(chunk)
+
+            if same_content(temp_name, file_name):
+                self.count(0, 1)
+                return False
+
+            replace_file(temp_name, file_name)
+            self.count(1, 0)
+            return True
+
+        finally:
+            if os.path.isfile(temp_name):
+                os.remove(temp_name)
+
+    def write_file(self, file_name, file_contents, indent=None):
+        """
+        Use in place of general_tools.file_utils.write_file, it writes the same bytes. Strings are written as utf-8 and
+        everything else as json.
+        :param str|unicode file_name:
+        :param str|unicode|object file_contents:
+        :param int indent: For json
+        :return: bool True if the file was written, False if it already had the same content
+        """
+        if isinstance(file_contents, bytes):
+            return self.write_bytes(file_name, [file_contents])
+
+        if isinstance(file_contents, type('')):
+            return self.write_bytes(file_name, [file_contents.encode('utf-8')])
+
+        return self.write_json(file_name, file_contents, indent)
+
+    def write_json(self, file_name, obj, indent=None, cls=None):
+        """
+        Writes the same text as json.dumps(obj, sort_keys=True, indent=indent, cls=cls), but a piece at a time, so the
+        whole json string is never in memory
+        :param str|unicode file_name:
+        :param object obj:
+        :param int indent:
+        :param type cls: A JSONEncoder subclass, for objects that are not dicts and lists
+        :return: bool True if the file was written, False if it already had the same content
+        """
+        return self.write_bytes(file_name, iter_json(obj, indent, cls))
+
+    def count(self, written, unchanged):
+        """
+        :param int written: The number of files that were written
+        :param int unchanged: The number of files that already had the same content
+        """
+        with self.lock:
+            self.written += written
+            self.unchanged += unchanged
+
+    def get_stats(self):
+        return 'Output files: {0} written, {1} unchanged'.format(self.written, self.unchanged)
+
+
+def iter_json(obj, indent=None, cls=None):
+    """
+    :return: generator<bytes> The utf-8 json of obj, in pieces of about buffer_size characters
+    """
+    encoder = (cls or json.JSONEncoder)(sort_keys=True, indent=indent)
+
+    pieces = []
+    size = 0
+    for piece in encoder.iterencode(obj):
+        pieces.append(piece)
+        size += len(piece)
+        if size >= buffer_size:
+            yield ''.join(pieces).encode('utf-8')
+            pieces = []
+            size = 0
+
+    yield ''.join(pieces).encode('utf-8')
+
+
+def make_parent_dir(file_name):
+    dir_name = os.path.dirname(file_name)
+    if dir_name and not os.path.isdir(dir_name):
+        try:
+            os.makedirs(dir_name)
+        except OSError:
+            if not os.path.isdir(dir_name):
+                raise
+
+
+def get_temp_name(file_name):
+    return '{0}.{1}.{2}.tmp'.format(file_name, os.getpid(), threading.current_thread().ident)
+
+
+def replace_file(temp_name, file_name):
+    # os.rename will not replace an existing file on Windows
+    if os.name == 'nt' and os.path.isfile(file_name):
+        os.remove(file_name)
+    os.rename(temp_name, file_name)
+
+
+def same_content(file_a, file_b):
+    """
+    :return: bool True if both files exist and have the same bytes
+    """
+    if not os.path.isfile(file_a) or not os.path.isfile(file_b):
+        return False
+
+    if os.path.getsize(file_a) != os.path.getsize(file_b):
+        return False
+
+    with open(file_a, 'rb') as in_a, open(file_b, 'rb') as in_b:
+        while True:
+            chunk = in_a.read(buffer_size)
+            if chunk != in_b.read(buffer_size):
+                return False
+            if not chunk:
+                return True
+
+
+@contextmanager
+def atomic_file(file_name):
+    """
+    Opens a temporary file for writing in binary mode, and renames it to file_name when the block finishes, so other
+    threads and processes never see a partial file. If the block raises an exception the temporary file is removed and
+    file_name is not changed.
+    :param str|unicode file_name:
+    """
+    make_parent_dir(file_name)
+    temp_name = get_temp_name(file_name)
+    try:
+        with open(temp_name, 'wb') as out_file:
+            yield out_file
+
+        replace_file(temp_name, file_name)
+
+    finally:
+        if os.path.isfile(temp_name):
+            os.remove(temp_name)
+
+
+def write_file(file_name, file_contents, indent=None):
+    """
+    Use in place of general_tools.file_utils.write_file, see OutputWriter.write_file
+    :return: bool True if the file was written, False if it already had the same content
+    """
+    return OutputWriter.get_default().write_file(file_name, file_contents, indent)
+
+
+def write_json(file_name, obj, indent=None, cls=None):
+    """
+    See OutputWriter.write_json
+    :return: bool True if the file was written, False if it already had the same content
+    """
+    return OutputWriter.get_default().write_json(file_name, obj, indent, cls)
+
+
+def print_stats():
+    print_notice(OutputWriter.get_default().get_stats())
+
+
+def report_stats_at_exit():
+    """
+    Call this from a command line script to print the number of files written and left unchanged when the script ends
+    """
+    atexit.register(print_stats)
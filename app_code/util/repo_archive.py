@@ -0,0 +1,210 @@
+from __future__ import print_function, unicode_literals
+import fnmatch
+import json
+import mmap
+import posixpath
+import struct
+import zipfile
+import zlib
+
+# the fixed part of a zip local file header, before the file name and extra field
+local_header_size = 30
+local_header_signature = b'PK\x03\x04'
+
+
+class RepoArchive(object):
+    """
+    Reads the files of a downloaded repository straight from its zip archive, instead of unzipping it to /tmp first.
+
+    The central directory of the zip file is read once, when the archive is opened, and the names are indexed by
+    directory, so looking up and listing files does not touch the disk. The archive is memory mapped when possible,
+    and a file is read by decompressing its bytes straight from the map. Paths are relative to the root of the
+    archive and use /, like en-tw/content/kt/god.md. The methods are named after the os and os.path functions they
+    replace.
+    """
+
+    def __init__(self, file_name):
+        """
+        :param str|unicode file_name: The downloaded zip file
+        """
+        self.file_name = file_name
+
+        self.files = {}  # type: dict<str, zipfile.ZipInfo>
+        self.dirs = {}   # type: dict<str, tuple<list<str>, list<str>>>  # directory: (sub directories, file names)
+
+        self.in_file = open(file_name, 'rb')
+        self.mapped = None  # type: mmap.mmap
+        try:
+            self.zip_file = zipfile.ZipFile(self.in_file)
+            try:
+                self.mapped = mmap.mmap(self.in_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (EnvironmentError, ValueError):
+                # reading through zip_file still works if the file cannot be mapped
+                pass
+
+        except:
+            self.in_file.close()
+            raise
+
+        self.add_dir('')
+        for info in self.zip_file.infolist():
+            name = normalize(decode_name(info.filename))
+            if info.filename.endswith(str('/')):
+                self.add_dir(name)
+            elif name:
+                self.files[name] = info
+                dir_name, base_name = posixpath.split(name)
+                self.add_dir(dir_name)[1].append(base_name)
+
+    def __enter__(self):
+        return self
+
+    # noinspection PyUnusedLocal
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        if self.mapped is not None:
+            self.mapped.close()
+            self.mapped = None
+        self.zip_file.close()
+        self.in_file.close()
+
+    def add_dir(self, dir_name):
+        if dir_name in self.dirs:
+            return self.dirs[dir_name]
+
+        entry = self.dirs[dir_name] = ([], [])
+        if dir_name:
+            parent, base_name = posixpath.split(dir_name)
+            self.add_dir(parent)[0].append(base_name)
+
+        return entry
+
+    def isfile(self, path):
+        return normalize(path) in self.files
+
+    def isdir(self, path):
+        return normalize(path) in self.dirs
+
+    def listdir(self, path=''):
+        """
+        :param str|unicode path:
+        :return: list<str> The sorted names of the files and directories in path
+        """
+        dirs, files = self.get_dir(path)
+        return sorted(dirs + files)
+
+    def glob(self, path, pattern):
+        """
+        :param str|unicode path: The directory to look in
+        :param str|unicode pattern: A shell pattern for the file names, like *.usfm
+        :return: list<str> The sorted paths of the files in path that match the pattern
+        """
+        path = normalize(path)
+        return [posixpath.join(path, name) for name in sorted(fnmatch.filter(self.get_dir(path)[1], pattern))]
+
+    def walk(self, top=''):
+        """
+        Like os.walk, top down and in sorted order. Removing names from the list of directories skips them.
+        :param str|unicode top:
+        :return: generator<tuple<str, list<str>, list<str>>> (directory, sub directories, file names)
+        """
+        top = normalize(top)
+        if top not in self.dirs:
+            return
+
+        dirs, files = self.dirs[top]
+        dirs = sorted(dirs)
+        yield top, dirs, sorted(files)
+
+        for dir_name in dirs:
+            for entry in self.walk(posixpath.join(top, dir_name)):
+                yield entry
+
+    def get_dir(self, path):
+        path = normalize(path)
+        if path not in self.dirs:
+            raise IOError('The directory {0} was not found in {1}.'.format(path, self.file_name))
+
+        return self.dirs[path]
+
+    def read(self, path):
+        """
+        :param str|unicode path:
+        :return: bytes The content of the file
+        """
+        path = normalize(path)
+        if path not in self.files:
+            raise IOError('The file {0} was not found in {1}.'.format(path, self.file_name))
+
+        info = self.files[path]
+        if self.mapped is None or info.flag_bits & 0x1 or \
+                info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return self.zip_file.read(info)
+
+        return read_member(self.mapped, info)
+
+    def read_text(self, path, encoding='utf-8-sig'):
+        """
+        :param str|unicode path:
+        :param str encoding: The default, utf-8-sig, removes a Byte Order Mark
+        :return: unicode The content of the file
+        """
+        return self.read(path).decode(encoding)
+
+    def load_json(self, path, default=None):
+        """
+        Like general_tools.file_utils.load_json_object
+        :param str|unicode path:
+        :param default: The value to return if the file is not found
+        """
+        if not self.isfile(path):
+            return default
+
+        return json.loads(self.read_text(path).replace('\r\n', '\n'))
+
+
+def normalize(path):
+    """
+    :return: str path relative to the root of the archive, without a leading or trailing /
+    """
+    path = posixpath.normpath(path.replace('\\', '/')).strip('/')
+    return '' if path == '.' else path
+
+
+def decode_name(name):
+    # zipfile leaves the name as bytes when the utf-8 flag is not set
+    if isinstance(name, bytes):
+        try:
+            return name.decode('utf-8')
+        except UnicodeDecodeError:
+            return name.decode('cp437')
+
+    return name
+
+
+def read_member(data, info):
+    """
+    Reads a stored or deflated file from the bytes of a zip archive
+    :param mmap.mmap|bytes data: The whole archive
+    :param zipfile.ZipInfo info:
+    :return: bytes
+    """
+    offset = info.header_offset
+    header = data[offset:offset + local_header_size]
+    if len(header) != local_header_size or header[:4] != local_header_signature:
+        raise zipfile.BadZipfile('Bad local file header for {0}'.format(decode_name(info.filename)))
+
+    # the name and extra field in the local header can be different from the ones in the central directory
+    name_length, extra_length = struct.unpack(str('<HH'), header[26:30])
+    start = offset + local_header_size + name_length + extra_length
+    content = data[start:start + info.compress_size]
+
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        content = zlib.decompress(content, -15)
+
+    if zlib.crc32(content) & 0xffffffff != info.CRC:
+        raise zipfile.BadZipfile('Bad CRC-32 for {0}'.format(decode_name(info.filename)))
+
+    return content
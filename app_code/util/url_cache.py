@@ -0,0 +1,208 @@
+from __future__ import print_function, unicode_literals
+import atexit
+import codecs
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import closing
+from general_tools.print_utils import print_notice
+from app_code.util import app_utils
+from app_code.util.output_writer import atomic_file
+
+try:
+    import urllib.request as urllib2
+    from urllib.error import HTTPError
+except ImportError:
+    import urllib2
+    from urllib2 import HTTPError
+
+
+class UrlCache(object):
+    """
+    A local cache for the static files that are downloaded from uw-api: versification, chunk and book data.
+
+    The downloaded files are stored by the SHA-1 of their content in <cache_dir>/objects, and each url has a small json
+    file in <cache_dir>/urls that points to the content and remembers the ETag and Last-Modified headers. A cached
+    file is used without asking the server until it is older than ttl seconds, after that a conditional request is
+    sent. If the server cannot be reached the cached file is used anyway. In offline mode only the cache is used.
+    """
+
+    # do not access this directly, use UrlCache.get_default
+    default_cache = None
+
+    # one day
+    default_ttl = 24 * 60 * 60
+
+    def __init__(self, cache_dir=None, ttl=None, offline=None):
+        """
+        :param str|unicode cache_dir: Defaults to app_utils.get_cache_dir()
+        :param int ttl: Seconds a cached file is used before checking for a new version
+        :param bool offline: Never use the network. Defaults to True if UW_PUBLISH_OFFLINE is set.
+        """
+        self.cache_dir = cache_dir if cache_dir else app_utils.get_cache_dir()
+        self.ttl = self.default_ttl if ttl is None else ttl
+        self.offline = bool(os.environ.get('UW_PUBLISH_OFFLINE')) if offline is None else offline
+
+        self.hits = 0         # type: int  # returned from the cache without a request
+        self.revalidated = 0  # type: int  # the server said the cached file has not changed
+        self.misses = 0       # type: int  # downloaded
+        self.stale = 0        # type: int  # the server could not be reached, the cached file was returned
+
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_default():
+        """
+        :return: UrlCache
+        """
+        if not UrlCache.default_cache:
+            UrlCache.default_cache = UrlCache()
+
+        return UrlCache.default_cache
+
+    def get_url(self, url, ttl=None):
+        """
+        Returns the content of the url as text, from the cache if possible
+        :param str|unicode url:
+        :param int ttl: Overrides the ttl of the cache for this request
+        :return: str|unicode
+        """
+        ttl = self.ttl if ttl is None else ttl
+        meta = self.load_meta(url)
+        content = self.load_object(meta['object']) if meta else None
+
+        if content is not None and (self.offline or time.time() - meta['fetched'] < ttl):
+            self.count('hits')
+            return content.decode('utf-8')
+
+        if self.offline:
+            self.count('misses')
+            raise IOError('The url {0} is not in the cache, and offline mode is on.'.format(url))
+
+        request = urllib2.Request(url)
+        if content is not None:
+            if meta.get('etag'):
+                request.add_header('If-None-Match', meta['etag'])
+            if meta.get('last_modified'):
+                request.add_header('If-Modified-Since', meta['last_modified'])
+
+        try:
+            with closing(urllib2.urlopen(request)) as response:
+                data = response.read()
+                headers = response.info()
+
+        except HTTPError as e:
+            if e.code != 304 or content is None:
+                raise
+
+            # not modified, the cached file is good for another ttl
+            meta['fetched'] = time.time()
+            self.save_meta(url, meta)
+            self.count('revalidated')
+            return content.decode('utf-8')
+
+        except IOError:
+            if content is None:
+                raise
+
+            self.count('stale')
+            return content.decode('utf-8')
+
+        meta = {'url': url,
+                'object': self.save_object(data),
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'fetched': time.time()}
+        self.save_meta(url, meta)
+        self.count('misses')
+
+        return data.decode('utf-8')
+
+    def count(self, counter):
+        with self.lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def get_stats(self):
+        return 'URL cache: {0} hits, {1} revalidated, {2} misses, {3} stale'.format(self.hits, self.revalidated,
+                                                                                  self.misses, self.stale)
+
+    def meta_file(self, url):
+        return os.path.join(self.cache_dir, 'urls', hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def load_meta(self, url):
+        """
+        :param str|unicode url:
+        :return: dict|None
+        """
+        file_name = self.meta_file(url)
+        if not os.path.isfile(file_name):
+            return None
+
+        try:
+            with codecs.open(file_name, 'r', 'utf-8') as in_file:
+                meta = json.loads(in_file.read())
+        except ValueError:
+            return None
+
+        # make sure this is not a hash collision
+        return meta if meta.get('url') == url else None
+
+    def save_meta(self, url, meta):
+        self.write_atomic(self.meta_file(url), json.dumps(meta, sort_keys=True).encode('utf-8'))
+
+    def load_object(self, object_id):
+        """
+        :param str|unicode object_id: The SHA-1 of the content
+        :return: bytes|None
+        """
+        file_name = os.path.join(self.cache_dir, 'objects', object_id)
+        if not os.path.isfile(file_name):
+            return None
+
+        with open(file_name, 'rb') as in_file:
+            return in_file.read()
+
+    def save_object(self, data):
+        """
+        :param bytes data:
+        :return: str The SHA-1 of the content
+        """
+        object_id = hashlib.sha1(data).hexdigest()
+        file_name = os.path.join(self.cache_dir, 'objects', object_id)
+        if not os.path.isfile(file_name):
+            self.write_atomic(file_name, data)
+
+        return object_id
+
+    @staticmethod
+    def write_atomic(file_name, data):
+        """
+        Writes to a temporary file and renames it, so other threads and processes never see a partial file
+        :param str|unicode file_name:
+        :param bytes data:
+        """
+        with atomic_file(file_name) as out_file:
+            out_file.write(data)
+
+
+def get_cached_url(url, ttl=None):
+    """
+    Use in place of general_tools.url_utils.get_url for files that do not change often
+    :param str|unicode url:
+    :param int ttl:
+    :return: str|unicode
+    """
+    return UrlCache.get_default().get_url(url, ttl)
+
+
+def print_stats():
+    print_notice(UrlCache.get_default().get_stats())
+
+
+def report_stats_at_exit():
+    """
+    Call this from a command line script to print the cache hits and misses when the script ends
+    """
+    atexit.register(print_stats)
@@ -0,0 +1,138 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.cli.api_publish import api_publish
+
+
+class TestApiPublish(TestCase):
+
+    resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='api_publish_')
+        self.api_v2 = api_publish.api_v2
+        api_publish.api_v2 = os.path.join(self.temp_dir, 'out')
+
+        # the manifests are written to the cache directory
+        self.cache_dir = os.environ.get('UW_PUBLISH_CACHE_DIR')
+        os.environ['UW_PUBLISH_CACHE_DIR'] = os.path.join(self.temp_dir, 'cache')
+
+    def tearDown(self):
+        api_publish.api_v2 = self.api_v2
+        if self.cache_dir is None:
+            del os.environ['UW_PUBLISH_CACHE_DIR']
+        else:
+            os.environ['UW_PUBLISH_CACHE_DIR'] = self.cache_dir
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def make_source_dir(self):
+        source_dir = os.path.join(self.temp_dir, 'ulb-en')
+        os.mkdir(source_dir)
+        shutil.copy(os.path.join(self.resources_dir, 'chunk01.usfm'), os.path.join(source_dir, '51-PHP.usfm'))
+        with codecs.open(os.path.join(source_dir, 'LICENSE.usfm'), 'w', 'utf-8') as out_file:
+            out_file.write('not a book')
+        return source_dir
+
+    def read_resource(self, file_name):
+        with codecs.open(os.path.join(self.resources_dir, file_name), 'r', 'utf-8') as in_file:
+            return in_file.read()
+
+    def test_load_books(self):
+        book_text = self.read_resource('chunk01.usfm')
+
+        # a byte order mark and windows line endings, like some of the files in the api
+        file_text = '\ufeff' + book_text.replace('\n', '\r\n')
+        with codecs.open(os.path.join(self.temp_dir, '51-PHP.usfm'), 'w', 'utf-8') as out_file:
+            out_file.write(file_text)
+        with codecs.open(os.path.join(self.temp_dir, 'LICENSE.usfm'), 'w', 'utf-8') as out_file:
+            out_file.write('not a book')
+
+        from_file = api_publish.load_books(self.temp_dir)
+        self.assertEqual(['PHP'], list(from_file.keys()))
+        self.assertEqual(book_text.lstrip(), from_file['PHP'])
+
+        # the text already in memory is the same as reading the file
+        self.assertEqual(from_file, api_publish.load_books(self.temp_dir, {'51-PHP.usfm': file_text}))
+
+    def test_chapters_and_chunks(self):
+        usx = api_publish.render_usx('PHP', self.read_resource('chunk01.usfm'))
+        chapters, chunks = api_publish.parse(usx.splitlines(True))
+
+        self.assertEqual(['01', '02', '03', '04'], [c['number'] for c in chapters])
+
+        frames = [f for c in chapters for f in c['frames']]
+        self.assertEqual([f['id'] for f in frames], [c['id'] for c in chunks])
+        self.assertEqual([f['lastvs'] for f in frames], [c['lastvs'] for c in chunks])
+        self.assertEqual('01-01', chunks[0]['id'])
+        self.assertEqual('1', chunks[0]['firstvs'])
+
+        # the last frame of the book has always been numbered 00
+        self.assertEqual('04-00', chunks[-1]['id'])
+        self.assertTrue(all(api_publish.chunk_marker not in f['text'] for f in frames))
+
+    def test_publish_in_parallel(self):
+        source_dir = self.make_source_dir()
+        outputs = []
+
+        for jobs in (1, 2):
+            api_publish.api_v2 = os.path.join(self.temp_dir, 'out{0}'.format(jobs))
+            results = api_publish(source_dir, jobs).run()
+
+            self.assertEqual([('ulb', 'en', 'php')], [(r.ver, r.lang, r.slug) for r in results])
+            out_dir = api_publish.get_out_dir('php', 'en', 'ulb')
+            files = [os.path.join(out_dir, f) for f in api_publish.output_files]
+            self.assertEqual(sum(os.path.getsize(f) for f in files), results[0].bytes_written)
+            outputs.append([self.read_file(f) for f in files])
+
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_only_changed_books_are_published(self):
+        source_dir = self.make_source_dir()
+        usfm_file = os.path.join(source_dir, '51-PHP.usfm')
+        out_dir = api_publish.get_out_dir('php', 'en', 'ulb')
+
+        self.assertEqual([False], [r.skipped for r in api_publish(source_dir).run()])
+        self.assertEqual([True], [r.skipped for r in api_publish(source_dir).run()])
+
+        # the manifest is not published with the files
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, 'cache', 'api-manifests', 'ulb-en.json')))
+        self.assertEqual(['php'], os.listdir(api_publish.api_v2))
+
+        # when forced the book is published again, but the files that did not change are not written
+        json_file = os.path.join(out_dir, 'source.json')
+        old_time = int(os.path.getmtime(json_file)) - 3600
+        os.utime(json_file, (old_time, old_time))
+        results = api_publish(source_dir, force=True).run()
+        self.assertEqual([(False, ())], [(r.skipped, r.files_written) for r in results])
+        self.assertEqual(old_time, os.path.getmtime(json_file))
+
+        # the text in memory is used when it is given
+        book_text = self.read_file(usfm_file).replace('Timothy', 'Timotheus')
+        self.assertEqual([False], [r.skipped for r in api_publish(source_dir).run({'51-PHP.usfm': book_text})])
+        self.assertIn('Timotheus', self.read_file(os.path.join(out_dir, 'source.json')))
+
+        # a missing output is written again
+        os.remove(os.path.join(out_dir, 'chunks.json'))
+        self.assertEqual([False], [r.skipped for r in api_publish(source_dir).run({'51-PHP.usfm': book_text})])
+
+        # a book that cannot be read is not removed
+        manifest = api_publish.load_manifest('ulb', 'en')
+        with open(usfm_file, 'wb') as out_file:
+            out_file.write(b'\\id PHP \xff\xfe not utf-8')
+        self.assertEqual([], api_publish(source_dir).run())
+        self.assertTrue(os.path.isfile(json_file))
+        self.assertEqual(manifest, api_publish.load_manifest('ulb', 'en'))
+
+        # the files of a book that was removed are deleted
+        os.remove(usfm_file)
+        self.assertEqual([], api_publish(source_dir).run())
+        self.assertFalse(os.path.isdir(out_dir))
+        self.assertEqual({}, api_publish.load_manifest('ulb', 'en'))
+
+    @staticmethod
+    def read_file(file_name):
+        with codecs.open(file_name, 'r', 'utf-8') as in_file:
+            return in_file.read()
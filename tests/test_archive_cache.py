@@ -0,0 +1,136 @@
+from __future__ import print_function, unicode_literals
+import io
+import os
+import shutil
+import tempfile
+import threading
+import zipfile
+from unittest import TestCase
+from app_code.util.archive_cache import ArchiveCache
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+def make_zip(text, commit):
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        zip_file.writestr(str('en-tw/content/kt/god.md'), text.encode('utf-8'))
+        zip_file.comment = commit.encode('ascii')
+    return data.getvalue()
+
+
+class ArchiveHandler(BaseHTTPRequestHandler):
+    """
+    Serves a repository archive for each branch with an ETag, and answers conditional requests with 304
+    """
+    archives = {}  # type: dict<str, tuple<str, bytes>>  # path: (etag, zip file)
+    requests = 0
+
+    def do_GET(self):
+        ArchiveHandler.requests += 1
+
+        if self.path not in self.archives:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag, data = self.archives[self.path]
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestArchiveCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='archive_cache_')
+        ArchiveHandler.requests = 0
+        ArchiveHandler.archives = {'/Door43/en-tw/archive/master.zip': ('"a1"', make_zip('# God #', 'a' * 40)),
+                                   '/Door43/en-tw/archive/v6.zip': ('"b1"', make_zip('# Love #', 'b' * 40))}
+
+        self.server = HTTPServer(('127.0.0.1', 0), ArchiveHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.repo = 'http://127.0.0.1:{0}/Door43/en-tw'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.stop_server()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stop_server(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    @staticmethod
+    def read_file(file_name):
+        with open(file_name, 'rb') as in_file:
+            return in_file.read()
+
+    def test_revalidate_and_moved_tag(self):
+        cache = ArchiveCache(self.cache_dir, offline=False)
+
+        file_name = cache.get_archive(self.repo, 'master')
+        self.assertEqual(ArchiveHandler.archives['/Door43/en-tw/archive/master.zip'][1], self.read_file(file_name))
+        self.assertEqual('a' * 40, cache.load_ref(self.repo + '/archive/master.zip')['commit'])
+
+        # the server says the archive has not changed
+        self.assertEqual(file_name, cache.get_archive(self.repo, 'master'))
+        self.assertEqual((1, 1), (cache.downloaded, cache.revalidated))
+        self.assertEqual(2, ArchiveHandler.requests)
+
+        # the branch moved to a new commit, so the new archive is downloaded
+        ArchiveHandler.archives['/Door43/en-tw/archive/master.zip'] = ('"a2"', make_zip('# God! #', 'c' * 40))
+        new_file_name = cache.get_archive(self.repo, 'master')
+        self.assertNotEqual(file_name, new_file_name)
+        self.assertEqual(ArchiveHandler.archives['/Door43/en-tw/archive/master.zip'][1], self.read_file(new_file_name))
+        self.assertEqual('c' * 40, cache.load_ref(self.repo + '/archive/master.zip')['commit'])
+        self.assertEqual(2, cache.downloaded)
+
+    def test_server_gone_and_offline(self):
+        ArchiveCache(self.cache_dir, offline=False).get_archive(self.repo, 'master')
+
+        # the server is gone, and the tag may have moved, so the cached archive is not used without asking
+        self.stop_server()
+        cache = ArchiveCache(self.cache_dir, offline=False)
+        with self.assertRaises(IOError) as context:
+            cache.get_archive(self.repo, 'master')
+        self.assertIn(self.repo + '/archive/master.zip', str(context.exception))
+        self.assertIn('a' * 40, str(context.exception))
+
+        offline = ArchiveCache(self.cache_dir, offline=True)
+        self.assertTrue(os.path.isfile(offline.get_archive(self.repo, 'master')))
+        self.assertRaises(IOError, offline.get_archive, self.repo, 'v6')
+
+    def test_least_recently_used_are_evicted(self):
+        master_size = len(ArchiveHandler.archives['/Door43/en-tw/archive/master.zip'][1])
+        cache = ArchiveCache(self.cache_dir, max_size=master_size, offline=False)
+
+        master_file = cache.get_archive(self.repo, 'master')
+        os.utime(master_file, (1000000000, 1000000000))
+
+        # only one archive fits, so the one that was used longest ago is removed
+        v6_file = cache.get_archive(self.repo, 'v6')
+        self.assertFalse(os.path.isfile(master_file))
+        self.assertTrue(os.path.isfile(v6_file))
+        self.assertEqual(1, cache.evicted)
+
+        # and downloaded again when it is needed
+        self.assertEqual(master_file, cache.get_archive(self.repo, 'master'))
+        self.assertEqual(3, cache.downloaded)
+        self.assertFalse(os.path.isfile(v6_file))
@@ -3,7 +3,8 @@ import codecs
 import os
 import sys
 from unittest import TestCase
-from app_code.bible.content import Book
+from app_code.bible.bible_classes import Bible
+from app_code.bible.content import Book, Chapter, Chunk
 
 if sys.version_info < (3, 0):
     from_char = unicode
@@ -54,3 +55,53 @@ class TestBook(TestCase):
 
         self.assertIn('\\s5\n\\q\n\\v 7', book.chapters[0].usfm)
         self.assertIn('\\s5\n\\q\n\\v 9', book.chapters[1].usfm)
+
+    def test_chapter_and_chunk_index(self):
+
+        book = Book('PHP', 'Philippians', 51)
+        book.add_chapter(Chapter(1, 30))
+        book.add_chunk(Chunk(1, 1))
+        book.add_chunk(Chunk(1, 5))
+        self.assertEqual(1, book.get_chapter(1).number)
+        self.assertIsNone(book.get_chapter(2))
+
+        # chapters and chunks appended directly to the lists are found too
+        book.chapters.append(Chapter(2, 30))
+        book.chunks.append(Chunk(2, 1))
+        book.chunks.append(Chunk(1, 9))
+        self.assertEqual(2, book.get_chapter(2).number)
+        self.assertEqual(['01-01', '01-05', '01-09'], [str(c) for c in book.get_chapter_chunks(1)])
+        self.assertEqual(['02-01'], [str(c) for c in book.get_chapter_chunks(2)])
+        self.assertEqual([], book.get_chapter_chunks(3))
+
+    def test_create_book_returns_new_books(self):
+
+        book = Book.create_book('PHP')  # type: Book
+        book.set_usfm('\\id PHP\n')
+        book.add_chunk(Chunk(1, 1))
+        book.chapters[0].usfm = '\\v 1 text'
+        book.validation_errors.append('error')
+
+        # found by the directory name too, and nothing from the first book is shared
+        other = Book.create_book(book.dir_name)  # type: Book
+        self.assertIsNot(book, other)
+        self.assertEqual(('PHP', 4), (other.book_id, len(other.chapters)))
+        self.assertEqual((None, [], [], ''),
+                         (other.usfm, other.chunks, other.validation_errors, other.chapters[0].usfm))
+        self.assertIsNone(Book.create_book('XYZ'))
+
+    def test_insert_paragraph_markers(self):
+
+        book = Book('NUM', 'Numbers', 4)
+        book.add_chapter(Chapter(14, 45))
+        book.add_chapter(Chapter(15, 41))
+        book.chapters[0].usfm = '\\v 1 a \\v 2 b\n\\v 4 c \\v 11-12 d \\v 36- e \\v 39 f\n\\v 39 g\\v 4\n'
+        book.chapters[1].usfm = '\\q\n\\v 1 a\n\\p\n\\v 11 b\n'
+
+        Bible.insert_paragraph_markers(book)
+
+        self.assertEqual('\n\\p\n\\v 1 a \\v 2 b\n\n\\p\n\\v 4 c \\v 11-12 d \n\\p\n\\v 36- e \n\\p\n\\v 39 f\n'
+                         '\n\\p\n\\v 39 g\\v 4\n', book.chapters[0].usfm)
+
+        # chapters that already have paragraphs are not changed
+        self.assertEqual('\\q\n\\v 1 a\n\\p\n\\v 11 b\n', book.chapters[1].usfm)
@@ -0,0 +1,84 @@
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase
+from app_code.util import catalog_updater
+from app_code.util.catalog_updater import CatalogUpdater
+
+
+class TestCatalogUpdater(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='catalog_updater_')
+        self.marker_file = os.path.join(self.temp_dir, 'cache', 'catalog-pending')
+        self.updates = 0
+
+        def update_catalog():
+            self.updates += 1
+
+        self.update_catalog = catalog_updater.update_catalog
+        catalog_updater.update_catalog = update_catalog
+
+    def tearDown(self):
+        catalog_updater.update_catalog = self.update_catalog
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_one_update_per_session(self):
+        updater = CatalogUpdater(False, self.marker_file)
+        self.assertFalse(updater.update_now())
+
+        for resource in ('tN', 'tW', 'tQ'):
+            updater.request_update(resource)
+        self.assertEqual(['tN', 'tW', 'tQ'], updater.get_pending())
+
+        updater.finish()
+        self.assertEqual(1, self.updates)
+        self.assertEqual([], updater.get_pending())
+
+        # nothing was published since the last update
+        updater.finish()
+        self.assertEqual(1, self.updates)
+
+    def test_deferred_commands(self):
+        # two commands chained with --defer-catalog, then one without it
+        for resource in ('ulb-en', 'udb-en'):
+            updater = CatalogUpdater(True, self.marker_file)
+            updater.request_update(resource)
+            updater.finish()
+            self.assertFalse(updater.update_now())
+
+        self.assertEqual(0, self.updates)
+        self.assertEqual(['ulb-en', 'udb-en'], CatalogUpdater(False, self.marker_file).get_pending())
+
+        # the last command updates the catalogs when it ends, even if it did not publish anything itself
+        self.assertEqual('updated\n', self.run_command())
+        self.assertFalse(os.path.isfile(self.marker_file))
+
+        # update_catalog.py updates them anyway
+        self.assertTrue(CatalogUpdater(True, self.marker_file).update_now(force=True))
+        self.assertEqual(1, self.updates)
+
+    def run_command(self):
+        """
+        Starts a publish command that does not publish anything, in a new process so its atexit functions run
+        :return: str What the command printed
+        """
+        script = '\n'.join([
+            'from __future__ import print_function',
+            'import sys',
+            'from app_code.util import catalog_updater',
+            'from app_code.util.catalog_updater import CatalogUpdater',
+            'catalog_updater.update_catalog = lambda: sys.stderr.write("updated\\n")',
+            'CatalogUpdater.default_updater = CatalogUpdater(False, sys.argv[1])',
+            'CatalogUpdater.get_default().register_at_exit()'])
+
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join([os.getcwd()] + [p for p in sys.path if p])
+        process = subprocess.Popen([sys.executable, '-c', script, self.marker_file], env=env,
+                                   stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+        self.assertEqual(0, process.returncode, stderr)
+        return stderr.decode('utf-8')
@@ -0,0 +1,70 @@
+from __future__ import print_function, unicode_literals
+import gzip
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+from app_code.util import compressor
+from app_code.util.compressor import Compressor
+
+
+class TestCompressor(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='compressor_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def write_files(self, count):
+        file_names = []
+        for i in range(count):
+            file_name = os.path.join(self.temp_dir, '{0}-source.json'.format(i))
+            with open(file_name, 'wb') as out_file:
+                out_file.write(('{"chapters": [' + ', '.join(['"verse {0}"'.format(i)] * 500) + ']}').encode('utf-8'))
+            file_names.append(file_name)
+        return file_names
+
+    def read_bytes(self, file_name):
+        with open(file_name, 'rb') as in_file:
+            return in_file.read()
+
+    def test_gzip_file_is_reproducible(self):
+        file_name = self.write_files(1)[0]
+
+        raw_size, gz_size = compressor.gzip_file(file_name)
+        first = self.read_bytes(file_name + '.gz')
+        self.assertEqual((os.path.getsize(file_name), len(first)), (raw_size, gz_size))
+        self.assertLess(gz_size, raw_size)
+
+        # a different time, the same bytes
+        time.sleep(1.1)
+        compressor.gzip_file(file_name)
+        self.assertEqual(first, self.read_bytes(file_name + '.gz'))
+
+        with gzip.open(file_name + '.gz', 'rb') as in_file:
+            self.assertEqual(self.read_bytes(file_name), in_file.read())
+
+    def test_compress_on_threads(self):
+        file_names = self.write_files(6)
+
+        disabled = Compressor(enabled=False)
+        disabled.add(file_names[0])
+        disabled.finish()
+        self.assertFalse(os.path.isfile(file_names[0] + '.gz'))
+
+        enabled = Compressor(enabled=True, threads=3)
+        for file_name in file_names:
+            enabled.add(file_name, 'source.json')
+        enabled.add(file_names[0], 'chunks.json')
+
+        report = []
+        enabled.print_report = lambda: report.append(dict(enabled.sizes))
+        enabled.finish()
+
+        self.assertTrue(all(os.path.isfile(f + '.gz') for f in file_names))
+        self.assertEqual(['chunks.json', 'source.json'], sorted(report[0].keys()))
+        self.assertEqual(6, report[0]['source.json'][0])
+        self.assertEqual(sum(os.path.getsize(f) for f in file_names), report[0]['source.json'][1])
+        self.assertEqual(sum(os.path.getsize(f + '.gz') for f in file_names), report[0]['source.json'][2])
@@ -0,0 +1,103 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.bible.content import Book
+from app_code.bible import error_collector
+from app_code.bible.error_collector import ErrorCollector, ErrorRecord
+
+
+class ListRenderer(object):
+    """
+    Keeps what would have been printed
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.notices = []
+
+    def render_errors(self, messages):
+        self.batches.append(list(messages))
+
+    def render_notice(self, message):
+        self.notices.append(message)
+
+
+class TestErrorCollector(TestCase):
+
+    resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='error_collector_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @staticmethod
+    def get_records(book_id, code, count):
+        return [ErrorRecord(book_id, 1, i + 1, code, 'error {0}'.format(i + 1)) for i in range(count)]
+
+    def test_errors_are_batched_and_capped(self):
+        renderer = ListRenderer()
+        collector = ErrorCollector(renderer, max_per_code=3)
+        collector.batch_size = 2
+
+        for record in self.get_records('PHP', error_collector.VERSE_NOT_FOUND, 5):
+            collector.add(record)
+        collector.add(ErrorRecord('PHP', None, None, error_collector.GIT_CONFLICT, 'conflict'), prefix='')
+        collector.finish('PHP')
+
+        self.assertEqual([['** error 1', '** error 2'], ['** error 3', 'conflict']], renderer.batches)
+        self.assertEqual(['2 more "verse-not-found" errors in PHP were not shown'], renderer.notices)
+        self.assertEqual({error_collector.VERSE_NOT_FOUND: 5, error_collector.GIT_CONFLICT: 1},
+                         collector.get_summary())
+
+        # the count starts again for the next check of the book
+        collector.add(self.get_records('PHP', error_collector.VERSE_NOT_FOUND, 1)[0])
+        collector.finish('PHP')
+        self.assertEqual(['** error 1'], renderer.batches[-1])
+        self.assertEqual(1, len(renderer.notices))
+
+    def test_no_limit(self):
+        renderer = ListRenderer()
+        collector = ErrorCollector(renderer, max_per_code=0)
+
+        for record in self.get_records('ROM', error_collector.INVALID_VERSE_NUMBER, 250):
+            collector.add(record)
+        collector.finish('ROM')
+
+        self.assertEqual(250, sum(len(b) for b in renderer.batches))
+        self.assertEqual([], renderer.notices)
+
+    def test_book_records(self):
+        with codecs.open(os.path.join(self.resources_dir, 'checks01.usfm'), 'r', 'utf-8') as in_file:
+            book_text = in_file.read()
+
+        book = Book.create_book('PHP')  # type: Book
+        book.set_usfm(book_text, strip_s5=True)
+        book.verify_chapters_and_verses(True)
+
+        self.assertEqual(book.validation_errors, [r.message for r in book.error_records])
+        self.assertTrue(all(r.book == 'PHP' for r in book.error_records))
+        self.assertNotIn(error_collector.OTHER, [r.code for r in book.error_records])
+        self.assertTrue(all(r.chapter for r in book.error_records if r.code == error_collector.VERSE_NOT_FOUND))
+
+    def test_write_report(self):
+        records = self.get_records('PHP', error_collector.VERSE_NOT_FOUND, 2)
+        records.append(ErrorRecord('JUD', None, None, error_collector.GIT_CONFLICT, 'conflict'))
+
+        json_file = os.path.join(self.temp_dir, 'report.json')
+        error_collector.write_report(records, json_file)
+        with codecs.open(json_file, 'r', 'utf-8') as in_file:
+            report = json.loads(in_file.read())
+        self.assertEqual(3, len(report['errors']))
+        self.assertEqual({'verse-not-found': 2, 'git-conflict': 1}, report['summary'])
+
+        jsonl_file = os.path.join(self.temp_dir, 'report.jsonl')
+        error_collector.write_report(records, jsonl_file)
+        with codecs.open(jsonl_file, 'r', 'utf-8') as in_file:
+            lines = [json.loads(line) for line in in_file]
+        self.assertEqual([dict(r._asdict()) for r in records], lines)
@@ -0,0 +1,93 @@
+from __future__ import print_function, unicode_literals
+import json
+import os
+import shutil
+import tempfile
+import time
+from json import JSONEncoder
+from unittest import TestCase
+from app_code.util import output_writer
+from app_code.util.output_writer import OutputWriter
+
+
+class Verse(object):
+    def __init__(self, number, text):
+        self.number = number
+        self.text = text
+
+
+class VerseEncoder(JSONEncoder):
+    def default(self, o):
+        return o.__dict__
+
+
+class TestOutputWriter(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='output_writer_')
+        self.buffer_size = output_writer.buffer_size
+
+    def tearDown(self):
+        output_writer.buffer_size = self.buffer_size
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_bytes(self, file_name):
+        with open(file_name, 'rb') as in_file:
+            return in_file.read()
+
+    def test_same_as_json_dumps(self):
+        chapters = [{'number': str(c).zfill(2), 'ref': '', 'title': '',
+                     'frames': [{'id': '{0}-{1}'.format(c, f), 'lastvs': f * 3, 'img': '', 'format': 'usx',
+                                 'text': '<verse number="{0}" style="v" />\u1f00\u00a0text\n"quoted"\t'.format(f)}
+                                for f in range(1, 8)]}
+                    for c in range(1, 40)]
+        objects = [{'chapters': chapters, 'date_modified': '20160725'}, [{'b': 1.5, 'a': None, 'c': True}], 'text', 7]
+
+        # a small buffer, so the text is written in many pieces
+        output_writer.buffer_size = 100
+        file_name = os.path.join(self.temp_dir, 'sub', 'source.json')
+        for obj in objects:
+            for indent in (None, 2):
+                output_writer.write_json(file_name, obj, indent)
+                self.assertEqual(json.dumps(obj, sort_keys=True, indent=indent).encode('utf-8'),
+                                 self.read_bytes(file_name))
+
+        verses = {'verses': [Verse(1, 'In the beginning'), Verse(2, '\u05d0')]}
+        output_writer.write_json(file_name, verses, 2, VerseEncoder)
+        self.assertEqual(json.dumps(verses, sort_keys=True, indent=2, cls=VerseEncoder).encode('utf-8'),
+                         self.read_bytes(file_name))
+
+    def test_file_is_unchanged_after_an_error(self):
+        file_name = os.path.join(self.temp_dir, 'terms.json')
+        output_writer.write_json(file_name, ['old'])
+
+        with self.assertRaises(TypeError):
+            output_writer.write_json(file_name, ['new', object()])
+
+        self.assertEqual(b'["old"]', self.read_bytes(file_name))
+        self.assertEqual(['terms.json'], os.listdir(self.temp_dir))
+
+    def test_unchanged_file_is_not_written(self):
+        writer = OutputWriter()
+        file_name = os.path.join(self.temp_dir, 'usfm', '51-PHP.usfm')
+
+        self.assertTrue(writer.write_file(file_name, '\\id PHP\n\\c 1\n'))
+        old_time = int(time.time()) - 3600
+        os.utime(file_name, (old_time, old_time))
+
+        self.assertFalse(writer.write_file(file_name, '\\id PHP\n\\c 1\n'))
+        self.assertEqual(old_time, os.path.getmtime(file_name))
+
+        # the same size, but different content
+        self.assertTrue(writer.write_file(file_name, '\\id PHP\n\\c 2\n'))
+        self.assertNotEqual(old_time, os.path.getmtime(file_name))
+        self.assertEqual(b'\\id PHP\n\\c 2\n', self.read_bytes(file_name))
+
+        # objects are written as json
+        json_file = os.path.join(self.temp_dir, 'status.json')
+        self.assertTrue(writer.write_file(json_file, {'lang': 'en'}, indent=2))
+        self.assertFalse(writer.write_json(json_file, {'lang': 'en'}, indent=2))
+
+        self.assertEqual((3, 2), (writer.written, writer.unchanged))
+        self.assertEqual('Output files: 3 written, 2 unchanged', writer.get_stats())
+        self.assertEqual(['51-PHP.usfm'], os.listdir(os.path.dirname(file_name)))
@@ -0,0 +1,175 @@
+from __future__ import print_function, unicode_literals
+import json
+import os
+import shutil
+import tempfile
+from multiprocessing import Pool
+from unittest import TestCase
+from app_code.bible.validation_cache import ValidationCache
+from app_code.cli import rechunk_all_bibles
+from app_code.cli.rechunk_all_bibles import RechunkError, RechunkScheduler
+from app_code.util import catalog_updater
+from app_code.util.catalog_updater import CatalogUpdater
+from app_code.util.compressor import Compressor
+from app_code.util.output_writer import OutputWriter
+
+
+def write_job(file_name):
+    OutputWriter.get_default().write_bytes(file_name, [b'published'])
+    return file_name
+
+
+class FakeApiPublish(object):
+    """
+    Remembers the directories that would have been published
+    """
+    published = []
+    compressing = []  # was the compressor still running when each publish started
+
+    def __init__(self, source, jobs=1):
+        self.source = source
+        self.jobs = jobs
+        FakeApiPublish.compressing.append(Compressor.get_default().pool is not None)
+
+    def __enter__(self):
+        return self
+
+    # noinspection PyUnusedLocal
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def run(self):
+        FakeApiPublish.published.append(self.source)
+
+        # like api_publish, write the files in a pool of processes
+        if self.jobs > 1:
+            pool = Pool(self.jobs)
+            try:
+                pool.map_async(write_job, [d + '/published.json' for d in self.source]).get(timeout=60)
+            finally:
+                pool.terminate()
+                pool.join()
+
+
+class TestRechunkScheduler(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='rechunk_')
+        self.checkpoint_file = os.path.join(self.temp_dir, 'checkpoint.json')
+        self.directories = ['/api/ulb/txt/1/ulb-{0}'.format(lang) for lang in ('en', 'fr', 'ru')]
+
+        self.rechunked = []
+        self.bad = set()
+        self.catalog_updates = 0
+        FakeApiPublish.published = []
+        FakeApiPublish.compressing = []
+
+        def rechunk_this_one(api_directory):
+            self.rechunked.append(api_directory)
+            if api_directory in self.bad:
+                raise RechunkError('Book id not found')
+            return [api_directory + '/01-GEN.usfm'], []
+
+        def update_catalog():
+            self.catalog_updates += 1
+
+        self.patched = {'rechunk_this_one': rechunk_this_one, 'api_publish': FakeApiPublish}
+        self.saved = dict((name, getattr(rechunk_all_bibles, name)) for name in self.patched)
+        for name, value in self.patched.items():
+            setattr(rechunk_all_bibles, name, value)
+
+        self.update_catalog = catalog_updater.update_catalog
+        catalog_updater.update_catalog = update_catalog
+        CatalogUpdater.default_updater = CatalogUpdater(False, os.path.join(self.temp_dir, 'catalog-pending'))
+
+    def tearDown(self):
+        for name, value in self.saved.items():
+            setattr(rechunk_all_bibles, name, value)
+        catalog_updater.update_catalog = self.update_catalog
+        CatalogUpdater.default_updater = None
+        Compressor.default_compressor = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_checkpoint(self):
+        with open(self.checkpoint_file, 'rb') as in_file:
+            return json.loads(in_file.read().decode('utf-8'))['completed']
+
+    def test_failures_do_not_stop_the_batch(self):
+        self.bad.add(self.directories[1])
+
+        failed = RechunkScheduler(self.checkpoint_file).run(self.directories)
+        self.assertEqual([(self.directories[1], 'Book id not found')], [(r.directory, r.error) for r in failed])
+        self.assertEqual(self.directories, self.rechunked)
+
+        # the directories that finished are published once, and the failed one is left for the next run
+        self.assertEqual([[self.directories[0], self.directories[2]]], FakeApiPublish.published)
+        self.assertEqual(1, self.catalog_updates)
+        self.assertEqual([self.directories[0], self.directories[2]], self.read_checkpoint())
+
+    def test_resume_from_checkpoint(self):
+        self.bad.add(self.directories[1])
+        RechunkScheduler(self.checkpoint_file).run(self.directories)
+
+        # the next run only re-chunks the directory that failed, and removes the checkpoint when everything finished
+        self.bad.clear()
+        self.rechunked = []
+        self.assertEqual([], RechunkScheduler(self.checkpoint_file).run(self.directories))
+        self.assertEqual([self.directories[1]], self.rechunked)
+        self.assertEqual(self.directories, FakeApiPublish.published[-1])
+        self.assertFalse(os.path.isfile(self.checkpoint_file))
+
+    def test_restart(self):
+        self.bad.add(self.directories[2])
+        RechunkScheduler(self.checkpoint_file).run(self.directories)
+
+        self.rechunked = []
+        RechunkScheduler(self.checkpoint_file, restart=True).run(self.directories)
+        self.assertEqual(self.directories, self.rechunked)
+
+    def test_unexpected_errors_are_collected(self):
+        rechunk_all_bibles.rechunk_this_one = lambda api_directory: json.loads('not json')
+
+        failed = RechunkScheduler(self.checkpoint_file).run(self.directories[:1])
+        self.assertEqual(1, len(failed))
+        self.assertTrue(failed[0].error.startswith('ValueError: '))
+        self.assertEqual([], FakeApiPublish.published)
+        self.assertEqual(0, self.catalog_updates)
+
+    def test_compressed_before_publishing_in_processes(self):
+        directories = [os.path.join(self.temp_dir, lang) for lang in ('en', 'fr', 'ru')]
+        for directory in directories:
+            os.makedirs(directory)
+            with open(os.path.join(directory, '01-GEN.usfm'), 'wb') as out_file:
+                out_file.write(b'\\id GEN\n' * 1000)
+
+        rechunk_all_bibles.rechunk_this_one = lambda api_directory: ([api_directory + '/01-GEN.usfm'],
+                                                                      [api_directory + '/01-GEN.usfm'])
+        Compressor.default_compressor = Compressor(enabled=True)
+
+        self.assertEqual([], RechunkScheduler(self.checkpoint_file, jobs=2).run(directories))
+        self.assertEqual([False], FakeApiPublish.compressing)
+        for directory in directories:
+            self.assertTrue(os.path.isfile(os.path.join(directory, '01-GEN.usfm.gz')))
+            self.assertTrue(os.path.isfile(os.path.join(directory, 'published.json')))
+
+    def test_rechunk_this_one(self):
+        resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+        api_directory = os.path.join(self.temp_dir, 'ulb-en')
+        os.makedirs(api_directory)
+        with open(os.path.join(api_directory, 'status.json'), 'wb') as out_file:
+            out_file.write(b'{"lang": "en", "slug": "ulb"}')
+        shutil.copy(os.path.join(resources_dir, 'chunk01.usfm'), os.path.join(api_directory, '51-PHP.usfm'))
+
+        saved_cache = ValidationCache.default_cache
+        ValidationCache.default_cache = ValidationCache(os.path.join(self.temp_dir, 'validation'), enabled=False)
+        try:
+            usfm_file = os.path.join(api_directory, '51-PHP.usfm')
+            self.assertEqual(([usfm_file], [usfm_file]), self.saved['rechunk_this_one'](api_directory))
+
+            # a book that is not in the versification
+            with open(os.path.join(api_directory, '99-XYZ.usfm'), 'wb') as out_file:
+                out_file.write(b'\\id XYZ\n\\c 1\n\\v 1 text\n')
+            self.assertRaises(RechunkError, self.saved['rechunk_this_one'], api_directory)
+
+        finally:
+            ValidationCache.default_cache = saved_cache
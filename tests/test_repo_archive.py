@@ -0,0 +1,75 @@
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import tempfile
+import zipfile
+from unittest import TestCase
+from app_code.util.repo_archive import RepoArchive
+
+
+class TestRepoArchive(TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='repo_archive_')
+        self.zip_name = os.path.join(self.temp_dir, 'en-tw.zip')
+        self.love = '# Love #\n\n\u03b1\u03b3\u03ac\u03c0\u03b7'
+
+        # like the archives from git.door43.org, with a directory for the repository and entries for the directories
+        with zipfile.ZipFile(self.zip_name, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+            zip_file.writestr(str('en-tw/'), b'')
+            zip_file.writestr(str('en-tw/content/'), b'')
+            zip_file.writestr(str('en-tw/content/kt/god.md'), '\ufeff# God #\n\nText'.encode('utf-8'))
+            zip_file.writestr(str('en-tw/content/kt/love.md'), self.love.encode('utf-8'))
+            zip_file.writestr(str('en-tw/content/other/bread.md'), b'# Bread #')
+            zip_file.writestr(str('en-tw/content/other/notes.txt'), b'not markdown')
+            zip_file.writestr(zipfile.ZipInfo(str('en-tw/manifest.json')), b'{\r\n  "slug": "en-tw"\r\n}')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_lookups(self):
+        with RepoArchive(self.zip_name) as archive:
+            self.assertTrue(archive.isdir('en-tw/content'))
+            self.assertTrue(archive.isdir('en-tw/content/kt/'))
+            self.assertFalse(archive.isdir('en-tw/content/kt/god.md'))
+            self.assertTrue(archive.isfile('en-tw/content/kt/god.md'))
+            self.assertFalse(archive.isfile('en-tw/content/kt'))
+
+            self.assertEqual(['en-tw'], archive.listdir())
+            self.assertEqual(['content', 'manifest.json'], archive.listdir('en-tw'))
+            self.assertEqual(['en-tw/content/other/bread.md'], archive.glob('en-tw/content/other', '*.md'))
+            self.assertRaises(IOError, archive.listdir, 'en-tw/missing')
+
+    def test_walk(self):
+        with RepoArchive(self.zip_name) as archive:
+            self.assertEqual([('en-tw/content', ['kt', 'other'], []),
+                              ('en-tw/content/kt', [], ['god.md', 'love.md']),
+                              ('en-tw/content/other', [], ['bread.md', 'notes.txt'])],
+                             list(archive.walk('en-tw/content')))
+
+            # like os.walk, removing a directory from the list skips it
+            roots = []
+            for root, dirs, files in archive.walk():
+                roots.append(root)
+                if 'content' in dirs:
+                    dirs.remove('content')
+            self.assertEqual(['', 'en-tw'], roots)
+
+    def test_read(self):
+        with RepoArchive(self.zip_name) as archive:
+            self.assertEqual(b'# Bread #', archive.read('en-tw/content/other/bread.md'))
+
+            # the Byte Order Mark is removed
+            self.assertEqual('# God #\n\nText', archive.read_text('en-tw/content/kt/god.md'))
+            self.assertEqual(self.love, archive.read_text('en-tw/content/kt/love.md'))
+
+            # the manifest is stored without compression, and has Windows line endings
+            self.assertEqual({'slug': 'en-tw'}, archive.load_json('en-tw/manifest.json'))
+            self.assertEqual([], archive.load_json('en-tw/missing.json', []))
+            self.assertRaises(IOError, archive.read, 'en-tw/missing.md')
+
+    def test_read_without_mmap(self):
+        with RepoArchive(self.zip_name) as archive:
+            archive.mapped.close()
+            archive.mapped = None
+            self.assertEqual('# God #\n\nText', archive.read_text('en-tw/content/kt/god.md'))
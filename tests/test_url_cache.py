@@ -0,0 +1,92 @@
+from __future__ import print_function, unicode_literals
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+from app_code.util.url_cache import UrlCache
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+
+class VersificationHandler(BaseHTTPRequestHandler):
+    """
+    Serves one file with an ETag, and answers conditional requests with 304
+    """
+    etag = '"v1"'
+    body = '{"PHP": ["Philippians", "51"]}'
+    requests = 0
+
+    def do_GET(self):
+        VersificationHandler.requests += 1
+
+        if self.headers.get('If-None-Match') == self.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        data = self.body.encode('utf-8')
+        self.send_response(200)
+        self.send_header('ETag', self.etag)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestUrlCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='url_cache_')
+        VersificationHandler.requests = 0
+
+        self.server = HTTPServer(('127.0.0.1', 0), VersificationHandler)
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        self.url = 'http://127.0.0.1:{0}/versification/ufw/books.json'.format(self.server.server_address[1])
+
+    def tearDown(self):
+        self.stop_server()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def stop_server(self):
+        if self.server:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+    def test_hit_miss_and_revalidate(self):
+        cache = UrlCache(self.cache_dir, ttl=3600, offline=False)
+
+        self.assertEqual(VersificationHandler.body, cache.get_url(self.url))
+        self.assertEqual(VersificationHandler.body, cache.get_url(self.url))
+        self.assertEqual((1, 1), (cache.misses, cache.hits))
+        self.assertEqual(1, VersificationHandler.requests)
+
+        # expired, the server answers 304 and the cached copy is returned
+        self.assertEqual(VersificationHandler.body, cache.get_url(self.url, ttl=0))
+        self.assertEqual(1, cache.revalidated)
+        self.assertEqual(2, VersificationHandler.requests)
+
+        # another instance uses the files on disk
+        other = UrlCache(self.cache_dir, ttl=3600, offline=False)
+        self.assertEqual(VersificationHandler.body, other.get_url(self.url))
+        self.assertEqual(1, other.hits)
+
+    def test_offline_and_stale(self):
+        cache = UrlCache(self.cache_dir, ttl=0, offline=False)
+        cache.get_url(self.url)
+
+        # the server is gone, the expired copy is still returned
+        self.stop_server()
+        self.assertEqual(VersificationHandler.body, cache.get_url(self.url))
+        self.assertEqual(1, cache.stale)
+
+        offline = UrlCache(self.cache_dir, ttl=0, offline=True)
+        self.assertEqual(VersificationHandler.body, offline.get_url(self.url))
+        self.assertRaises(IOError, offline.get_url, self.url + '?not-cached')
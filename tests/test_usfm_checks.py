@@ -2,7 +2,7 @@ from __future__ import print_function, unicode_literals
 import codecs
 import os
 from unittest import TestCase
-from app_code.bible.content import Book
+from app_code.bible.content import Book, Chapter
 
 
 class TestUSFMChecks(TestCase):
@@ -52,3 +52,41 @@ class TestUSFMChecks(TestCase):
 
         # should detect a merge conflict
         self.assertIn('There is 1 Git conflict in PHP', problems)
+
+    def test_verse_coverage(self):
+
+        book = Book('PHP', 'Philippians', 51)
+        book.add_chapter(Chapter(1, 6))
+        book.add_chapter(Chapter(2, 4))
+        book.set_usfm('\\id PHP\n\\c 1\n\\p\n\\v 1-3 a\n\\v 3 b\n\\v 6 c\n\\v 9 d\n\\v 9 e\n\\c 2\n\\p\n\\v 1 a\n')
+
+        book.verify_chapters_and_verses()
+        problems = book.validation_errors
+
+        self.assertIn('Duplicate verse, PHP 1:3', problems)
+        self.assertIn('Duplicate verse, PHP 1:9', problems)
+        self.assertIn('Invalid verse number, PHP 1:9', problems)
+
+        # the coverage is kept for each chapter
+        self.assertEqual([4, 5], book.chapters[0].missing_verses)
+        self.assertEqual([3, 9], book.chapters[0].get_duplicate_verses())
+        self.assertEqual(4, book.chapters[0].count_found_verses())
+        self.assertEqual([2, 3, 4], book.chapters[1].missing_verses)
+        self.assertEqual((5, 10), book.get_verse_coverage())
+
+    def test_huge_verse_number(self):
+
+        book = Book('PHP', 'Philippians', 51)
+        book.add_chapter(Chapter(1, 3))
+        book.set_usfm('\\id PHP\n\\c 1\n\\p\n\\v 1 a\n\\v 2 b\n\\v 3 c\n\\v 3000000000 d\n\\v 3000000000 e\n')
+
+        book.verify_chapters_and_verses()
+        problems = book.validation_errors
+
+        self.assertIn('Invalid verse number, PHP 1:3000000000', problems)
+        self.assertIn('Duplicate verse, PHP 1:3000000000', problems)
+
+        # the coverage is only kept for the expected verses
+        self.assertEqual(4, len(book.chapters[0].verse_coverage))
+        self.assertEqual([3000000000], book.chapters[0].get_duplicate_verses())
+        self.assertEqual([], book.chapters[0].missing_verses)
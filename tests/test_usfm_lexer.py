@@ -0,0 +1,229 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import os
+import re
+from unittest import TestCase
+from app_code.bible import bible_classes
+from app_code.bible.content import Book, Chapter
+from app_code.bible.usfm_lexer import UsfmLexer, CHAPTER, VERSE, MARKER, CONFLICT_START
+
+
+class RegexBook(Book):
+    """
+    The checks as they were before the lexer, one regular expression scan of the text for each check. The lexer
+    checks must produce exactly the same results.
+    """
+    verse_re = re.compile(r'(\\v[\u00A0 ][0-9-\u2013\u2014]*\s+)', re.UNICODE)
+    chapter_re = re.compile(r'(\\c[\u00A0 ][0-9]+\s*\n)', re.UNICODE)
+    empty_tag_re = re.compile(r'\n(.*?\\[\u00A0 ]*?\n.*?)\n', re.UNICODE)
+    git_conflict_re = re.compile(r'<<<<<<<.*?=======.*?>>>>>>>', re.UNICODE | re.DOTALL)
+
+    def verify_chapters_and_verses(self, same_line=False):
+
+        conflicts = self.git_conflict_re.findall(self.usfm)
+        if conflicts:
+            if len(conflicts) == 1:
+                self.append_error('There is 1 Git conflict in {0}'.format(self.book_id))
+            else:
+                self.append_error('There are {0} Git conflicts in {1}'.format(len(conflicts), self.book_id))
+
+        for bad_chapter in self.bad_chapter_re.finditer(self.usfm):
+            if bad_chapter.group(1).strip():
+                self.append_error('Invalid chapter marker: "{0}"'.format(bad_chapter.group(0)))
+
+        for bad_tag in self.empty_tag_re.finditer(self.usfm):
+            if bad_tag.group(1).strip():
+                self.append_error('Empty USFM marker: "{0}"'.format(bad_tag.group(1)))
+
+        for no_num in self.missing_num_re.finditer(self.usfm):
+            self.append_error('Chapter or verse tag without a number: "{0}"'.format(no_num.group(1)))
+
+        blocks = self.chapter_re.split(self.usfm)
+
+        self.header_usfm = ''
+        current_index = 0
+        while blocks[current_index][:2] != '\\c':
+            self.header_usfm += blocks[current_index].rstrip()
+            current_index += 1
+
+        while current_index < len(blocks):
+            chapter_num = int(blocks[current_index][3:].strip())
+            found_chapter = self.get_chapter(chapter_num)
+            if not found_chapter:
+                self.append_error('Invalid chapter number, ' + self.book_id + ' "' + str(chapter_num) + '"')
+            else:
+                found_chapter.found = True
+                self.check_verses(found_chapter, self.verse_re.split(blocks[current_index + 1]))
+                found_chapter.usfm = blocks[current_index] + '\n' + blocks[current_index + 1] + '\n'
+
+            current_index += 2
+
+    def verify_usfm_tags(self, same_line=False):
+
+        chapters_usfm = self.chapter_re.split(self.usfm)
+        current_chapter = '\\c 0'
+
+        for chapter_usfm in chapters_usfm:
+            if chapter_usfm[0:2] == '\\c':
+                current_chapter = chapter_usfm.strip()
+            else:
+                matches = re.findall(self.tag_re, chapter_usfm)
+                for match in matches:
+                    if not bible_classes.USFM.is_valid_tag(match):
+                        if not match.startswith(self.tag_exceptions):
+                            self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match)
+
+                matches = re.findall(self.bad_tag_re, chapter_usfm)
+                for match in matches:
+                    if not match.endswith(self.tag_exceptions):
+                        self.append_error('Invalid USFM tag in ' + current_chapter + ': ' + match)
+
+                for no_text in self.missing_verse_text_re.finditer(chapter_usfm):
+                    self.append_error('Verse tag without text in {0}: "{1}"'.format(current_chapter,
+                                                                                    no_text.group(1).strip()))
+
+    def check_verses(self, found_chapter, verse_blocks):
+
+        last_verse = 0
+        found_chapter.reset_coverage()
+
+        current_cv_index = 0
+        while current_cv_index < len(verse_blocks) and verse_blocks[current_cv_index][:2] != '\\v':
+            current_cv_index += 1
+
+        if current_cv_index >= len(verse_blocks):
+            self.append_error('All verse markers are missing for ' + self.book_id + ' ' + str(found_chapter.number))
+            return
+
+        while current_cv_index < len(verse_blocks):
+            test_num = verse_blocks[current_cv_index][3:].strip()
+            bridge_marker = None
+
+            if '\u2013' in test_num:
+                bridge_marker = '\u2013'
+                self.append_error('Invalid verse bridge (en dash used), ' + self.book_id + ' ' +
+                                  str(found_chapter.number) + ':' + test_num)
+            elif '\u2014' in test_num:
+                bridge_marker = '\u2014'
+                self.append_error('Invalid verse bridge (em dash used), ' + self.book_id + ' ' +
+                                  str(found_chapter.number) + ':' + test_num)
+            elif '-' in test_num:
+                bridge_marker = '-'
+
+            if bridge_marker:
+                nums = test_num.split(bridge_marker)
+                if len(nums) != 2 or not nums[0].strip().isdigit() or not nums[1].strip().isdigit():
+                    self.append_error('Invalid verse bridge, ' + self.book_id + ' ' +
+                                      str(found_chapter.number) + ':' + test_num)
+                else:
+                    for bridge_num in range(int(nums[0].strip()), int(nums[1].strip()) + 1):
+                        last_verse = self.check_this_verse(found_chapter, bridge_num, last_verse)
+
+            elif not test_num.isdigit():
+                self.append_error('Invalid verse number, ' + self.book_id + ' ' +
+                                  str(found_chapter.number) + ':' + test_num)
+
+            else:
+                last_verse = self.check_this_verse(found_chapter, int(test_num), last_verse)
+
+            current_cv_index += 2
+
+        if last_verse < found_chapter.expected_max_verse_number:
+            self.append_error('Verses ' + str(last_verse + 1) + ' through ' +
+                              str(found_chapter.expected_max_verse_number) + ' for ' + self.book_id + ' ' +
+                              str(found_chapter.number) + ' are missing.')
+
+
+class TestUsfmLexer(TestCase):
+
+    resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+
+    # chapter and verse counts for the books in the test resources
+    versification = {'PHP': [30, 30, 21, 23],
+                     'ROM': [32, 29, 31, 25, 21, 23, 25, 39, 33, 21, 36, 21, 14, 23, 33, 27]}
+
+    @staticmethod
+    def read_resource(file_name):
+        with codecs.open(os.path.join(TestUsfmLexer.resources_dir, file_name), 'r', 'utf-8') as in_file:
+            return in_file.read()
+
+    def make_book(self, cls, book_id, usfm):
+        book = cls(book_id, book_id, 1)
+        for chapter_num, max_verse in enumerate(self.versification[book_id], 1):
+            book.add_chapter(Chapter(chapter_num, max_verse))
+        book.set_usfm(usfm)
+        return book
+
+    def assert_same_results(self, book_id, usfm):
+        expected = self.make_book(RegexBook, book_id, usfm)
+        actual = self.make_book(Book, book_id, usfm)
+
+        for book in (expected, actual):
+            book.verify_usfm_tags()
+            book.verify_chapters_and_verses()
+
+        self.assertEqual(expected.validation_errors, actual.validation_errors)
+        self.assertEqual(expected.header_usfm, actual.header_usfm)
+        self.assertEqual([c.usfm for c in expected.chapters], [c.usfm for c in actual.chapters])
+        self.assertEqual([c.found for c in expected.chapters], [c.found for c in actual.chapters])
+
+        return actual
+
+    def test_tokens(self):
+        usfm = '\\id PHP\n\\c 1\n\\p\n\\v 1 In the beginning\\f + \\ft note\\f*\n<<<<<<< HEAD\n\\v 2-3 Text.'
+        tokens = list(UsfmLexer(usfm))
+
+        self.assertEqual(['id', 'c', 'p', 'v', 'f', 'ft', 'f*', None, 'v'], [t.marker for t in tokens])
+        self.assertEqual(CHAPTER, tokens[1].kind)
+        self.assertEqual('1', tokens[1].number)
+        self.assertEqual(VERSE, tokens[8].kind)
+        self.assertEqual('2-3', tokens[8].number)
+        self.assertEqual(MARKER, tokens[4].kind)
+        self.assertEqual(CONFLICT_START, tokens[7].kind)
+
+        # line and column numbers start at 1
+        self.assertEqual((4, 1), (tokens[3].line, tokens[3].column))
+        self.assertEqual((4, 22), (tokens[4].line, tokens[4].column))
+        self.assertEqual((6, 1), (tokens[8].line, tokens[8].column))
+
+        # the text span of a token runs to the start of the next token
+        self.assertEqual('In the beginning', usfm[tokens[3].end:tokens[3].text_end])
+        self.assertEqual(len(usfm), tokens[-1].text_end)
+
+    def test_count_conflicts(self):
+        tokens = list(UsfmLexer('<<<<<<< a\n=======\n>>>>>>> b\n<<<<<<< c\n=======\n'))
+        self.assertEqual(1, UsfmLexer.count_conflicts(tokens))
+
+    def test_resources_match_regex_checks(self):
+        self.assert_same_results('PHP', self.read_resource('checks01.usfm'))
+        self.assert_same_results('PHP', self.read_resource('chunk01.usfm'))
+        self.assert_same_results('ROM', self.read_resource('nbsp.usfm'))
+
+    def test_problems_match_regex_checks(self):
+        header = '\\id PHP\n\\h Philippians\n\\mt Philippians\n'
+        samples = [
+            # bad chapter markers and chapter or verse markers without numbers
+            '\\c 1\n\\v 1 text\n\\c 2 abc\n\\v 1 text\n\\v x text \\v\u00A0 \n\\c 3\u00A0\n\\v 2 \\c 4\n',
+            # empty markers
+            '\\c 1\n\\v 1 text \\\n\\v 2 text\n\\\n\\v 3 text \\ \n\\v 4\n\\v 5 \\\n',
+            # invalid tags and verses without text
+            '\\c 1\n\\p\n\\v 1 text \\zz text\\f + \\ft a\\f* b\\qs*\n\\v 2 \n\\v 3\u00A0\n\\v 4 \\xyz \\abc \\v 5 a\n',
+            # verse bridges, duplicates, out of order and missing verses
+            '\\c 1\n\\v 1-3 a\n\\v 3 b\n\\v 2 c\n\\v 7\u20138 d\n\\v 9\u201410 e\n\\v 11-x f\n\\v 40 g\n',
+            # git conflicts
+            '\\c 1\n<<<<<<< HEAD\n\\v 1 a\n=======\n\\v 1 b\n>>>>>>> x\n<<<<<<< HEAD\n\\v 2 a\n=======\n>>>>>>> x\n',
+            # blank lines after chapter markers, unknown chapter and a chapter with no verses
+            '\\c 1  \n\n\\q\n\\v 1 a\n\\c 2\n\\p\n\\c 9\n\\v 1 a\n',
+        ]
+
+        for sample in samples:
+            self.assert_same_results('PHP', header + sample)
+
+    def test_tokens_are_reused(self):
+        book = self.make_book(Book, 'PHP', self.read_resource('chunk01.usfm'))
+        tokens = book.get_tokens()
+        self.assertIs(tokens, book.get_tokens())
+
+        # a new text gets new tokens
+        book.clean_usfm()
+        self.assertIsNot(tokens, book.get_tokens())
@@ -0,0 +1,29 @@
+from __future__ import print_function, unicode_literals
+import re
+from unittest import TestCase
+from app_code.bible.usfm_normalizer import normalize, CRLF, NBSP, BLANK, S5
+
+
+class TestUsfmNormalizer(TestCase):
+
+    usfm = '\\id PHP\r\n\\c\u00A01\r\n\r\n\\s5\u00A0\r\n\\p\n\n\n\\v\u00A01 In\u00A0the beginning \\s5 \\v 2 text\r\n'
+
+    def test_one_pass_matches_separate_steps(self):
+        s5_re = re.compile(r'\\s5[\u00A0\s]*')
+        nbsp_re = re.compile(r'(\\[a-z0-9]+)([\u00A0])', re.UNICODE)
+        nl_re = re.compile(r'\n{2,}')
+
+        expected = nl_re.sub('\n', nbsp_re.sub(r'\1 ', s5_re.sub('', self.usfm).replace('\r\n', '\n')))
+        actual, counts = normalize(self.usfm, crlf=True, nbsp=True, collapse=True, strip_s5=True)
+
+        self.assertEqual(expected, actual)
+        self.assertEqual('\\id PHP\n\\c 1\n\\p\n\\v 1 In\u00A0the beginning \\v 2 text\n', actual)
+        self.assertEqual({CRLF: 5, NBSP: 2, BLANK: 2, S5: 2}, counts)
+
+    def test_options(self):
+        actual, counts = normalize(self.usfm, crlf=True, nbsp=True)
+        self.assertEqual('\\id PHP\n\\c 1\n\n\\s5 \n\\p\n\n\n\\v 1 In\u00A0the beginning \\s5 \\v 2 text\n', actual)
+        self.assertEqual({CRLF: 5, NBSP: 3, BLANK: 0, S5: 0}, counts)
+
+        # nothing to do
+        self.assertEqual((self.usfm, {CRLF: 0, NBSP: 0, BLANK: 0, S5: 0}), normalize(self.usfm, crlf=False, nbsp=False))
@@ -0,0 +1,63 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import io
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.bible.content import Book
+from app_code.bible.usfm_stream import UsfmStreamVerifier
+
+
+class TestUsfmStream(TestCase):
+
+    resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='usfm_stream_')
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def read_resource(self, file_name):
+        with codecs.open(os.path.join(self.resources_dir, file_name), 'r', 'utf-8') as in_file:
+            return in_file.read()
+
+    def verify_whole_book(self, book_id, book_text):
+        book = Book.create_book(book_id)  # type: Book
+        book.set_usfm(book_text, strip_s5=True)
+        book.verify_chapters_and_verses(True)
+        return book
+
+    def test_same_errors_as_whole_book(self):
+        book_text = self.read_resource('checks01.usfm')
+        expected = self.verify_whole_book('PHP', book_text)
+
+        # small pieces, so the chapters and the \s5 white space are split across pieces
+        for piece_size in (1, 7, 100, 65536):
+            verifier = UsfmStreamVerifier('ufw', piece_size=piece_size)
+            books = list(verifier.verify_pieces(verifier.read_pieces(io.StringIO(book_text, newline='\n'))))
+
+            self.assertEqual(1, len(books))
+            self.assertEqual(sorted(expected.validation_errors), sorted(books[0].validation_errors))
+            self.assertEqual(expected.header_usfm, books[0].header_usfm)
+            self.assertEqual([c.number for c in expected.chapters if c.found],
+                             [c.number for c in books[0].chapters if c.found])
+
+    def test_more_than_one_book_in_a_file(self):
+        texts = [self.read_resource(f) for f in ('checks01.usfm', 'nbsp.usfm', 'chunk01.usfm')]
+        file_name = os.path.join(self.temp_dir, 'bible.usfm')
+        with codecs.open(file_name, 'w', 'utf-8') as out_file:
+            out_file.write(''.join(texts))
+
+        books = list(UsfmStreamVerifier('ufw').verify_file(file_name))
+
+        self.assertEqual(['PHP', 'ROM', 'PHP'], [b.book_id for b in books])
+        for book, book_text in zip(books, texts):
+            expected = self.verify_whole_book(book.book_id, book_text)
+            self.assertEqual(sorted(expected.validation_errors), sorted(book.validation_errors))
+
+    def test_book_id_not_found(self):
+        verifier = UsfmStreamVerifier('ufw')
+        with self.assertRaises(Exception):
+            list(verifier.verify_pieces(['\\c 1\n', '\\v 1 text\n']))
@@ -0,0 +1,77 @@
+from __future__ import print_function, unicode_literals
+import codecs
+import copy
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.bible.content import Book
+from app_code.bible import validation_cache
+from app_code.bible.validation_cache import ValidationCache
+from app_code.bible.versification import Versification
+
+
+class TestValidationCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp(prefix='validation_cache_')
+
+        resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+        with codecs.open(os.path.join(resources_dir, 'checks01.usfm'), 'r', 'utf-8') as in_file:
+            self.book_text = in_file.read()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def get_book(self, book_text):
+        book = Book.create_book('PHP')  # type: Book
+        book.set_usfm(book_text, strip_s5=True)
+        return book
+
+    def test_unchanged_book_is_not_checked_again(self):
+        cache = ValidationCache(self.cache_dir)
+        checks = [validation_cache.TAGS, validation_cache.CHAPTERS]
+
+        checked = self.get_book(self.book_text)
+        self.assertFalse(validation_cache.verify_book(checked, 'ufw', checks, cache=cache))
+        self.assertEqual(4, len(checked.validation_errors))
+
+        # the same errors, and the chapters are still split for apply_chunks
+        cached = self.get_book(self.book_text)
+        self.assertTrue(validation_cache.verify_book(cached, 'ufw', checks, cache=cache))
+        self.assertEqual(checked.validation_errors, cached.validation_errors)
+        self.assertEqual(checked.header_usfm, cached.header_usfm)
+        self.assertEqual([(c.found, c.usfm) for c in checked.chapters], [(c.found, c.usfm) for c in cached.chapters])
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+
+        # a different text, scheme or set of checks is a different entry
+        self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text + '\n'), 'ufw', checks, cache=cache))
+        self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text), 'rsc', checks, cache=cache))
+        self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache))
+
+        # disabled, the book is checked every time
+        cache.enabled = False
+        self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text), 'ufw', checks, cache=cache))
+
+    def test_changed_versification(self):
+        cache = ValidationCache(self.cache_dir)
+        validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache)
+        self.assertTrue(validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache))
+
+        # the scheme was fetched again and its data changed, so the book is checked again
+        loaded = Versification.get('ufw')
+        changed = copy.copy(loaded)
+        changed.source_hash = 'changed'
+        Versification.loaded['ufw'] = changed
+        try:
+            self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache))
+        finally:
+            Versification.loaded['ufw'] = loaded
+
+    def test_prune(self):
+        cache = ValidationCache(self.cache_dir)
+        validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache)
+
+        self.assertEqual((0, 1), cache.prune(Book.checker_version))
+        self.assertEqual((1, 0), cache.prune(Book.checker_version + 1))
+        self.assertFalse(validation_cache.verify_book(self.get_book(self.book_text), 'ufw', cache=cache))
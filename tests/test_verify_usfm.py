@@ -0,0 +1,42 @@
+from __future__ import print_function, unicode_literals
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.bible.validation_cache import ValidationCache
+from app_code.cli import verify_usfm
+
+
+class TestVerifyUsfm(TestCase):
+
+    resources_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resources')
+
+    def setUp(self):
+        # check every book in both runs, and do not write to the real cache. The pool processes are forked, so they
+        # use this cache too.
+        self.cache_dir = tempfile.mkdtemp(prefix='verify_usfm_')
+        self.saved_cache = ValidationCache.default_cache
+        ValidationCache.default_cache = ValidationCache(self.cache_dir, enabled=False)
+
+    def tearDown(self):
+        ValidationCache.default_cache = self.saved_cache
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_jobs_give_the_same_results(self):
+        usfm_files = verify_usfm.find_usfm_files(self.resources_dir)
+        self.assertEqual(['checks01.usfm', 'chunk01.usfm', 'nbsp.usfm'], [os.path.basename(f) for f in usfm_files])
+
+        serial = list(verify_usfm.verify_files(usfm_files, 'ufw', 1))
+        parallel = list(verify_usfm.verify_files(usfm_files, 'ufw', 3))
+
+        self.assertEqual(usfm_files, [r.usfm_file for r in parallel])
+        self.assertEqual([(r.book_id, r.errors, r.fatal_error) for r in serial],
+                         [(r.book_id, r.errors, r.fatal_error) for r in parallel])
+        self.assertEqual(2, len(parallel[0].errors))
+
+        # every book was really checked, in the pool processes too
+        self.assertEqual([False] * 6, [r.cached for r in serial + parallel])
+
+        # the pool processes return what they printed, in order
+        self.assertTrue(parallel[0].output.startswith('Beginning PHP...'))
+        self.assertTrue(parallel[2].output.startswith('Beginning ROM...'))
@@ -0,0 +1,77 @@
+from __future__ import print_function, unicode_literals
+import json
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from app_code.bible.bible_classes import BibleMetaData
+from app_code.bible.versification import Versification
+
+
+class TestVersification(TestCase):
+
+    books_json = '{"PHP": ["Philippians", "51"], "JUD": ["Jude", "66"], "ROM": ["Romans", "46"], "XXA": ["None", "99"]}'
+    vrs = '# comment\nROM 1:32 2:29\r\nPHP 1:30 2:30 3:21 4:23\nJUD 1:25\n'
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp(prefix='versification_')
+
+    def tearDown(self):
+        Versification.schemes = None
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_compile_and_read(self):
+        compiled = Versification.compile('test', self.books_json, self.vrs, 'abc')
+
+        file_name = os.path.join(self.temp_dir, 'test.bin')
+        compiled.write_compiled(file_name)
+        loaded = Versification.read_compiled('test', file_name)
+
+        for vrs in (compiled, loaded):
+            self.assertEqual(['ROM', 'PHP', 'JUD', 'XXA'], [b[0] for b in vrs.books])
+            self.assertEqual(30, vrs.get_max_verse('PHP', 2))
+            self.assertEqual(23, vrs.get_max_verse('PHP', 4))
+            self.assertEqual(0, vrs.get_max_verse('PHP', 5))
+            self.assertEqual(25, vrs.get_max_verse('JUD', 1))
+            self.assertEqual(0, vrs.get_max_verse('GEN', 1))
+            self.assertFalse(vrs.has_chapters('XXA'))
+            self.assertEqual('abc', vrs.source_hash)
+
+        books = loaded.create_books()
+        self.assertEqual(['ROM', 'PHP', 'JUD'], [b.book_id for b in books])
+
+        php = books[1]
+        self.assertEqual(('Philippians', 51, '51-PHP'), (php.name, php.number, php.dir_name))
+        self.assertEqual([(1, 30), (2, 30), (3, 21), (4, 23)],
+                         [(c.number, c.expected_max_verse_number) for c in php.chapters])
+
+        # every call gets new objects
+        self.assertIsNot(php, loaded.create_book('PHP'))
+
+    def test_resolve_scheme(self):
+        # the schemes in the static file
+        self.assertEqual('rsc', Versification.resolve_scheme('ru', 'ulb-ru'))
+        self.assertEqual('ufw-odx', Versification.resolve_scheme('sr-Latn', 'ulb-sr-latn'))
+        self.assertEqual('ufw', Versification.resolve_scheme('en', 'ulb-en'))
+        self.assertEqual('ufw', Versification.resolve_scheme(''))
+
+        schemes_file = Versification.schemes_file
+        Versification.schemes_file = os.path.join(self.temp_dir, 'schemes.json')
+        try:
+            with open(Versification.schemes_file, 'wb') as out_file:
+                out_file.write(json.dumps({'default': 'ufw', 'languages': {'hi': 'ufw-odx'},
+                                           'slugs': {'UDB-hi': 'ufw'}}).encode('utf-8'))
+            Versification.schemes = None
+
+            # a slug takes precedence over the language
+            self.assertEqual('ufw-odx', Versification.resolve_scheme('hi', 'ulb-hi'))
+            self.assertEqual('ufw', Versification.resolve_scheme('hi', 'udb-hi'))
+
+            # a meta.json without a versification gets the scheme of its language
+            meta_file = os.path.join(self.temp_dir, 'meta.json')
+            with open(meta_file, 'wb') as out_file:
+                out_file.write(json.dumps({'lang': 'hi', 'slug': 'ulb-hi'}).encode('utf-8'))
+            self.assertEqual('ufw-odx', BibleMetaData(meta_file).versification)
+
+        finally:
+            Versification.schemes_file = schemes_file
@@ -0,0 +1,72 @@
+#!/usr/bin/env python2
+# -*- coding: utf8 -*-
+#
+#  Copyright (c) 2016 unfoldingWord
+#  http://creativecommons.org/licenses/MIT/
+#  See LICENSE file for details.
+#
+"""
+Measures the start-up cost of the Bible modules: the time to import them and the memory used, each in a new Python
+process. Also measures loading the paragraph data for one book and for all the books.
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+# each scenario runs in a new process, and prints the seconds it took and the max RSS in KB
+child_template = '''
+import json, resource, sys, time
+sys.path.insert(0, {root!r})
+start = time.time()
+{code}
+print(json.dumps([time.time() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]))
+'''
+
+scenarios = [
+    ('python only', 'pass'),
+    ('import bible_classes', 'import app_code.bible.bible_classes'),
+    ('paragraphs, one book', 'import app_code.bible.bible_classes\n'
+                             'app_code.bible.bible_paragraphs.get_paragraph_verses("GEN", 1)'),
+    ('paragraphs, all books', 'import app_code.bible.bible_classes\n'
+                              'app_code.bible.bible_paragraphs.read_data_file()'),
+]
+
+
+def run_scenario(code, runs):
+    """
+    :return: tuple of (median seconds, median max RSS in KB)
+    """
+    root = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+    source = child_template.format(root=str(root), code=code)
+    times = []
+    rss = []
+
+    for _ in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', source])
+        seconds, max_rss = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        times.append(seconds)
+        rss.append(max_rss)
+
+    times.sort()
+    rss.sort()
+    return times[len(times) // 2], rss[len(rss) // 2]
+
+
+def main(runs):
+    print('{0:<24}{1:>12}{2:>14}'.format('scenario', 'time (ms)', 'max RSS (KB)'))
+    for name, code in scenarios:
+        seconds, max_rss = run_scenario(code, runs)
+        print('{0:<24}{1:>12.1f}{2:>14}'.format(name, seconds * 1000, max_rss))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-n', '--runs', dest='runs', type=int, default=10, required=False,
+                        help='Number of times to run each scenario, the median is reported. Default is 10.')
+
+    args = parser.parse_args(sys.argv[1:])
+    main(args.runs)
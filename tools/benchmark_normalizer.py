@@ -0,0 +1,110 @@
+#!/usr/bin/env python2
+# -*- coding: utf8 -*-
+#
+#  Copyright (c) 2016 unfoldingWord
+#  http://creativecommons.org/licenses/MIT/
+#  See LICENSE file for details.
+#
+"""
+Compares cleaning USFM one change at a time, the way the Bible scripts used to, with the one-pass UsfmNormalizer.
+Uses the .usfm files in a directory, or a generated corpus about the size of a whole Bible if no directory is given.
+"""
+from __future__ import print_function, unicode_literals
+import argparse
+import codecs
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.realpath(__file__))))
+
+from app_code.bible.usfm_normalizer import normalize
+
+s5_re = re.compile(r'\\s5[\u00A0\s]*')
+nbsp_re = re.compile(r'(\\[a-z0-9]+)([\u00A0])', re.UNICODE)
+nl_re = re.compile(r'\n{2,}')
+
+
+def separate_steps(usfm):
+    """
+    The import: strip \\s5, then Book.set_usfm, then Book.clean_usfm
+    """
+    usfm = s5_re.sub('', usfm)
+    usfm = usfm.replace('\r\n', '\n')
+    usfm = nbsp_re.sub(r'\1 ', usfm)
+    return nl_re.sub('\n', usfm)
+
+
+def one_pass(usfm):
+    return normalize(usfm, crlf=True, nbsp=True, collapse=True, strip_s5=True)[0]
+
+
+def load_corpus(directory):
+    """
+    :return: list<unicode>
+    """
+    if directory:
+        texts = []
+        for root, dirs, files in os.walk(directory):
+            for file_name in sorted(files):
+                if file_name.endswith('.usfm'):
+                    with codecs.open(os.path.join(root, file_name), 'r', 'utf-8-sig') as in_file:
+                        texts.append(in_file.read())
+        return texts
+
+    # about 4.5 MB, the size of a whole Bible, from the test files
+    resources = os.path.join(os.path.dirname(os.path.dirname(os.path.realpath(__file__))), 'tests', 'resources')
+    sample = ''
+    for file_name in sorted(os.listdir(resources)):
+        if file_name.endswith('.usfm'):
+            with codecs.open(os.path.join(resources, file_name), 'r', 'utf-8-sig') as in_file:
+                sample += in_file.read()
+
+    book = sample * max(1, 70000 // len(sample))
+    return [book] * 66
+
+
+def run(function, texts, runs):
+    """
+    :return: float median seconds for all the texts
+    """
+    times = []
+    for _ in range(runs):
+        start = time.time()
+        for text in texts:
+            function(text)
+        times.append(time.time() - start)
+
+    times.sort()
+    return times[len(times) // 2]
+
+
+def main(directory, runs):
+    texts = load_corpus(directory)
+    corpora = [('\\n', texts), ('\\r\\n', [t.replace('\r\n', '\n').replace('\n', '\r\n') for t in texts])]
+
+    print('{0:<8}{1:>10}{2:>16}{3:>14}{4:>10}'.format('endings', 'MB', 'separate (ms)', 'one pass (ms)', 'speedup'))
+    for name, corpus in corpora:
+        for text in corpus:
+            if separate_steps(text) != one_pass(text):
+                print('The results are different', file=sys.stderr)
+                sys.exit(1)
+
+        size = sum(len(t) for t in corpus) / 1000000.0
+        separate = run(separate_steps, corpus, runs)
+        fused = run(one_pass, corpus, runs)
+        print('{0:<8}{1:>10.1f}{2:>16.1f}{3:>14.1f}{4:>9.2f}x'.format(name, size, separate * 1000, fused * 1000,
+                                                                    separate / fused))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('-d', '--directory', dest='directory', default=None, required=False,
+                        help='Directory of USFM files to use.')
+    parser.add_argument('-n', '--runs', dest='runs', type=int, default=5, required=False,
+                        help='Number of times to run each test, the median is reported. Default is 5.')
+
+    args = parser.parse_args(sys.argv[1:])
+    main(args.directory, args.runs)